@@ -0,0 +1,449 @@
+"""
+Load-test harness for the framework examples.
+
+Starts one of the example apps (Flask, Django or FastAPI) on localhost,
+drives it with concurrent HTTP requests drawn from a mix of languages,
+conversion types and number magnitudes, and reports throughput and
+p50/p95/p99 latency. Everything runs locally with the standard library
+plus the framework under test (and uvicorn for FastAPI).
+
+By default the app is served from a separate process, so the load
+generator and the server do not compete for one interpreter; --in-process
+serves it from a thread instead. WSGI apps are served by a threaded
+wsgiref server, which closes the connection after every response, so
+latencies include connecting, as for clients without keep-alive.
+
+Usage:
+    python examples/loadtest.py --app flask --concurrency 16 --requests 20000
+    python examples/loadtest.py --app all --langs en=3,ar=1 \\
+        --forms cardinal=3,ordinal=1,currency=1 --magnitudes 1-3=4,4-9=4,10-15=1
+    python examples/loadtest.py --url 'http://127.0.0.1:8000/convert/{number}?lang={lang}&to={to}'
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+# The repository root, so the examples import numwordify from a checkout
+ROOT_DIR = os.path.dirname(EXAMPLES_DIR)
+
+# Request path of each example app's conversion endpoint
+APPS = {
+    'flask': '/convert/{number}?lang={lang}&to={to}',
+    'django': '/convert/{number}/?lang={lang}&to={to}',
+    'fastapi': '/convert/{number}?lang={lang}&to={to}',
+}
+
+# Requests generated up front and reused in order, so generating them is
+# not part of the measurement
+PLAN_SIZE = 10000
+
+Request = Tuple[str, str, str, int]  # (lang, form, magnitude label, number)
+
+
+def parse_mix(spec: str) -> List[Tuple[str, int]]:
+    """
+    Parse a weighted mix such as 'en=3,ar=1' (weights default to 1).
+
+    Raises:
+        ValueError: If a weight is not a positive integer
+    """
+    mix = []
+    for item in spec.split(','):
+        name, _, weight = item.strip().partition('=')
+        if not name:
+            continue
+        weight = weight.strip() or '1'
+        if not weight.isdigit() or int(weight) < 1:
+            raise ValueError(f"Invalid weight in mix: {item!r}")
+        mix.append((name.strip(), int(weight)))
+    if not mix:
+        raise ValueError(f"Empty mix: {spec!r}")
+    return mix
+
+
+def parse_magnitudes(spec: str) -> List[Tuple[Tuple[int, int], int]]:
+    """
+    Parse digit-count ranges such as '1-3=4,4-9=1' into ((low, high), weight).
+
+    Raises:
+        ValueError: If a range is malformed
+    """
+    magnitudes = []
+    for label, weight in parse_mix(spec):
+        low, _, high = label.partition('-')
+        if not low.isdigit() or not (high or low).isdigit():
+            raise ValueError(f"Invalid magnitude range: {label!r}")
+        low, high = int(low), int(high or low)
+        if not 1 <= low <= high:
+            raise ValueError(f"Invalid magnitude range: {label!r}")
+        magnitudes.append(((low, high), weight))
+    return magnitudes
+
+
+def build_plan(langs: Sequence[Tuple[str, int]], forms: Sequence[Tuple[str, int]],
+               magnitudes: Sequence[Tuple[Tuple[int, int], int]], size: int = PLAN_SIZE,
+               seed: int = 0) -> List[Request]:
+    """Draw a reproducible sequence of requests from the mixes."""
+    rng = random.Random(seed)
+
+    def draw(mix: Sequence[Tuple[Any, int]], count: int) -> List[Any]:
+        return rng.choices([value for value, _ in mix], [weight for _, weight in mix], k=count)
+
+    plan = []
+    for lang, form, (low, high) in zip(draw(langs, size), draw(forms, size), draw(magnitudes, size)):
+        digits = rng.randint(low, high)
+        number = rng.randrange(10 ** (digits - 1) if digits > 1 else 0, 10 ** digits)
+        plan.append((lang, form, f"{low}-{high} digits", number))
+    return plan
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(-(-fraction * len(sorted_values) // 1)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def load_app(name: str) -> Tuple[str, Any]:
+    """
+    Import an example app.
+
+    Returns:
+        Tuple of ('wsgi' or 'asgi', application)
+    """
+    for directory in (ROOT_DIR, EXAMPLES_DIR):
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+    if name == 'flask':
+        from flask_example import app
+        return 'wsgi', app
+    if name == 'fastapi':
+        from fastapi_example import app
+        return 'asgi', app
+    if name == 'django':
+        return 'wsgi', _django_app()
+    raise ValueError(f"Unknown app: {name}. Supported: {sorted(APPS)}")
+
+
+def _django_app() -> Any:
+    """WSGI handler for the Django example view, configuring Django if needed."""
+    import django
+    from django.conf import settings
+    from django.urls import path
+
+    if not settings.configured:
+        settings.configure(
+            DEBUG=False,
+            ALLOWED_HOSTS=['127.0.0.1', 'localhost'],
+            ROOT_URLCONF=__name__,
+            MIDDLEWARE=[],
+            TEMPLATES=[{'BACKEND': 'django.template.backends.django.DjangoTemplates'}],
+        )
+        django.setup()
+    else:
+        settings.ROOT_URLCONF = __name__
+        settings.ALLOWED_HOSTS = list(settings.ALLOWED_HOSTS) + ['127.0.0.1', 'localhost']
+
+    from django.core.handlers.wsgi import WSGIHandler
+    from django_example import number_to_words
+    globals()['urlpatterns'] = [path('convert/<int:number>/', number_to_words)]
+    return WSGIHandler()
+
+
+class _ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def serve(name: str, host: str, port: int) -> None:
+    """Serve an example app forever (the target of the server process)."""
+    kind, app = load_app(name)
+    serve_app(kind, app, host, port)
+
+
+def serve_app(kind: str, app: Any, host: str, port: int, ready: Optional[threading.Event] = None,
+              stop: Optional[threading.Event] = None) -> None:
+    """Serve a WSGI or ASGI app until stop is set (or forever)."""
+    if kind == 'wsgi':
+        server = make_server(host, port, app, server_class=_ThreadingWSGIServer,
+                             handler_class=_QuietHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        if ready is not None:
+            ready.set()
+        (stop or threading.Event()).wait()
+        server.shutdown()
+        server.server_close()
+        return
+
+    import uvicorn
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level='warning',
+                                           access_log=False))
+    # Signal handlers can only be installed from the main thread
+    server.install_signal_handlers = lambda: None
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started and thread.is_alive():
+        time.sleep(0.01)
+    if ready is not None:
+        ready.set()
+    (stop or threading.Event()).wait()
+    server.should_exit = True
+    thread.join()
+
+
+def _wait_for_port(host: str, port: int, timeout: float, alive: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            if not alive():
+                raise RuntimeError("Server process exited before listening")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Server on {host}:{port} did not start within {timeout} s")
+            time.sleep(0.05)
+
+
+def start_server(name: str, host: str = '127.0.0.1', in_process: bool = False,
+                 timeout: float = 30.0) -> Tuple[int, Callable[[], None]]:
+    """
+    Start an example app on a free port.
+
+    Returns:
+        Tuple of (port, function stopping the server)
+    """
+    port = _free_port(host)
+    if in_process:
+        # Imported here, so import errors are raised to the caller
+        kind, app = load_app(name)
+        ready, stop = threading.Event(), threading.Event()
+        thread = threading.Thread(target=serve_app, args=(kind, app, host, port, ready, stop),
+                                  daemon=True)
+        thread.start()
+        if not ready.wait(timeout):
+            raise RuntimeError(f"{name} app did not start within {timeout} s")
+
+        def stop_thread() -> None:
+            stop.set()
+            thread.join(timeout)
+        return port, stop_thread
+
+    process = multiprocessing.Process(target=serve, args=(name, host, port), daemon=True)
+    process.start()
+    try:
+        _wait_for_port(host, port, timeout, process.is_alive)
+    except RuntimeError:
+        process.terminate()
+        raise
+
+    def stop_process() -> None:
+        process.terminate()
+        process.join(timeout)
+    return port, stop_process
+
+
+def run_load(host: str, port: int, template: str, plan: Sequence[Request], total: int,
+             concurrency: int, timeout: float = 10.0) -> Tuple[List[Tuple[int, float, bool]], float]:
+    """
+    Send total requests from concurrency threads, cycling through plan.
+
+    Returns:
+        Tuple of ((plan index, latency in seconds, succeeded) per request,
+        elapsed wall-clock seconds)
+    """
+    counter = itertools.count()
+    results: List[Tuple[int, float, bool]] = []
+
+    def worker() -> None:
+        connection = None
+        while True:
+            i = next(counter)
+            if i >= total:
+                break
+            index = i % len(plan)
+            lang, form, _, number = plan[index]
+            url = template.format(number=number, lang=lang, to=form)
+            start = time.perf_counter()
+            try:
+                if connection is None:
+                    connection = http.client.HTTPConnection(host, port, timeout=timeout)
+                connection.request('GET', url)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+                if response.will_close:
+                    connection.close()
+                    connection = None
+            except (OSError, http.client.HTTPException):
+                ok = False
+                if connection is not None:
+                    connection.close()
+                connection = None
+            results.append((index, time.perf_counter() - start, ok))
+        if connection is not None:
+            connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.perf_counter() - start
+
+
+def summarize(results: Sequence[Tuple[int, float, bool]], elapsed: float,
+              plan: Sequence[Request], breakdown: bool = False) -> Dict[str, Any]:
+    """Throughput, error count and latency percentiles (in milliseconds)."""
+    def latencies(items: Sequence[Tuple[int, float, bool]]) -> Dict[str, float]:
+        values = sorted(latency * 1000 for _, latency, _ in items)
+        return {'p50': percentile(values, 0.50), 'p95': percentile(values, 0.95),
+                'p99': percentile(values, 0.99), 'max': values[-1] if values else 0.0}
+
+    summary: Dict[str, Any] = {
+        'requests': len(results),
+        'errors': sum(1 for _, _, ok in results if not ok),
+        'seconds': elapsed,
+        'throughput': len(results) / elapsed if elapsed else 0.0,
+        'latency_ms': latencies(results),
+    }
+    if breakdown:
+        groups: Dict[str, List[Tuple[int, float, bool]]] = {}
+        for item in results:
+            lang, form, magnitude, _ = plan[item[0]]
+            groups.setdefault(f"{lang} {form} {magnitude}", []).append(item)
+        summary['breakdown'] = {key: dict(latencies(items), requests=len(items))
+                                for key, items in sorted(groups.items())}
+    return summary
+
+
+def format_report(name: str, summary: Dict[str, Any]) -> str:
+    """Human-readable report of one run."""
+    latency = summary['latency_ms']
+    lines = [
+        f"{name}: {summary['requests']} requests, {summary['errors']} errors, "
+        f"{summary['throughput']:.1f} req/s over {summary['seconds']:.2f} s",
+        f"  latency ms  p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  "
+        f"p99 {latency['p99']:.2f}  max {latency['max']:.2f}",
+    ]
+    for key, group in summary.get('breakdown', {}).items():
+        lines.append(f"  {key:<32} n={group['requests']:<6} p50 {group['p50']:.2f}  "
+                     f"p95 {group['p95']:.2f}  p99 {group['p99']:.2f}")
+    return '\n'.join(lines)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python examples/loadtest.py',
+        description='Load-test the numwordify framework examples over HTTP.',
+    )
+    parser.add_argument('--app', default='all', choices=sorted(APPS) + ['all'],
+                        help='example app to test (default: all installed)')
+    parser.add_argument('--url', help='test a running server instead; a URL template with '
+                                      '{number}, {lang} and {to}')
+    parser.add_argument('--concurrency', type=int, default=16, help='concurrent clients (default: 16)')
+    parser.add_argument('--requests', type=int, default=10000, help='measured requests (default: 10000)')
+    parser.add_argument('--warmup', type=int, default=500, help='unmeasured requests first (default: 500)')
+    parser.add_argument('--langs', default='en=1,ar=1', help="language mix (default: 'en=1,ar=1')")
+    parser.add_argument('--forms', default='cardinal=3,ordinal=1,currency=1',
+                        help="conversion type mix (default: 'cardinal=3,ordinal=1,currency=1')")
+    parser.add_argument('--magnitudes', default='1-3=4,4-6=3,7-12=2,13-18=1',
+                        help="digit-count mix (default: '1-3=4,4-6=3,7-12=2,13-18=1')")
+    parser.add_argument('--seed', type=int, default=0, help='seed for the request mix')
+    parser.add_argument('--in-process', action='store_true',
+                        help='serve the app from a thread of this process')
+    parser.add_argument('--breakdown', action='store_true',
+                        help='also report latency per language, form and magnitude')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    return parser
+
+
+# Modules an example app needs besides numwordify
+REQUIREMENTS = {'flask': ('flask',), 'django': ('django',), 'fastapi': ('fastapi', 'uvicorn')}
+
+
+def _installed(name: str) -> bool:
+    for module in REQUIREMENTS[name]:
+        try:
+            __import__(module)
+        except ImportError:
+            return False
+    return True
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    args = _parser().parse_args(argv)
+    try:
+        plan = build_plan(parse_mix(args.langs), parse_mix(args.forms),
+                          parse_magnitudes(args.magnitudes), seed=args.seed)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if args.url:
+        parts = urlsplit(args.url)
+        template = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        targets = [(args.url, parts.hostname or '127.0.0.1', parts.port or 80, template, None)]
+    else:
+        names = sorted(APPS) if args.app == 'all' else [args.app]
+        missing = [name for name in names if not _installed(name)]
+        for name in missing:
+            print(f"skipping {name}: not installed", file=sys.stderr)
+        targets = []
+        for name in names:
+            if name not in missing:
+                targets.append((name, '127.0.0.1', None, APPS[name], name))
+        if not targets:
+            print("error: no example app can be started", file=sys.stderr)
+            return 1
+
+    reports: Dict[str, Any] = {}
+    for label, host, port, template, app in targets:
+        stop = None
+        if app is not None:
+            port, stop = start_server(app, host, in_process=args.in_process)
+        try:
+            if args.warmup:
+                run_load(host, port, template, plan, args.warmup, args.concurrency)
+            results, elapsed = run_load(host, port, template, plan, args.requests, args.concurrency)
+        finally:
+            if stop is not None:
+                stop()
+        reports[label] = summarize(results, elapsed, plan, args.breakdown)
+        if not args.json:
+            print(format_report(label, reports[label]))
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    return 0 if all(report['errors'] == 0 for report in reports.values()) else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,7 +7,18 @@ __version__ = "0.1.1"
 __author__ = "Mohammad Abu Khahsabeh"
 __email__ = "abukhashabehmohammad@gmail.com"
 
-from .converter import num2words, convert
+from .converter import num2words, convert, convert_batch
+from .compiler import compile_renderer
+from .currencies import register_currency
+from .exceptions import InputLimitError
+from .nouns import count_noun
+from .overlays import LanguageOverlay
+from .ranges import iter_range
+from .startup import warmup
+from .streaming import stream_words
+from .text import normalize_text
 
-__all__ = ["num2words", "convert"]
+__all__ = ["num2words", "convert", "convert_batch", "compile_renderer", "count_noun",
+           "InputLimitError", "iter_range", "LanguageOverlay", "normalize_text", "register_currency",
+           "stream_words", "warmup"]
 
@@ -0,0 +1,299 @@
+"""
+In-process result cache for conversions.
+
+A cache can be saved to a snapshot file and loaded by the next process,
+so workers start warm after a deploy:
+
+    cache.save('numwordify-cache.json.gz')
+    cache.load('numwordify-cache.json.gz')  # 0 if made by another version or data
+
+Snapshots are gzip-compressed JSON with the results grouped by language,
+conversion type, options and number type, so every group is stored as a
+list of numbers and a list of words.
+"""
+
+import gc
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from decimal import Decimal
+from itertools import repeat
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from . import __version__
+from .config.settings import Settings
+from .converter import NumberConverter, convert_batch, num2words
+from .languages.base import BaseConverter
+
+CacheKey = Tuple[Hashable, ...]
+
+SNAPSHOT_FORMAT = 1
+# Number types a snapshot can hold, by the name stored in the file
+_SNAPSHOT_TYPES = {cls.__name__: cls for cls in (int, float, bool, str, Decimal)}
+_OPTION_TYPES = (str, int, float, bool, type(None))
+
+
+def data_fingerprint() -> str:
+    """
+    Hash of everything a cached result depends on besides its key.
+
+    Covers the loaded language data, registered currencies and the
+    settings read by conversions.
+    """
+    NumberConverter._initialize_converters()
+    converters = {id(converter): converter for converter in NumberConverter._converters.values()}
+    data = sorted(json.dumps(converter.config, sort_keys=True, default=str)
+                  for converter in converters.values())
+    data.append(json.dumps(BaseConverter._registered_currencies, sort_keys=True, default=str))
+    data.append(json.dumps([Settings.MAX_DECIMAL_DIGITS, Settings.MAX_DECIMAL_AS_NUMBER,
+                            Settings.INFINITY_WORDS, Settings.NaN_WORDS], sort_keys=True))
+    return hashlib.sha256('\n'.join(data).encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of conversion results.
+
+    Results are keyed on the number (and its type), language, conversion
+    type and keyword options, so a hit returns exactly what num2words would.
+    The cache empties itself when NumberConverter.reload() publishes new
+    language data.
+
+    Example:
+        >>> cache = ResultCache(maxsize=10000)
+        >>> cache.convert(42, lang='ar')
+        'إثنان و أربعون'
+    """
+
+    def __init__(self, maxsize: int = 100000):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of results kept; least recently used
+                results are evicted first
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._data_version = NumberConverter.data_version
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(number: Union[int, float], lang: str = 'en', to: str = 'cardinal',
+                 **kwargs) -> CacheKey:
+        """Build the cache key for a conversion."""
+        return (type(number), number, lang.lower(), to.lower(), tuple(sorted(kwargs.items())))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _check_version(self) -> int:
+        """Drop results computed from older language data; return the current version."""
+        version = NumberConverter.data_version
+        if version != self._data_version:
+            with self._lock:
+                if version != self._data_version:
+                    self._data.clear()
+                    self._data_version = version
+        return version
+
+    def _store(self, key: CacheKey, words: str, version: int) -> None:
+        # Caller must hold the lock. Results computed while a reload was
+        # published may come from either data version, so they are dropped.
+        if version != self._data_version or version != NumberConverter.data_version:
+            return
+        self._data[key] = words
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def convert(self, number: Union[int, float], lang: str = 'en',
+                to: str = 'cardinal', **kwargs) -> str:
+        """Convert a number to words, returning a cached result when possible."""
+        if number != number:  # NaN never compares equal, so it is never cached
+            return num2words(number, lang=lang, to=to, **kwargs)
+        key = self.make_key(number, lang, to, **kwargs)
+        version = self._check_version()
+        with self._lock:
+            words = self._data.get(key)
+            if words is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return words
+            self.misses += 1
+        words = num2words(number, lang=lang, to=to, **kwargs)
+        with self._lock:
+            self._store(key, words, version)
+        return words
+
+    def convert_batch(self, numbers: Iterable[Union[int, float]], lang: str = 'en',
+                      to: str = 'cardinal', **kwargs) -> List[str]:
+        """
+        Convert many numbers, converting all cache misses in one batch call.
+
+        Returns:
+            List of results in input order
+        """
+        numbers = list(numbers)
+        keys = [self.make_key(number, lang, to, **kwargs) for number in numbers]
+        results: List[Any] = [None] * len(numbers)
+        missing: List[int] = []
+        version = self._check_version()
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                words = self._data.get(key)
+                if words is None:
+                    missing.append(i)
+                else:
+                    self._data.move_to_end(key)
+                    results[i] = words
+            self.hits += len(numbers) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            converted = convert_batch([numbers[i] for i in missing], lang=lang, to=to, **kwargs)
+            with self._lock:
+                for i, words in zip(missing, converted):
+                    results[i] = words
+                    if numbers[i] == numbers[i]:
+                        self._store(keys[i], words, version)
+
+        return results
+
+    def save(self, path: Union[str, os.PathLike]) -> int:
+        """
+        Write the cached results to a snapshot file.
+
+        The file is replaced atomically. Results whose number or options
+        cannot be stored (overlays, custom number types) are left out.
+
+        Returns:
+            Number of results written
+        """
+        self._check_version()
+        with self._lock:
+            items = list(self._data.items())
+        groups: Dict[Tuple[Any, ...], Tuple[List[Any], List[str]]] = {}
+        for (number_type, number, lang, to, options), words in items:
+            if number_type.__name__ not in _SNAPSHOT_TYPES or not all(
+                    isinstance(value, _OPTION_TYPES) for _, value in options):
+                continue
+            numbers, results = groups.setdefault((number_type.__name__, lang, to, options), ([], []))
+            numbers.append(str(number) if number_type is Decimal else number)
+            results.append(words)
+        snapshot = {
+            'format': SNAPSHOT_FORMAT,
+            'version': __version__,
+            'data_hash': data_fingerprint(),
+            'groups': [{'type': type_name, 'lang': lang, 'to': to, 'options': options,
+                        'numbers': numbers, 'words': results}
+                       for (type_name, lang, to, options), (numbers, results) in groups.items()],
+        }
+        body = gzip.compress(json.dumps(snapshot, ensure_ascii=False, separators=(',', ':'))
+                             .encode('utf-8'), compresslevel=1)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.numwordify-cache-')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(body)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return sum(len(numbers) for numbers, _ in groups.values())
+
+    def load(self, path: Union[str, os.PathLike]) -> int:
+        """
+        Add the results of a snapshot file to the cache.
+
+        A snapshot saved by another numwordify version or against other
+        language data is ignored. Results already cached count as more
+        recent than loaded ones, and the oldest are evicted past maxsize.
+
+        Returns:
+            Number of results the snapshot added that are still cached (0
+            for an ignored snapshot)
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid snapshot
+        """
+        with open(path, 'rb') as file:
+            body = file.read()
+        version = self._check_version()
+        # Millions of new key tuples would otherwise set off repeated full
+        # garbage collections, which cost more than the parsing itself
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            entries = self._read_snapshot(body, path)
+            if entries is None:
+                return 0
+            del entries[:-self.maxsize]
+            loaded = OrderedDict(entries)
+        finally:
+            if collecting:
+                gc.enable()
+
+        with self._lock:
+            if version != self._data_version or version != NumberConverter.data_version:
+                return 0
+            cached = len(self._data)
+            for key, words in self._data.items():
+                loaded[key] = words
+                loaded.move_to_end(key)
+            while len(loaded) > self.maxsize:
+                loaded.popitem(last=False)
+            self._data = loaded
+        # Cached results are the most recent, so none of them was evicted
+        return len(loaded) - cached
+
+    @staticmethod
+    def _read_snapshot(body: bytes, path: Any) -> Optional[List[Tuple[CacheKey, str]]]:
+        """Parse a snapshot into (key, words) pairs; None if it does not apply."""
+        try:
+            snapshot = json.loads(gzip.decompress(body).decode('utf-8'))
+            header = (snapshot['format'], snapshot['version'], snapshot['data_hash'])
+            if header != (SNAPSHOT_FORMAT, __version__, data_fingerprint()):
+                return None
+            entries: List[Tuple[CacheKey, str]] = []
+            for group in snapshot['groups']:
+                number_type = _SNAPSHOT_TYPES[group['type']]
+                numbers = group['numbers']
+                if number_type is Decimal:
+                    numbers = map(Decimal, numbers)
+                options = tuple((key, value) for key, value in group['options'])
+                keys = zip(repeat(number_type), numbers, repeat(group['lang']),
+                           repeat(group['to']), repeat(options))
+                entries.extend(zip(keys, group['words']))
+        except (gzip.BadGzipFile, EOFError, zlib.error, UnicodeDecodeError,
+                KeyError, TypeError, ValueError, ArithmeticError) as e:
+            raise ValueError(f"Invalid cache snapshot {path}: {e}") from e
+        return entries
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
@@ -0,0 +1,121 @@
+"""
+Asyncio request coalescing for conversions.
+
+Many concurrent callers each converting one number pay the per-call
+validation and dispatch in NumberConverter.convert every time. The
+coalescer collects calls that arrive within a short window, groups them
+by (language, form, options), and converts each group with one batch
+call; every awaiting caller then gets its own result.
+"""
+
+import asyncio
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from .converter import convert_batch, num2words
+
+GroupKey = Tuple[str, str, Tuple[Tuple[str, Hashable], ...]]
+
+
+class ConversionCoalescer:
+    """
+    Micro-batch concurrent single conversions.
+
+    A group is flushed when it reaches ``max_batch_size`` calls or when
+    ``max_delay`` seconds have passed since its first call, whichever comes
+    first, so no caller waits longer than ``max_delay`` plus one batch.
+
+    Example:
+        >>> coalescer = ConversionCoalescer(max_delay=0.002)
+        >>> async def handler(n):
+        ...     return await coalescer.convert(n, lang='ar', to='ordinal')
+    """
+
+    def __init__(self, max_batch_size: int = 256, max_delay: float = 0.001):
+        """
+        Initialize the coalescer.
+
+        Args:
+            max_batch_size: Flush a group as soon as it holds this many calls
+            max_delay: Longest time in seconds a call waits for others to join
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        if max_delay < 0:
+            raise ValueError(f"max_delay must not be negative, got {max_delay}")
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: Dict[GroupKey, List[Tuple[Union[int, float], asyncio.Future]]] = {}
+        self._timers: Dict[GroupKey, asyncio.TimerHandle] = {}
+        self.batches = 0
+        self.conversions = 0
+
+    async def convert(self, number: Union[int, float], lang: str = 'en',
+                      to: str = 'cardinal', **kwargs) -> str:
+        """
+        Convert a number to words as part of the next batch for its options.
+
+        Returns and raises exactly what num2words would for the same call.
+        """
+        loop = asyncio.get_running_loop()
+        key: GroupKey = (lang, to, tuple(sorted(kwargs.items())))
+        future = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((number, future))
+
+        if len(group) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_delay, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: GroupKey) -> None:
+        """Convert one pending group and resolve its futures."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._pending.pop(key, None)
+        if not group:
+            return
+
+        lang, to, options = key
+        kwargs = dict(options)
+        numbers = [number for number, _ in group]
+        self.batches += 1
+        self.conversions += len(group)
+
+        try:
+            results: List[Any] = convert_batch(numbers, lang=lang, to=to, **kwargs)
+            errors: List[Optional[BaseException]] = [None] * len(group)
+        except Exception:
+            # One bad input must not fail its neighbours: redo the group one by one
+            results, errors = [], []
+            for number in numbers:
+                try:
+                    results.append(num2words(number, lang=lang, to=to, **kwargs))
+                    errors.append(None)
+                except Exception as e:
+                    results.append(None)
+                    errors.append(e)
+
+        for (_, future), result, error in zip(group, results, errors):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def flush(self) -> None:
+        """Convert every pending group immediately."""
+        for key in list(self._pending):
+            self._flush(key)
+
+    def stats(self) -> Dict[str, float]:
+        """Return batch counters and the average batch size."""
+        return {
+            'batches': self.batches,
+            'conversions': self.conversions,
+            'average_batch_size': self.conversions / self.batches if self.batches else 0.0,
+            'pending': sum(len(group) for group in self._pending.values()),
+        }
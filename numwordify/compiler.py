@@ -0,0 +1,411 @@
+"""
+Code-generated render functions specialized to one set of options.
+
+The converters read their separators and tables from attributes and
+branch on form, gender and currency on every call. compile_renderer
+instead generates the source of a function for one language, form and
+set of options: separators, scale words and currency names are folded
+into string literals, the tables are bound as default arguments, and the
+branches for the other forms are never emitted. The source is exec'd
+once and the function is cached until the language data changes; the
+MAX_RENDERERS most recently used option sets are kept, so a service
+compiling per tenant overlay does not accumulate generated code.
+
+Integers (the common case) take the generated path. Floats, Decimals,
+infinity and NaN, integers too large for a float, and invalid input go
+through the converter the function was compiled from, so every input
+gives exactly what num2words gives.
+
+Examples:
+    >>> render = compile_renderer('en', to='ordinal')
+    >>> render(21)
+    'twenty-first'
+    >>> print(generate_source('ar', to='currency', currency='SAR'))  # doctest: +SKIP
+"""
+
+import itertools
+import linecache
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+from .config.settings import Settings
+from .converter import NUMBER_TYPES, NumberConverter, _is_special
+from .limits import check_limits, limits_active
+from .languages.base import GroupingPlan
+from .languages.english import EnglishConverter
+
+# Integers beyond this bound go through the generic path, which raises the
+# same OverflowError as num2words for values too large for a float
+_FAST_LIMIT = 1e308
+
+MAX_RENDERERS = 256
+
+# Key -> (render function, linecache filename of its source), least recently used first
+_renderers: "OrderedDict[Tuple[Any, ...], Tuple[Callable[[Any], str], str]]" = OrderedDict()
+_renderers_version = 0
+_renderer_ids = itertools.count()
+_lock = threading.Lock()
+
+
+class _Source:
+    """Source lines plus the objects the generated code refers to by name."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {}
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append('    ' * indent + line)
+
+    def bind(self, name: str, value: Any) -> str:
+        self.namespace[name] = value
+        return name
+
+    def text(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+def _fallback(converter: Any, lang: str, to: str, options: Dict[str, Any]) -> Callable[[Any], str]:
+    """The generic conversion, with the checks num2words makes first."""
+    def convert(number: Any) -> str:
+        if not isinstance(number, NUMBER_TYPES):
+            if isinstance(number, str) and to == 'digits':
+                return converter.convert(number, to=to, **options)
+            raise TypeError(f"Number must be int or float, got {type(number).__name__}")
+        if _is_special(number):
+            return NumberConverter._special_words(number, lang, options.get('style'))
+        if limits_active():
+            check_limits(number, converter, to)
+        return converter.convert(number, to=to, **options)
+    return convert
+
+
+def _chunk_loop(src: _Source, plan: GroupingPlan, append: Callable[[int, Any], None],
+                tracks_top: bool, low_words: str = '_card') -> None:
+    """
+    Emit the chunk split of ``n`` (at least 1000) into the list ``parts``.
+
+    The units chunk is kept in ``low`` and read from the table named
+    low_words; higher groups of fixed size are
+    unrolled with their scale index known, the repeating group becomes a
+    loop over ``scale``. append(indent, scale) emits the lines adding a
+    non-zero ``chunk`` at a literal scale, or at ``scale`` when None.
+    """
+    static = list(plan._divisors) or [plan._repeat]
+    src.emit(1, f"n, low = divmod(n, {static[0]})")
+    src.emit(1, f"parts = [{low_words}[low]] if low else []")
+    for scale_index, divisor in enumerate(static[1:], 1):
+        src.emit(1, f"n, chunk = divmod(n, {divisor})")
+        src.emit(1, "if chunk:")
+        append(2, scale_index)
+        if tracks_top:
+            src.emit(2, "top = chunk")
+    if plan.nested:
+        src.emit(1, "if n:")
+        src.emit(2, "chunk = n")
+        append(2, len(static))
+        if tracks_top:
+            src.emit(2, "top = chunk")
+    else:
+        src.emit(1, f"scale = {len(static)}")
+        src.emit(1, "while n:")
+        src.emit(2, f"n, chunk = divmod(n, {plan._repeat})")
+        src.emit(2, "if chunk:")
+        append(3, None)
+        if tracks_top:
+            src.emit(3, "top = chunk")
+        src.emit(2, "scale += 1")
+
+
+def _english_words(src: _Source, converter: EnglishConverter, plan: GroupingPlan,
+                   ordinal: bool) -> None:
+    """Emit ``_cardinal(n)`` (or ``_ordinal(n)``) for n of at least 1000."""
+    suffixes = converter._scale_suffixes[plan.name][0]
+    sizes = plan._sizes
+    # plan.exponent(scale) for every scale the loop reaches, as a linear form
+    step, offset = sizes[-1], sum(sizes) - len(sizes) * sizes[-1]
+
+    def append(indent: int, scale_index: Any) -> None:
+        if scale_index is None:
+            src.emit(indent, f"parts.append(_card[chunk] + (_sfx[scale] if scale < {len(suffixes)} "
+                             f"else ' (10^%d)' % (scale * {step} + {offset})))")
+            return
+        words = "_card[chunk]" if not plan.nested or scale_index < len(plan._divisors) \
+            else "(_card[chunk] if chunk < 1000 else _cardinal(chunk))"
+        src.emit(indent, f"parts.append({words} + {converter._scale_suffix(scale_index, plan=plan)!r})")
+
+    name = '_ordinal' if ordinal else '_cardinal'
+    defaults = "_card=_card, _last=_last, _sfx=_sfx"
+    if ordinal:
+        defaults += ", _last_ord=_last_ord"
+    src.emit(0, f"def {name}(n, {defaults}):")
+    # The units chunk of a large number may take the style's conjunction
+    _chunk_loop(src, plan, append, tracks_top=ordinal, low_words='_last')
+    if ordinal:
+        # Ordinal form on the units chunk only when it repeats the most
+        # significant chunk (see EnglishConverter._to_ordinal)
+        src.emit(1, "if low and low == top:")
+        src.emit(2, "parts[0] = _last_ord[low]")
+    src.emit(1, "parts.reverse()")
+    src.emit(1, "return ' '.join(parts)")
+    src.emit(0, "")
+
+
+def _arabic_words(src: _Source, converter: Any) -> None:
+    """Emit ``_cardinal(n)`` for n of at least 1000."""
+    plan = converter._plan
+    forms = [tuple(converter._get_scale_word(count, scale_index) for count in (1, 2, 3))
+             for scale_index in range(len(converter.scales))]
+    src.bind('_scales', forms)
+
+    def phrase(indent: int, one: str, two: str, many: str) -> None:
+        # One and two are said by the scale word alone; 11-99 (mod 100)
+        # take the singular and everything else the plural
+        src.emit(indent, f"parts.append((_card[chunk] + (' ' + {one} if chunk % 100 > 10 else ' ' + {many})) "
+                         f"if chunk > 2 else ({one} if chunk == 1 else {two}))")
+
+    def append(indent: int, scale_index: Any) -> None:
+        if scale_index is None:
+            src.emit(indent, f"if scale < {len(forms)}:")
+            src.emit(indent + 1, "one, two, many = _scales[scale]")
+            src.emit(indent, "else:")
+            src.emit(indent + 1, "one = two = many = '(10^%d)' % (scale * 3)")
+            phrase(indent, 'one', 'two', 'many')
+            return
+        one, two, many = (repr(converter._get_scale_word(count, scale_index)) for count in (1, 2, 3))
+        phrase(indent, one, two, many)
+
+    src.emit(0, "def _cardinal(n, _card=_card, _scales=_scales):")
+    _chunk_loop(src, plan, append, tracks_top=False)
+    src.emit(1, "parts.reverse()")
+    src.emit(1, f"return {converter._chunk_separator!r}.join(parts)")
+    src.emit(0, "")
+
+
+def _emit_guard(src: _Source) -> None:
+    # Input limits, when configured, are checked on the generic path
+    src.emit(1, f"if (number.__class__ is not int or not -{_FAST_LIMIT} < number < {_FAST_LIMIT}")
+    src.emit(3, "or _settings.MAX_DIGITS is not None or _settings.MAX_OUTPUT_LENGTH is not None")
+    src.emit(3, "or _settings.MAX_COST is not None):")
+    src.emit(2, "return _fallback(number)")
+
+
+def _emit_sign(src: _Source, converter: Any, expression: str) -> None:
+    """Emit the return of ``expression`` for ``number`` with its sign applied."""
+    src.emit(1, "if number < 0:")
+    src.emit(2, "number = -number")
+    src.emit(2, f"return {converter.negative_prefix + ' '!r} + ({expression})")
+    src.emit(1, f"return {expression}")
+
+
+def _emit_numeric(src: _Source, converter: Any, ordinal: bool) -> None:
+    """Emit ``render`` for the cardinal and ordinal forms."""
+    english = isinstance(converter, EnglishConverter)
+    if ordinal and english:
+        small, words = '_ord', "_ordinal(number)"
+    elif ordinal:
+        small, words = '_ord', f"{converter.ordinal_prefix!r} + _cardinal(number)"
+    else:
+        small, words = '_card', "_cardinal(number)"
+    src.emit(0, f"def render(number, {small}={small}, _fallback=_fallback, _settings=_settings):")
+    _emit_guard(src)
+    _emit_sign(src, converter, f"{small}[number] if number < 1000 else {words}")
+
+
+def _emit_currency(src: _Source, converter: Any, info: Dict[str, Any], minor_units: bool,
+                   sub_words: Callable[[int], str]) -> None:
+    """Emit ``render`` for one currency; sub_words reads subunit counts of 1000 and up."""
+    english = isinstance(converter, EnglishConverter)
+    card = src.namespace['_card']
+    factor = info['subunit_factor']
+    forms, subunit_forms = info['forms'], info['subunit_forms']
+    joiner = converter.amount_separator if english else f" {converter.conjunction} "
+
+    large_subunits = minor_units and factor > 1000
+    if large_subunits:
+        src.bind('_sub_words', sub_words)
+    src.emit(0, "def render(number, _card=_card, _fallback=_fallback, _settings=_settings"
+                f"{', _sub_words=_sub_words' if large_subunits else ''}):")
+    _emit_guard(src)
+    src.emit(1, "negative = number < 0")
+    src.emit(1, "if negative:")
+    src.emit(2, "number = -number")
+    if minor_units:
+        src.emit(1, f"main, sub = divmod(number, {factor})")
+    else:
+        # A whole amount has no subunits
+        src.emit(1, "main = number")
+    src.emit(1, "if main == 0:")
+    if minor_units:
+        src.emit(2, "if not sub:")
+        src.emit(3, f"return {converter.zero + ' ' + info['name']!r}")
+        zero_name = converter._currency_name(info, 0)
+        src.emit(2, f"words = {converter.zero + ' ' + zero_name!r}")
+    else:
+        src.emit(2, f"return {converter.zero + ' ' + info['name']!r}")
+
+    main_words = "(_card[main] if main < 1000 else _cardinal(main))"
+    if english:
+        src.emit(1, "elif main == 1:")
+        src.emit(2, f"words = {card[1] + ' ' + forms[0]!r}")
+        src.emit(1, "else:")
+        src.emit(2, f"words = {main_words} + {' ' + forms[1]!r}")
+    else:
+        src.emit(1, "elif main == 1:")
+        src.emit(2, f"words = {forms[0] + ' ' + card[1]!r}")
+        src.emit(1, "elif main == 2:")
+        src.emit(2, f"words = {card[2] + ' ' + forms[1]!r}")
+        src.emit(1, "elif main <= 10:")
+        src.emit(2, f"words = _card[main] + {' ' + forms[2]!r}")
+        src.emit(1, "else:")
+        src.emit(2, f"words = {main_words} + {' ' + forms[3]!r}")
+
+    if minor_units:
+        subunit = "(_card[sub] if sub < 1000 else _sub_words(sub))" if large_subunits else "_card[sub]"
+        src.emit(1, "if sub:")
+        src.emit(2, f"words += {joiner!r} + {subunit} + "
+                    f"({' ' + subunit_forms[0]!r} if sub == 1 else {' ' + subunit_forms[1]!r})")
+    src.emit(1, f"return {converter.negative_prefix + ' '!r} + words if negative else words")
+
+
+def _emit_digits(src: _Source, converter: Any, table: Dict[int, str], group_size: Any) -> None:
+    """Emit ``render`` for digit-by-digit reading."""
+    src.bind('_digits', table)
+    src.emit(0, "def render(number, _digits=_digits, _fallback=_fallback, _settings=_settings):")
+    if group_size is not None:
+        # Regrouping is left to the converter
+        src.emit(1, "return _fallback(number)")
+        return
+    _emit_guard(src)
+    _emit_sign(src, converter, "str(number).translate(_digits)[:-1]")
+
+
+def generate(lang: str = 'en', to: str = 'cardinal', **kwargs) -> Tuple[str, Dict[str, Any]]:
+    """
+    Generate the source of a specialized render function.
+
+    Returns:
+        Tuple of (source, namespace to exec it in)
+
+    Raises:
+        ValueError: If the language, conversion type or an option is invalid
+    """
+    NumberConverter._initialize_converters()
+    converter, to, options = NumberConverter._resolve(lang, to, dict(kwargs))
+    # Converting zero validates the remaining options exactly like num2words
+    converter.convert(0, to=to, **options)
+
+    english = isinstance(converter, EnglishConverter)
+    gender = 'm' if english else converter._settings.validate_gender(options.get('gender', 'm'))
+    src = _Source()
+    src.bind('_fallback', _fallback(converter, lang, to, options))
+    src.bind('_settings', Settings)
+    title = ', '.join(f"{key}={value!r}" for key, value in sorted(options.items()))
+    src.emit(0, f"# {converter.config.get('language', lang)} {to}{': ' + title if title else ''}")
+    src.emit(0, "")
+
+    if to == 'digits':
+        table = converter._digit_table if english else converter._digit_tables[gender]
+        _emit_digits(src, converter, table, options.get('group_size'))
+        return src.text(), src.namespace
+
+    if english:
+        src.bind('_card', converter._cardinal_words)
+        src.bind('_ord', converter._ordinal_words)
+        src.bind('_last', converter._final_cardinal_words)
+        src.bind('_last_ord', converter._final_ordinal_words)
+        plan = converter._grouping_plan(options.get('grouping'))
+        src.bind('_sfx', converter._scale_suffixes[plan.name][0])
+        _english_words(src, converter, plan, ordinal=False)
+        if to == 'ordinal':
+            _english_words(src, converter, plan, ordinal=True)
+    else:
+        card = converter._cardinal_words[gender]
+        src.bind('_card', card)
+        src.bind('_ord', [converter.zero] + [converter.ordinal_prefix + words for words in card[1:]])
+        _arabic_words(src, converter)
+
+    if to == 'currency':
+        info = converter.currencies[options['currency']]
+        # Subunits are read with the default grouping
+        sub_words = converter._to_cardinal if english else partial(converter._to_cardinal, gender=gender)
+        _emit_currency(src, converter, info, bool(options.get('minor_units', False)), sub_words)
+    else:
+        _emit_numeric(src, converter, to == 'ordinal')
+    return src.text(), src.namespace
+
+
+def generate_source(lang: str = 'en', to: str = 'cardinal', **kwargs) -> str:
+    """
+    Source of the render function compile_renderer would build.
+
+    Useful for inspecting what a set of options compiles to.
+    """
+    return generate(lang, to, **kwargs)[0]
+
+
+def compile_renderer(lang: str = 'en', to: str = 'cardinal', **kwargs) -> Callable[[Any], str]:
+    """
+    Get a render function specialized to a language, form and options.
+
+    ``compile_renderer(lang, to, **kwargs)(number)`` returns exactly what
+    ``num2words(number, lang, to, **kwargs)`` returns. Functions are
+    generated on first use and cached; the cache is dropped when the
+    language data is reloaded. A function obtained before a reload keeps
+    rendering with the data it was compiled from.
+
+    Args:
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        to: Conversion type ('cardinal', 'ordinal', 'currency', 'digits')
+        **kwargs: The options num2words accepts (currency, gender, grouping, ...)
+
+    Returns:
+        Function of one number returning its words
+
+    Raises:
+        ValueError: If the language, conversion type or an option is invalid
+
+    Examples:
+        >>> render = compile_renderer('ar', gender='f')
+        >>> render(2)
+        'اثنتان'
+    """
+    global _renderers_version
+    NumberConverter._initialize_converters()
+    key = (lang.lower() if isinstance(lang, str) else lang,
+           to.lower() if isinstance(to, str) else to,
+           tuple(sorted(kwargs.items())))
+    version = NumberConverter.data_version
+    with _lock:
+        if _renderers_version == version:
+            entry = _renderers.get(key)
+            if entry is not None:
+                _renderers.move_to_end(key)
+                return entry[0]
+
+    source, namespace = generate(lang, to, **kwargs)
+    filename = f"<numwordify.compiler {key[0]} {key[1]} #{next(_renderer_ids)}>"
+    # Register the source so tracebacks through generated code show it
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, 'exec'), namespace)
+    render = namespace['render']
+
+    with _lock:
+        if _renderers_version != version:
+            _forget_renderers(len(_renderers))
+            _renderers_version = version
+        replaced = _renderers.pop(key, None)
+        if replaced is not None:
+            linecache.cache.pop(replaced[1], None)
+        _renderers[key] = (render, filename)
+        _forget_renderers(len(_renderers) - MAX_RENDERERS)
+    return render
+
+
+def _forget_renderers(count: int) -> None:
+    """Drop the least recently used renderers and their source; caller holds the lock."""
+    for _ in range(count):
+        _, (_, filename) = _renderers.popitem(last=False)
+        linecache.cache.pop(filename, None)
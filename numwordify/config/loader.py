@@ -4,14 +4,24 @@ Uses JSON files (built-in, no dependencies).
 
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from .settings import Settings
 
 
 class ConfigLoader:
-    """Loads and caches language configuration files."""
+    """Loads and caches language configuration files.
+    
+    Each cached configuration records the modification time of the file it
+    was read from and a version number that increases on every (re)load.
+    """
     
     _cache: Dict[str, Dict[str, Any]] = {}
+    _mtimes: Dict[str, int] = {}
+    _versions: Dict[str, int] = {}
+    
+    @staticmethod
+    def _normalize(language: str) -> str:
+        return Settings.SUPPORTED_LANGUAGES.get(language.lower(), language.lower())
     
     @classmethod
     def load_language_config(cls, language: str) -> Dict[str, Any]:
@@ -29,17 +39,29 @@ class ConfigLoader:
             json.JSONDecodeError: If JSON file is malformed
         """
         # Normalize language
-        normalized_lang = Settings.SUPPORTED_LANGUAGES.get(
-            language.lower(), 
-            language.lower()
-        )
+        normalized_lang = cls._normalize(language)
         
         # Check cache
         if normalized_lang in cls._cache:
             return cls._cache[normalized_lang]
         
-        # Load from file
-        config_path = Settings.get_config_path(normalized_lang)
+        config, mtime = cls.read_language_config(normalized_lang)
+        cls.publish_language_config(normalized_lang, config, mtime)
+        return config
+    
+    @classmethod
+    def read_language_config(cls, language: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Read a language's JSON file without touching the cache.
+        
+        Returns:
+            Tuple of (configuration, file modification time in nanoseconds)
+        
+        Raises:
+            FileNotFoundError: If configuration file doesn't exist
+            ValueError: If JSON file is malformed or empty
+        """
+        config_path = Settings.get_config_path(cls._normalize(language))
         
         if not config_path.exists():
             raise FileNotFoundError(
@@ -47,33 +69,57 @@ class ConfigLoader:
                 f"Language: {language}"
             )
         
+        # Stat before reading, so a write during the read is seen as a change later
+        mtime = config_path.stat().st_mtime_ns
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-            
-            if config is None:
-                raise ValueError(f"Empty configuration file: {config_path}")
-            
-            # Cache the configuration
-            cls._cache[normalized_lang] = config
-            return config
-        
         except json.JSONDecodeError as e:
             raise ValueError(f"Error parsing JSON file {config_path}: {e}")
+        
+        if config is None:
+            raise ValueError(f"Empty configuration file: {config_path}")
+        
+        return config, mtime
+    
+    @classmethod
+    def publish_language_config(cls, language: str, config: Dict[str, Any], mtime: int) -> None:
+        """Make a configuration read by read_language_config the cached one."""
+        normalized_lang = cls._normalize(language)
+        cls._mtimes[normalized_lang] = mtime
+        cls._versions[normalized_lang] = cls._versions.get(normalized_lang, 0) + 1
+        cls._cache[normalized_lang] = config
+    
+    @classmethod
+    def version(cls, language: str) -> int:
+        """Version of the cached configuration (0 if never loaded)."""
+        return cls._versions.get(cls._normalize(language), 0)
+    
+    @classmethod
+    def is_stale(cls, language: str) -> bool:
+        """Whether the file changed since the cached configuration was read."""
+        normalized_lang = cls._normalize(language)
+        if normalized_lang not in cls._cache:
+            return True
+        try:
+            mtime = Settings.get_config_path(normalized_lang).stat().st_mtime_ns
+        except OSError:
+            return False
+        return mtime != cls._mtimes.get(normalized_lang)
     
     @classmethod
     def clear_cache(cls) -> None:
         """Clear the configuration cache."""
         cls._cache.clear()
+        cls._mtimes.clear()
     
     @classmethod
     def reload_language_config(cls, language: str) -> Dict[str, Any]:
-        """Force reload of language configuration."""
-        normalized_lang = Settings.SUPPORTED_LANGUAGES.get(
-            language.lower(),
-            language.lower()
-        )
-        if normalized_lang in cls._cache:
-            del cls._cache[normalized_lang]
-        return cls.load_language_config(language)
-
+        """Force reload of language configuration.
+        
+        The new configuration replaces the cached one in a single step, so
+        concurrent readers see either the old or the new one.
+        """
+        config, mtime = cls.read_language_config(language)
+        cls.publish_language_config(language, config, mtime)
+        return config
@@ -15,6 +15,7 @@ class Settings:
     DEFAULT_LANGUAGE = "en"
     DEFAULT_CONVERSION_TYPE = "cardinal"
     DEFAULT_GENDER = "m"  # For Arabic
+    DEFAULT_GROUPING = "short"  # Digit-grouping system (see "grouping" in the language data)
     
     # Supported languages
     SUPPORTED_LANGUAGES = {
@@ -29,6 +30,7 @@ class Settings:
         'cardinal': 'cardinal',
         'ordinal': 'ordinal',
         'currency': 'currency',
+        'digits': 'digits',
     }
     
     # Supported currencies
@@ -72,6 +74,28 @@ class Settings:
     # Scale limits
     MAX_SCALE_INDEX = 11  # Up to decillion
     
+    # Input limits (None disables a limit). Inputs over a limit raise
+    # InputLimitError before any conversion work is done.
+    MAX_DIGITS = None  # Digits in the integer and decimal parts together
+    MAX_OUTPUT_LENGTH = None  # Worst-case length of the words, in characters
+    MAX_COST = None  # Estimated cost, see numwordify.limits.estimate_cost
+    COST_ESTIMATOR = None  # Optional callable (number, conversion_type) -> cost
+    
+    # Output style profiles for every language (style='upper'); languages
+    # define their own under "styles" in their data. A profile may set
+    # STYLE_KEYS, and casing is one of CASINGS.
+    STYLES = {
+        'upper': {'casing': 'upper'},
+        'lower': {'casing': 'lower'},
+        'title': {'casing': 'title'},
+    }
+    STYLE_KEYS = ('number_separator', 'scale_separator', 'conjunction', 'casing')
+    CASINGS = {
+        'upper': str.upper,
+        'lower': str.lower,
+        'title': str.title,
+    }
+
     # Special number handling
     INFINITY_WORDS = {
         'en': {
@@ -132,6 +156,20 @@ class Settings:
             f"Supported: {list(cls.SUPPORTED_CURRENCIES.keys())}"
         )
     
+    @classmethod
+    def parse_option_value(cls, value: str) -> Any:
+        """Parse an option given as text ("key=value" specs, templates).
+        
+        'true'/'false' become booleans and integers become int, so options
+        such as minor_units=true or group_size=3 work from text.
+        """
+        text = value.strip()
+        if text.lower() in ('true', 'false'):
+            return text.lower() == 'true'
+        if text.lstrip('-').isdigit():
+            return int(text)
+        return text
+    
     @classmethod
     def validate_gender(cls, gender: str) -> str:
         """Validate gender option."""
@@ -0,0 +1 @@
+"""Optional integrations with third-party frameworks."""
@@ -0,0 +1,19 @@
+"""
+Django integration for numwordify.
+
+Add the app and (optionally) the memo middleware to your settings:
+
+    INSTALLED_APPS = [
+        ...
+        'numwordify.contrib.django',
+    ]
+
+    MIDDLEWARE = [
+        ...
+        'numwordify.contrib.django.middleware.ConversionMemoMiddleware',
+    ]
+
+Then use the template filters with ``{% load numwordify %}``, convert a
+field across a queryset with ``numwordify.contrib.django.queryset.convert_field``
+and serialize with ``numwordify.contrib.django.serializers.NumberWordsField``.
+"""
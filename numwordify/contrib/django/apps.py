@@ -0,0 +1,11 @@
+"""Django app configuration for numwordify."""
+
+from django.apps import AppConfig
+
+
+class NumwordifyConfig(AppConfig):
+    """App config registering the numwordify template tags."""
+    
+    name = 'numwordify.contrib.django'
+    label = 'numwordify'
+    verbose_name = 'numwordify'
@@ -0,0 +1,100 @@
+"""
+Per-request memoization of conversions.
+
+A memo is a plain dict scoped with ``contextvars``, so it follows the
+request across threads and async tasks without any Django imports. The
+middleware opens one memo per request; outside a memo scope every call
+converts directly.
+"""
+
+import contextvars
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Union
+
+from ...converter import convert_batch, num2words
+
+_memo: contextvars.ContextVar = contextvars.ContextVar('numwordify_memo', default=None)
+
+
+@contextmanager
+def memo_scope() -> Iterator[Dict[Hashable, str]]:
+    """Open a fresh memo for the duration of the block."""
+    memo: Dict[Hashable, str] = {}
+    token = _memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _memo.reset(token)
+
+
+def active_memo() -> Optional[Dict[Hashable, str]]:
+    """Return the memo of the current scope, or None outside any scope."""
+    return _memo.get()
+
+
+def to_number(value: Any) -> Union[int, float]:
+    """
+    Coerce a model or template value to a number num2words accepts.
+    
+    Integral values become ints; other Decimals and numeric strings are
+    kept exact as Decimal.
+    
+    Raises:
+        TypeError: If the value is not numeric
+        ValueError: If a string is not a valid number
+    """
+    if isinstance(value, bool):
+        raise TypeError("Booleans are not numbers")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, Decimal):
+        return int(value) if value.is_finite() and value == value.to_integral_value() else value
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return Decimal(value)
+        except ArithmeticError:
+            raise ValueError(f"Not a number: {value!r}") from None
+    raise TypeError(f"Number must be int, float, Decimal or str, got {type(value).__name__}")
+
+
+def _key(number: Union[int, float], lang: str, to: str, options: Dict[str, Any]) -> Hashable:
+    return (type(number), number, lang, to, tuple(sorted(options.items())))
+
+
+def memoized_num2words(number: Union[int, float], lang: str = 'en',
+                       to: str = 'cardinal', **kwargs) -> str:
+    """num2words backed by the active memo, if any."""
+    memo = _memo.get()
+    if memo is None:
+        return num2words(number, lang=lang, to=to, **kwargs)
+    key = _key(number, lang, to, kwargs)
+    words = memo.get(key)
+    if words is None:
+        words = memo[key] = num2words(number, lang=lang, to=to, **kwargs)
+    return words
+
+
+def memoized_batch(numbers: Iterable[Union[int, float]], lang: str = 'en',
+                   to: str = 'cardinal', **kwargs) -> List[str]:
+    """
+    convert_batch backed by the active memo, if any.
+    
+    Only values missing from the memo are converted, in a single batch call.
+    """
+    numbers = list(numbers)
+    memo = _memo.get()
+    if memo is None:
+        return convert_batch(numbers, lang=lang, to=to, **kwargs)
+    
+    keys = [_key(number, lang, to, kwargs) for number in numbers]
+    missing = [number for number, key in zip(numbers, keys) if key not in memo]
+    if missing:
+        for number, words in zip(missing, convert_batch(missing, lang=lang, to=to, **kwargs)):
+            memo[_key(number, lang, to, kwargs)] = words
+    return [memo[key] for key in keys]
@@ -0,0 +1,25 @@
+"""Middleware giving every request its own conversion memo."""
+
+from typing import Any, Callable
+
+from .memo import memo_scope
+
+
+class ConversionMemoMiddleware:
+    """
+    Memoize conversions for the duration of a request.
+    
+    Template filters, queryset helpers and serializer fields rendered while
+    handling the request share one memo, so each distinct amount is
+    converted only once per request.
+    """
+    
+    sync_capable = True
+    async_capable = False
+    
+    def __init__(self, get_response: Callable[[Any], Any]):
+        self.get_response = get_response
+    
+    def __call__(self, request: Any) -> Any:
+        with memo_scope():
+            return self.get_response(request)
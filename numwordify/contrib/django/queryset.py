@@ -0,0 +1,86 @@
+"""
+Bulk conversion of model fields.
+
+``convert_field`` evaluates a queryset once and converts a field for every
+row in a single batch call, instead of one num2words call per object.
+It works on any iterable of objects, so it needs no Django imports.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from .memo import memoized_batch, to_number
+
+
+def _resolve_field(obj: Any, field: str) -> Any:
+    """Follow a ``related__field`` lookup path on an object."""
+    for name in field.split('__'):
+        if obj is None:
+            return None
+        obj = getattr(obj, name)
+    return obj
+
+
+def convert_field(objects: Iterable[Any], field: str, lang: str = 'en',
+                  to: str = 'cardinal', attr: Optional[str] = None, **kwargs) -> List[Any]:
+    """
+    Attach the words for a numeric field to every object.
+    
+    Args:
+        objects: QuerySet or any iterable of model instances
+        field: Field name, optionally a ``related__field`` path
+        lang: Language code
+        to: Conversion type ('cardinal', 'ordinal', 'currency')
+        attr: Attribute to store the words on (default: ``<field>_words``)
+        **kwargs: Passed to num2words (currency, gender, ...)
+    
+    Returns:
+        List of the objects, each with the words attribute set. Objects
+        whose field is None get None.
+    
+    Example:
+        >>> invoices = convert_field(Invoice.objects.all(), 'total',
+        ...                          to='currency', currency='SAR')
+        >>> invoices[0].total_words
+    """
+    attr = attr or f"{field.replace('__', '_')}_words"
+    objects = list(objects)
+    values = [_resolve_field(obj, field) for obj in objects]
+    
+    positions = [i for i, value in enumerate(values) if value is not None]
+    words = memoized_batch([to_number(values[i]) for i in positions], lang=lang, to=to, **kwargs)
+    
+    for obj in objects:
+        setattr(obj, attr, None)
+    for i, text in zip(positions, words):
+        setattr(objects[i], attr, text)
+    return objects
+
+
+def words_map(values: Iterable[Any], lang: str = 'en', to: str = 'cardinal',
+              **kwargs) -> Dict[Any, str]:
+    """
+    Map each distinct value to its words with one batch call.
+    
+    Useful with ``queryset.values_list('amount', flat=True)`` when only the
+    lookup table is needed.
+    """
+    distinct = list(dict.fromkeys(value for value in values if value is not None))
+    words = memoized_batch([to_number(value) for value in distinct], lang=lang, to=to, **kwargs)
+    return dict(zip(distinct, words))
+
+
+class NumberWordsQuerySetMixin:
+    """
+    QuerySet mixin adding ``with_words``.
+    
+    Example:
+        class InvoiceQuerySet(NumberWordsQuerySetMixin, models.QuerySet):
+            pass
+        
+        Invoice.objects.with_words('total', to='currency', currency='SAR')
+    """
+    
+    def with_words(self, field: str, lang: str = 'en', to: str = 'cardinal',
+                   attr: Optional[str] = None, **kwargs) -> List[Any]:
+        """Evaluate the queryset and attach words for ``field`` to each object."""
+        return convert_field(self, field, lang=lang, to=to, attr=attr, **kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,73 @@
+"""
+Django REST framework field for numwordify.
+
+``NumberWordsField`` converts its source value to words. When the parent
+serializer is used with ``many=True``, the field converts the values of
+all instances in one batch call on first use instead of once per row.
+"""
+
+from typing import Any, Dict, Hashable, Optional
+
+from rest_framework import serializers
+
+from .memo import memoized_batch, memoized_num2words, to_number
+
+
+class NumberWordsField(serializers.ReadOnlyField):
+    """
+    Read-only field rendering a numeric attribute as words.
+    
+    Example:
+        class InvoiceSerializer(serializers.ModelSerializer):
+            total_words = NumberWordsField(source='total', lang='ar',
+                                           to='currency', currency='SAR')
+    """
+    
+    def __init__(self, lang: str = 'en', to: str = 'cardinal',
+                 currency: Optional[str] = None, gender: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.lang = lang
+        self.to = to
+        self.options: Dict[str, str] = {}
+        if currency is not None:
+            self.options['currency'] = currency
+        if gender is not None:
+            self.options['gender'] = gender
+    
+    def _key(self, value: Any) -> Hashable:
+        return (type(value), value)
+    
+    def _list_batch(self) -> Optional[Dict[Hashable, str]]:
+        """Convert this field for every instance of a many=True parent, once."""
+        list_serializer = getattr(self.parent, 'parent', None)
+        if not isinstance(list_serializer, serializers.ListSerializer):
+            return None
+        if getattr(list_serializer, 'instance', None) is None:
+            return None
+        
+        batches = list_serializer.__dict__.setdefault('_numwordify_batches', {})
+        if self.field_name not in batches:
+            instances = list_serializer.instance
+            if hasattr(instances, 'all') and not hasattr(instances, '_result_cache'):
+                instances = instances.all()
+            numbers = {}
+            for instance in instances:
+                try:
+                    value = self.get_attribute(instance)
+                    if value is not None:
+                        numbers[self._key(value)] = to_number(value)
+                except (AttributeError, KeyError, TypeError, ValueError, serializers.SkipField):
+                    continue
+            words = memoized_batch(list(numbers.values()), lang=self.lang, to=self.to, **self.options)
+            batches[self.field_name] = dict(zip(numbers.keys(), words))
+        return batches[self.field_name]
+    
+    def to_representation(self, value: Any) -> Any:
+        if value is None:
+            return None
+        batch = self._list_batch()
+        if batch is not None:
+            words = batch.get(self._key(value))
+            if words is not None:
+                return words
+        return memoized_num2words(to_number(value), lang=self.lang, to=self.to, **self.options)
@@ -0,0 +1,69 @@
+"""
+Template filters for numwordify.
+
+Usage:
+    {% load numwordify %}
+    {{ amount|num2words }}
+    {{ amount|num2words:"ar" }}
+    {{ position|num2words:"en,ordinal" }}
+    {{ total|currency_words:"SAR" }}
+    {{ total|currency_words:"SAR,ar" }}
+    {{ cents|num2words:"en,currency,currency=USD,minor_units=true" }}
+
+Conversions are memoized per request when ConversionMemoMiddleware is
+installed. Values that cannot be converted are returned unchanged.
+"""
+
+from typing import Any, Dict, Tuple
+
+from django import template
+
+from ....config.settings import Settings
+from ..memo import memoized_num2words, to_number
+
+register = template.Library()
+
+
+def _parse_options(arg: str) -> Tuple[str, str, Dict[str, Any]]:
+    """Parse ``"lang[,to][,key=value...]"`` into (lang, to, kwargs)."""
+    lang, to, options = 'en', 'cardinal', {}
+    for position, part in enumerate(p.strip() for p in str(arg).split(',')):
+        if not part:
+            continue
+        if '=' in part:
+            key, value = part.split('=', 1)
+            options[key.strip()] = Settings.parse_option_value(value)
+        elif position == 0:
+            lang = part
+        else:
+            to = part
+    return lang, to, options
+
+
+def _convert(value: Any, lang: str, to: str, options: Dict[str, str]) -> Any:
+    try:
+        return memoized_num2words(to_number(value), lang=lang, to=to, **options)
+    except (ValueError, TypeError, OverflowError):
+        return value
+
+
+@register.filter(name='num2words')
+def num2words_filter(value: Any, arg: str = 'en') -> Any:
+    """Convert a value to words; arg is ``"lang[,to][,key=value...]"``."""
+    lang, to, options = _parse_options(arg)
+    return _convert(value, lang, to, options)
+
+
+@register.filter(name='ordinal_words')
+def ordinal_words_filter(value: Any, lang: str = 'en') -> Any:
+    """Convert a value to ordinal words."""
+    return _convert(value, lang, 'ordinal', {})
+
+
+@register.filter(name='currency_words')
+def currency_words_filter(value: Any, arg: str = 'USD') -> Any:
+    """Convert an amount to currency words; arg is ``"CURRENCY[,lang]"``."""
+    parts = [part.strip() for part in str(arg).split(',')]
+    currency = parts[0] or 'USD'
+    lang = parts[1] if len(parts) > 1 and parts[1] else 'en'
+    return _convert(value, lang, 'currency', {'currency': currency})
@@ -3,84 +3,136 @@ Main converter module for numwordify package.
 """
 
 import math
-from typing import Union, Dict
+import threading
+from decimal import Decimal
+from typing import Union, Dict, Any, Iterable, List, Optional, Tuple
 
 from .languages.english import EnglishConverter
 from .languages.arabic import ArabicConverter
+from .config.loader import ConfigLoader
 from .config.settings import Settings
+from .limits import check_limits, limits_active
+
+# Accepted input types; Decimal values are converted exactly
+NUMBER_TYPES = (int, float, Decimal)
+
+
+def _is_special(number: Union[int, float, Decimal]) -> bool:
+    """Whether a number is infinite or NaN."""
+    if isinstance(number, Decimal):
+        return not number.is_finite()
+    return math.isinf(number) or math.isnan(number)
 
 
 class NumberConverter:
     """Main converter class that supports multiple languages."""
     
     _converters: Dict[str, Union[EnglishConverter, ArabicConverter]] = {}
+    _converter_classes = {
+        'english': EnglishConverter,
+        'arabic': ArabicConverter,
+    }
     _initialized = False
+    _reload_lock = threading.Lock()
+    # Increases every time reload() publishes new converters
+    data_version = 0
     
     @classmethod
     def _initialize_converters(cls) -> None:
         """Lazy initialization of converters."""
         if not cls._initialized:
-            cls._converters = {
-                'en': EnglishConverter(),
-                'english': EnglishConverter(),
-                'ar': ArabicConverter(),
-                'arabic': ArabicConverter(),
-            }
+            cls._converters = cls._build_converters(
+                {name: converter_class() for name, converter_class in cls._converter_classes.items()})
             cls._initialized = True
     
     @classmethod
-    def convert(cls, number: Union[int, float], lang: str = 'en', 
-                to: str = 'cardinal', **kwargs) -> str:
+    def _build_converters(cls, by_language: Dict[str, Any]) -> Dict[str, Any]:
+        """Map every language code and name to its language's converter.
+        
+        Codes and names share one converter per language; languages missing
+        from by_language keep their current converter.
         """
-        Convert a number to words.
+        converters = dict(cls._converters)
+        for code, language in Settings.SUPPORTED_LANGUAGES.items():
+            if language in by_language:
+                converters[code] = by_language[language]
+        return converters
+    
+    @classmethod
+    def reload(cls, languages: Optional[Iterable[str]] = None, force: bool = False) -> List[str]:
+        """
+        Reload language data that changed on disk.
+        
+        New converters are built from the new data off to the side and then
+        published by replacing the converter mapping in one assignment.
+        Conversions never wait: calls already running finish with the old
+        converters, later calls use the new ones. Result caches are
+        invalidated through data_version.
         
         Args:
-            number: Integer or float to convert
-            lang: Language code ('en', 'ar', 'english', 'arabic')
-            to: Conversion type ('cardinal', 'ordinal')
-            **kwargs: Additional language-specific parameters (e.g., gender for Arabic)
+            languages: Languages to check (default: all supported)
+            force: Reload even if the files did not change
         
         Returns:
-            str: Number in words
+            Names of the languages that were reloaded
         
         Raises:
-            ValueError: If language is not supported or number is invalid
-            TypeError: If number is not numeric
-            OverflowError: If number is too large
+            ValueError: If a language is not supported or its data is invalid;
+                the current converters stay in place
         """
-        # Initialize converters if needed
-        cls._initialize_converters()
-        
-        # Handle edge cases
-        if not isinstance(number, (int, float)):
-            raise TypeError(f"Number must be int or float, got {type(number).__name__}")
+        if languages is None:
+            names = sorted(set(Settings.SUPPORTED_LANGUAGES.values()))
+        else:
+            names = sorted({Settings.validate_language(lang) for lang in languages})
         
-        # Handle infinity using settings
-        if math.isinf(number):
-            # Get language code for lookup
-            lang_code = lang.lower()
-            if lang_code in ('english', 'arabic'):
-                lang_code = 'en' if lang_code == 'english' else 'ar'
-            elif lang_code not in ('en', 'ar'):
-                lang_code = 'en'  # Default to English
+        with cls._reload_lock:
+            cls._initialize_converters()
+            if not force:
+                names = [name for name in names if ConfigLoader.is_stale(name)]
+            if not names:
+                return []
             
-            infinity_words = Settings.INFINITY_WORDS.get(lang_code, Settings.INFINITY_WORDS['en'])
-            if number > 0:
-                return infinity_words['positive']
-            else:
-                return infinity_words['negative']
-        
-        # Handle NaN using settings
-        if math.isnan(number):
-            # Get language code for lookup
-            lang_code = lang.lower()
-            if lang_code in ('english', 'arabic'):
-                lang_code = 'en' if lang_code == 'english' else 'ar'
-            elif lang_code not in ('en', 'ar'):
-                lang_code = 'en'  # Default to English
+            # Read and build everything first so a bad file changes nothing
+            configs = {name: ConfigLoader.read_language_config(name) for name in names}
+            built = {name: cls._converter_classes[name](config)
+                     for name, (config, _) in configs.items()}
             
-            return Settings.NaN_WORDS.get(lang_code, Settings.NaN_WORDS['en'])
+            for name, (config, mtime) in configs.items():
+                ConfigLoader.publish_language_config(name, config, mtime)
+            cls._converters = cls._build_converters(built)
+            cls.data_version += 1
+            return names
+    
+    @classmethod
+    def _special_words(cls, number: float, lang: str, style: Optional[str] = None) -> str:
+        """Words for infinity and NaN, looked up via settings."""
+        # Get language code for lookup
+        lang_code = lang.lower()
+        if lang_code in ('english', 'arabic'):
+            lang_code = 'en' if lang_code == 'english' else 'ar'
+        elif lang_code not in ('en', 'ar'):
+            lang_code = 'en'  # Default to English
+        
+        if number != number:  # NaN
+            words = Settings.NaN_WORDS.get(lang_code, Settings.NaN_WORDS['en'])
+        else:
+            infinity_words = Settings.INFINITY_WORDS.get(lang_code, Settings.INFINITY_WORDS['en'])
+            words = infinity_words['positive' if number > 0 else 'negative']
         
+        if style is not None:
+            casing = cls._converters[lang_code].style_profile(style).get('casing')
+            if casing is not None:
+                words = Settings.CASINGS[casing](words)
+        return words
+    
+    @classmethod
+    def _resolve(cls, lang: str, to: str, kwargs: Dict[str, Any]) -> Tuple[Any, str, Dict[str, Any]]:
+        """
+        Validate options and look up the converter for them.
+        
+        Returns:
+            Tuple of (converter, conversion_type, kwargs)
+        """
         # Validate and normalize language
         normalized_lang = Settings.validate_language(lang)
         lang_key = lang.lower()
@@ -97,6 +149,17 @@ class NumberConverter:
         
         converter = cls._converters[lang_key]
         
+        # A tenant overlay, then a style, select variants sharing or
+        # replacing the precompiled tables
+        overlay = kwargs.get('overlay')
+        if overlay is not None:
+            if getattr(overlay, 'language', None) != normalized_lang:
+                raise ValueError(f"Overlay {overlay!r} does not apply to language {lang}")
+            converter = overlay.converter_for(converter)
+        style = kwargs.get('style')
+        if style is not None:
+            converter = converter.styled(style)
+        
         # Validate currency if currency conversion
         if to == 'currency':
             currency = kwargs.get('currency', 'USD' if lang_key == 'english' else 'SAR')
@@ -108,7 +171,105 @@ class NumberConverter:
                     )
             kwargs['currency'] = currency
         
+        return converter, to, kwargs
+    
+    @classmethod
+    def convert(cls, number: Union[int, float], lang: str = 'en', 
+                to: str = 'cardinal', **kwargs) -> str:
+        """
+        Convert a number to words.
+        
+        Args:
+            number: Integer, float or Decimal to convert (or a digit string for 'digits')
+            lang: Language code ('en', 'ar', 'english', 'arabic')
+            to: Conversion type ('cardinal', 'ordinal', 'currency', 'digits')
+            **kwargs: Additional language-specific parameters (e.g., gender for Arabic)
+        
+        Returns:
+            str: Number in words
+        
+        Raises:
+            ValueError: If language is not supported or number is invalid
+            TypeError: If number is not numeric
+            OverflowError: If number is too large
+            InputLimitError: If number exceeds a limit set in Settings
+                (MAX_DIGITS, MAX_OUTPUT_LENGTH, MAX_COST)
+        """
+        # Initialize converters if needed
+        cls._initialize_converters()
+        
+        # Handle edge cases
+        if not isinstance(number, NUMBER_TYPES):
+            if isinstance(number, str) and isinstance(to, str) and to.lower() == 'digits':
+                converter, to, kwargs = cls._resolve(lang, to, kwargs)
+                if limits_active():
+                    check_limits(number, converter, to)
+                return converter.convert(number, to=to, **kwargs)
+            raise TypeError(f"Number must be int or float, got {type(number).__name__}")
+        
+        # Handle infinity and NaN using settings
+        if _is_special(number):
+            return cls._special_words(number, lang, kwargs.get('style'))
+        
+        converter, to, kwargs = cls._resolve(lang, to, kwargs)
+        if limits_active():
+            check_limits(number, converter, to)
         return converter.convert(number, to=to, **kwargs)
+    
+    @classmethod
+    def convert_batch(cls, numbers: Iterable[Union[int, float]], lang: str = 'en',
+                      to: str = 'cardinal', **kwargs) -> List[str]:
+        """
+        Convert many numbers with the same options.
+        
+        Options are validated and the converter is looked up once for the
+        whole batch, and repeated values are converted only once. Results
+        are identical to calling convert() on each number.
+        
+        Args:
+            numbers: Iterable of integers, floats or Decimals
+            lang: Language code ('en', 'ar', 'english', 'arabic')
+            to: Conversion type ('cardinal', 'ordinal', 'currency')
+            **kwargs: Additional language-specific parameters
+        
+        Returns:
+            List of results in input order
+        
+        Raises:
+            ValueError: If language is not supported or number is invalid
+            TypeError: If any number is not numeric
+        """
+        cls._initialize_converters()
+        
+        resolved = None
+        limited = limits_active()
+        reads_digits = isinstance(to, str) and to.lower() == 'digits'
+        results: List[str] = []
+        memo: Dict[Any, str] = {}
+        
+        for number in numbers:
+            if not isinstance(number, NUMBER_TYPES) and not (isinstance(number, str) and reads_digits):
+                raise TypeError(f"Number must be int or float, got {type(number).__name__}")
+            
+            # Plain ints are their own key; other types are tagged so that
+            # equal values of different types (1, 1.0, True) stay apart
+            key = number if type(number) is int else (type(number), number)
+            words = memo.get(key)
+            if words is None:
+                if not isinstance(number, str) and _is_special(number):
+                    words = cls._special_words(number, lang, kwargs.get('style'))
+                else:
+                    # Resolve lazily so errors surface in the same order as convert()
+                    if resolved is None:
+                        resolved = cls._resolve(lang, to, dict(kwargs))
+                    converter, conversion_type, options = resolved
+                    if limited:
+                        check_limits(number, converter, conversion_type)
+                    words = converter.convert(number, to=conversion_type, **options)
+                memo[key] = words
+            results.append(words)
+        
+        return results
 
 
 def num2words(number: Union[int, float], lang: str = 'en', 
@@ -117,12 +278,19 @@ def num2words(number: Union[int, float], lang: str = 'en',
     Convert a number to words.
     
     Args:
-        number: Integer or float to convert
+        number: Integer, float or Decimal to convert (Decimals are read exactly)
         lang: Language code ('en', 'ar', 'english', 'arabic')
-        to: Conversion type ('cardinal', 'ordinal', 'currency')
+        to: Conversion type ('cardinal', 'ordinal', 'currency', 'digits')
         **kwargs: Additional language-specific parameters:
             - currency: Currency code for currency conversion ('SAR', 'USD', 'EUR', 'EGP', 'KWD')
             - gender: For Arabic, use 'm' (masculine) or 'f' (feminine)
+            - minor_units: For currency, the number is an integer amount of subunits
+              (cents, halalas, fils), split exactly with integer arithmetic
+            - group_size: For 'digits', read the digits in groups of this size
+            - group_separator: For 'digits', text placed between groups
+            - overlay: LanguageOverlay with tenant overrides of this language's data
+            - style: Output style profile ('upper', 'title', 'british', ...);
+              combine profiles with '+', e.g. 'british+title'
     
     Returns:
         str: Number in words
@@ -151,3 +319,17 @@ def convert(number: Union[int, float], lang: str = 'en',
     """Alias for num2words for convenience."""
     return num2words(number, lang=lang, to=to, **kwargs)
 
+
+def convert_batch(numbers: Iterable[Union[int, float]], lang: str = 'en',
+                  to: str = 'cardinal', **kwargs) -> List[str]:
+    """
+    Convert many numbers to words with the same options.
+    
+    Equivalent to ``[num2words(n, lang=lang, to=to, **kwargs) for n in numbers]``
+    but validates the options once and converts repeated values only once.
+    
+    Examples:
+        >>> convert_batch([1, 2, 1])
+        ['one', 'two', 'one']
+    """
+    return NumberConverter.convert_batch(numbers, lang=lang, to=to, **kwargs)
@@ -0,0 +1,96 @@
+"""
+Runtime currency registration.
+
+Applications with their own units (internal credits, crypto assets, ...)
+can add them at startup instead of editing the language data files:
+
+    register_currency('BTC', 'en', name='bitcoin', plural='bitcoins',
+                      subunit='satoshi', subunit_plural='satoshis',
+                      subunit_factor=100000000)
+
+A registered currency is validated once, compiled into the same structure
+as the built-in currencies and then looked up like them, so conversions
+cost the same however many currencies are registered.
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+from .config.settings import Settings
+from .converter import NumberConverter
+
+_CODE = re.compile(r'[A-Z0-9_]{1,16}')
+
+
+def register_currency(code: str, lang: str, name: str, plural: Optional[str] = None,
+                      subunit: Optional[str] = None, subunit_plural: Optional[str] = None,
+                      subunit_factor: int = 100, description: Optional[str] = None,
+                      replace: bool = False, **forms: Any) -> None:
+    """
+    Register a currency for one language.
+
+    The currency is accepted by num2words(..., to='currency', currency=code)
+    in that language, is listed in Settings.SUPPORTED_CURRENCIES, and stays
+    registered when the language data is reloaded.
+
+    Args:
+        code: Currency code, case-insensitive (stored upper-case)
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        name: Singular unit name
+        plural: Plural unit name (default: name)
+        subunit: Singular subunit name; required when subunit_factor > 1
+        subunit_plural: Plural subunit name (default: subunit)
+        subunit_factor: Subunits per unit (1 for currencies without subunits)
+        description: Display name for Settings.SUPPORTED_CURRENCIES
+        replace: Allow replacing a currency the language already has
+        **forms: Language-specific forms, e.g. for Arabic 'dual',
+            'name_with_tanween', 'subunit_with_tanween', 'use_tanween_for_main'
+
+    Raises:
+        ValueError: If the language is not supported, the code is invalid or
+            already taken, or the forms are incomplete or unknown
+    """
+    if not isinstance(code, str) or not _CODE.fullmatch(code.strip().upper()):
+        raise ValueError(f"Invalid currency code: {code!r}")
+    code = code.strip().upper()
+    language = Settings.validate_language(lang)
+    if not isinstance(subunit_factor, int) or isinstance(subunit_factor, bool) or subunit_factor < 1:
+        raise ValueError(f"subunit_factor must be a positive integer, got {subunit_factor!r}")
+
+    NumberConverter._initialize_converters()
+    converter_class = NumberConverter._converter_classes[language]
+    unknown = sorted(set(forms) - set(converter_class.CURRENCY_FORMS))
+    if unknown:
+        raise ValueError(
+            f"Unknown currency forms for {language}: {unknown}. "
+            f"Supported: {list(converter_class.CURRENCY_FORMS)}"
+        )
+
+    info: Dict[str, Any] = {'name': name, 'subunit_factor': subunit_factor}
+    for key, value in (('plural', plural), ('subunit', subunit), ('subunit_plural', subunit_plural)):
+        if value is not None:
+            info[key] = value
+    info.update(forms)
+    for key, value in info.items():
+        if key == 'subunit_factor':
+            continue
+        expected = bool if key.startswith(('use_', 'subunit_always')) else str
+        if not isinstance(value, expected) or (expected is str and not value.strip()):
+            raise ValueError(f"Currency {code}: {key} must be a non-empty {expected.__name__}")
+
+    with NumberConverter._reload_lock:
+        converter = NumberConverter._converters[language]
+        exists = code in converter.currencies
+        if exists and not replace:
+            raise ValueError(f"Currency {code} is already defined for {language}")
+        # Compiling validates the entry before anything is published
+        compiled = converter._compile_currency(code, info)
+        registered = dict(converter._registered_currencies.get(language, {}))
+        registered[code] = info
+        converter._registered_currencies[language] = registered
+        converter.currencies[code] = compiled
+        converter._drop_variants()
+        Settings.SUPPORTED_CURRENCIES.setdefault(code, description or name)
+        if exists:
+            # Cached results for the old definition are stale now
+            NumberConverter.data_version += 1
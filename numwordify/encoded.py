@@ -0,0 +1,219 @@
+"""
+Dictionary-encoded batch results.
+
+A result is a handful of words drawn from a small vocabulary: the chunk,
+scale and currency words of the language tables. EncodedBatch keeps
+every result as a run of word IDs in one ``array`` (two bytes per word
+while the vocabulary fits) plus an offset per result, instead of one
+Python ``str`` per result. Strings are only built when a result is
+indexed, iterated or written out.
+
+Words are the space-separated pieces of a result, so decoding is exact
+for every form and language, including currency amounts and decimals.
+The phrase dictionary is seeded from the converter's tables and shared
+by every batch of that converter; words outside the tables (ordinal
+prefixes, exponents of huge numbers) are added on first use.
+
+Examples:
+    >>> batch = convert_batch_encoded(range(1000000))
+    >>> batch[123456]
+    'one hundred twenty-three thousand four hundred fifty-six'
+    >>> batch.write('numbers.txt')  # doctest: +SKIP
+"""
+
+import threading
+import weakref
+from array import array
+from itertools import accumulate, islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Union, overload
+
+from .converter import NumberConverter, convert_batch
+
+# Numbers converted per convert_batch call while encoding
+BLOCK_SIZE = 8192
+
+
+class PhraseDictionary:
+    """
+    Shared word <-> ID mapping for one converter.
+
+    Args:
+        words: Initial vocabulary
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.phrases: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> int:
+        """ID of a word, adding it if it is new."""
+        with self._lock:
+            word_id = self.ids.get(word)
+            if word_id is None:
+                word_id = self.ids[word] = len(self.phrases)
+                self.phrases.append(word)
+            return word_id
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+
+_dictionaries: 'weakref.WeakKeyDictionary[Any, PhraseDictionary]' = weakref.WeakKeyDictionary()
+
+
+def _table_words(value: Any, words: Dict[str, None]) -> None:
+    """Collect the words of every string in the converter's tables."""
+    if isinstance(value, str):
+        for word in value.split(' '):
+            words[word] = None
+    elif isinstance(value, dict):
+        for item in value.values():
+            _table_words(item, words)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _table_words(item, words)
+
+
+def phrase_dictionary(converter: Any) -> PhraseDictionary:
+    """The phrase dictionary of a converter, built on first use."""
+    dictionary = _dictionaries.get(converter)
+    if dictionary is None:
+        words: Dict[str, None] = {}
+        _table_words(vars(converter), words)
+        dictionary = _dictionaries.setdefault(converter, PhraseDictionary(words))
+    return dictionary
+
+
+class EncodedBatch:
+    """
+    Read-only sequence of conversion results stored as word IDs.
+
+    Args:
+        dictionary: Phrase dictionary the IDs refer to
+    """
+
+    def __init__(self, dictionary: PhraseDictionary):
+        self.dictionary = dictionary
+        # Widened to 'I' if the vocabulary outgrows two-byte IDs
+        self._ids = array('H')
+        self._offsets = array('Q', [0])
+
+    def append(self, words: str) -> None:
+        """Encode and add one result."""
+        self.extend((words,))
+
+    def extend(self, results: Iterable[str]) -> None:
+        """Encode and add many results."""
+        results = list(results)
+        if not results:
+            return
+        # Encode the whole block in one split: the words of result i are
+        # the next (spaces in it + 1) tokens
+        tokens = ' '.join(results).split(' ')
+        try:
+            ids = list(map(self.dictionary.ids.__getitem__, tokens))
+        except KeyError:
+            ids = [self.dictionary.add(word) for word in tokens]
+        if self._ids.typecode == 'H' and len(self.dictionary) > 0xFFFF:
+            self._ids = array('I', self._ids)
+        ends = accumulate((words.count(' ') + 1 for words in results), initial=len(self._ids))
+        self._offsets.extend(islice(ends, 1, None))
+        self._ids.extend(ids)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _decode(self, index: int) -> str:
+        phrases = self.dictionary.phrases
+        ids = self._ids[self._offsets[index]:self._offsets[index + 1]]
+        return ' '.join([phrases[word_id] for word_id in ids])
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("EncodedBatch index out of range")
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[str]:
+        phrases = self.dictionary.phrases
+        ids, offsets = self._ids, self._offsets
+        for i in range(len(self)):
+            yield ' '.join([phrases[word_id] for word_id in ids[offsets[i]:offsets[i + 1]]])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the encoded results (the shared dictionary excluded)."""
+        return (len(self._ids) * self._ids.itemsize
+                + len(self._offsets) * self._offsets.itemsize)
+
+    def write(self, destination: Union[str, IO[str]], separator: str = '\n') -> int:
+        """
+        Write every result, each followed by separator.
+
+        Strings are materialized a block at a time, so writing does not
+        need memory for all of them.
+
+        Args:
+            destination: Path or text file object
+
+        Returns:
+            Number of results written
+        """
+        if isinstance(destination, str):
+            with open(destination, 'w', encoding='utf-8') as f:
+                return self.write(f, separator)
+        results = iter(self)
+        while True:
+            block = list(islice(results, BLOCK_SIZE))
+            if not block:
+                return len(self)
+            destination.write(separator.join(block) + separator)
+
+    def __repr__(self) -> str:
+        return f"<EncodedBatch of {len(self)} results, {self.nbytes} bytes>"
+
+
+def convert_batch_encoded(numbers: Iterable[Union[int, float]], lang: str = 'en',
+                          to: str = 'cardinal', **kwargs) -> EncodedBatch:
+    """
+    Convert many numbers into a dictionary-encoded result sequence.
+
+    Results equal convert_batch's, but are held as word IDs and only
+    built as strings when read. The input is consumed in blocks, so the
+    strings of at most one block exist at a time.
+
+    Args:
+        numbers: Iterable of integers, floats or Decimals
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        to: Conversion type ('cardinal', 'ordinal', 'currency', 'digits')
+        **kwargs: Additional language-specific parameters
+
+    Returns:
+        EncodedBatch in input order
+
+    Raises:
+        ValueError: If language is not supported or number is invalid
+        TypeError: If any number is not numeric
+    """
+    NumberConverter._initialize_converters()
+    converter, _, _ = NumberConverter._resolve(lang, to, dict(kwargs))
+    batch = EncodedBatch(phrase_dictionary(converter))
+    numbers = iter(numbers)
+    while True:
+        block = list(islice(numbers, BLOCK_SIZE))
+        if not block:
+            return batch
+        batch.extend(convert_batch(block, lang=lang, to=to, **kwargs))
@@ -0,0 +1,18 @@
+"""Exceptions raised by numwordify."""
+
+
+class InputLimitError(ValueError):
+    """
+    An input exceeds one of the limits configured in Settings.
+    
+    Attributes:
+        limit: Name of the exceeded setting ('MAX_DIGITS', 'MAX_OUTPUT_LENGTH', 'MAX_COST')
+        value: The input's digit count, output length bound or cost
+        maximum: The configured limit
+    """
+    
+    def __init__(self, limit: str, value: int, maximum: int):
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        super().__init__(f"Input exceeds {limit}: {value} > {maximum}")
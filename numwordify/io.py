@@ -0,0 +1,349 @@
+"""
+Streaming CSV and JSONL column transformer.
+
+Reads records in fixed-size batches, converts the chosen numeric columns
+with one batch call per column and batch, and writes each record back
+with the word forms appended as new columns. Only one batch is held in
+memory at a time, so files of any size run in constant memory.
+
+Numbers are parsed exactly: integers as int and everything else as
+Decimal, never through float.
+
+Usage:
+    python -m numwordify.io orders.csv out.csv --column amount \\
+        --column "amount:lang=ar,to=currency,currency=SAR,output=amount_ar"
+    python -m numwordify.io events.jsonl - --column count:to=ordinal
+"""
+
+import argparse
+import csv
+import json
+import sys
+from contextlib import ExitStack
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .cache import ResultCache
+from .config.settings import Settings
+from .converter import convert_batch, num2words
+
+Source = Union[str, IO[str]]
+ColumnSpecs = Union[Iterable[Union['Column', str]], Mapping[str, Dict[str, Any]]]
+
+ON_ERROR = ('raise', 'blank')
+
+
+class Column:
+    """
+    A numeric column to convert and the options to convert it with.
+
+    Args:
+        name: Input column (CSV header or JSONL key)
+        output: Name of the appended column (default: ``<name>_words``)
+        lang: Language code
+        to: Conversion type
+        **kwargs: Additional options passed to num2words (currency, gender, ...)
+    """
+
+    def __init__(self, name: str, output: Optional[str] = None, lang: str = 'en',
+                 to: str = 'cardinal', **kwargs):
+        self.name = name
+        self.output = output or f"{name}_words"
+        self.lang = lang
+        self.to = to
+        self.kwargs = kwargs
+
+    @classmethod
+    def parse(cls, spec: str) -> 'Column':
+        """
+        Build a column from ``name[:key=value,...]``.
+
+        Examples:
+            >>> Column.parse('amount:lang=ar,to=currency,currency=SAR').output
+            'amount_words'
+        """
+        name, _, options = spec.partition(':')
+        kwargs: Dict[str, Any] = {}
+        for option in filter(None, options.split(',')):
+            key, sep, value = option.partition('=')
+            if not sep:
+                raise ValueError(f"Invalid column option '{option}', expected key=value")
+            kwargs[key.strip()] = Settings.parse_option_value(value)
+        if not name.strip():
+            raise ValueError(f"Invalid column spec '{spec}', missing column name")
+        return cls(name.strip(), **kwargs)
+
+    def __repr__(self) -> str:
+        options = ''.join(f", {key}={value!r}" for key, value in self.kwargs.items())
+        return (f"Column({self.name!r}, output={self.output!r}, lang={self.lang!r}, "
+                f"to={self.to!r}{options})")
+
+
+def _columns(columns: ColumnSpecs) -> List[Column]:
+    """Normalize column specs to a non-empty list of Column."""
+    if isinstance(columns, Mapping):
+        resolved = [Column(name, **dict(options)) for name, options in columns.items()]
+    else:
+        resolved = [column if isinstance(column, Column) else Column.parse(column)
+                    for column in columns]
+    if not resolved:
+        raise ValueError("At least one column is required")
+    # Validate options up front rather than on the first record
+    for column in resolved:
+        num2words(0, lang=column.lang, to=column.to, **column.kwargs)
+    return resolved
+
+
+def parse_number(value: Any) -> Union[int, Decimal, None]:
+    """
+    Parse a field exactly: int for integers, Decimal otherwise.
+
+    Empty fields and None parse as None. Strings are stripped first.
+
+    Raises:
+        ValueError: If the field is not a number
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Not a number: {value!r}")
+    if isinstance(value, (int, Decimal)):
+        return value
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Not a number: {value!r}") from None
+
+
+def _convert_column(values: List[Any], column: Column, on_error: str,
+                    cache: Optional[ResultCache], first_line: int) -> List[Optional[str]]:
+    """
+    Convert one column of a batch.
+
+    Fields are parsed, blanks are skipped, and the rest is converted with
+    one batch call; on failure the batch is redone one field at a time to
+    locate (or blank) the bad fields.
+    """
+    batch = convert_batch if cache is None else cache.convert_batch
+    single = num2words if cache is None else cache.convert
+
+    results: List[Optional[str]] = [None] * len(values)
+    numbers: List[Union[int, Decimal]] = []
+    positions: List[int] = []
+    failed = False
+    for i, value in enumerate(values):
+        try:
+            number = parse_number(value)
+        except ValueError:
+            failed = True
+            continue
+        if number is not None:
+            numbers.append(number)
+            positions.append(i)
+
+    if not failed:
+        try:
+            converted = batch(numbers, lang=column.lang, to=column.to, **column.kwargs)
+        except (ValueError, TypeError, OverflowError):
+            failed = True
+        else:
+            for i, words in zip(positions, converted):
+                results[i] = words
+            return results
+
+    for i, value in enumerate(values):
+        try:
+            number = parse_number(value)
+            if number is not None:
+                results[i] = single(number, lang=column.lang, to=column.to, **column.kwargs)
+        except (ValueError, TypeError, OverflowError) as e:
+            if on_error == 'raise':
+                raise ValueError(f"Line {first_line + i}, column '{column.name}': {e}") from e
+            results[i] = None
+    return results
+
+
+def _batches(iterator: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _check_options(batch_size: int, on_error: str) -> None:
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if on_error not in ON_ERROR:
+        raise ValueError(f"on_error must be one of {', '.join(ON_ERROR)}, got '{on_error}'")
+
+
+def _open(stack: ExitStack, target: Source, mode: str) -> IO[str]:
+    """Open a path (or '-' for stdin/stdout); file objects pass through."""
+    if not isinstance(target, str):
+        return target
+    if target == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    return stack.enter_context(open(target, mode, encoding='utf-8', newline=''))
+
+
+def transform_csv(source: Source, destination: Source, columns: ColumnSpecs,
+                  batch_size: int = 10000, on_error: str = 'raise',
+                  cache: Optional[ResultCache] = None, delimiter: str = ',') -> int:
+    """
+    Append word forms of numeric CSV columns.
+
+    The first row is the header; each output column is appended after the
+    existing ones and blank fields stay blank.
+
+    Args:
+        source: Input path, '-' for stdin, or a text file object
+        destination: Output path, '-' for stdout, or a text file object
+        columns: Column objects, ``name[:key=value,...]`` specs, or a mapping
+            of column name to options
+        batch_size: Records converted together
+        on_error: 'raise' to stop at the first bad field, 'blank' to leave it empty
+        cache: Optional ResultCache shared across calls
+        delimiter: Field delimiter
+
+    Returns:
+        Number of records written (excluding the header)
+
+    Raises:
+        ValueError: If a column is missing, an option is invalid, or a field
+            is not a number and on_error is 'raise'
+
+    Examples:
+        >>> transform_csv('orders.csv', 'out.csv', {'amount': {'to': 'currency'}})
+    """
+    _check_options(batch_size, on_error)
+    columns = _columns(columns)
+    records = 0
+    with ExitStack() as stack:
+        reader = csv.reader(_open(stack, source, 'r'), delimiter=delimiter)
+        writer = csv.writer(_open(stack, destination, 'w'), delimiter=delimiter,
+                            lineterminator='\n')
+        header = next(reader, None)
+        if header is None:
+            return 0
+        missing = [column.name for column in columns if column.name not in header]
+        if missing:
+            raise ValueError(f"Columns not found in header: {', '.join(missing)}")
+        indexes = [header.index(column.name) for column in columns]
+        writer.writerow(header + [column.output for column in columns])
+
+        for rows in _batches(reader, batch_size):
+            converted = [
+                _convert_column([row[index] if index < len(row) else None for row in rows],
+                                column, on_error, cache, first_line=records + 2)
+                for column, index in zip(columns, indexes)
+            ]
+            writer.writerows(row + [words or '' for words in added]
+                             for row, added in zip(rows, zip(*converted)))
+            records += len(rows)
+    return records
+
+
+def transform_jsonl(source: Source, destination: Source, columns: ColumnSpecs,
+                    batch_size: int = 10000, on_error: str = 'raise',
+                    cache: Optional[ResultCache] = None) -> int:
+    """
+    Append word forms of numeric JSONL fields.
+
+    Each line must be a JSON object. Numbers are parsed exactly and the new
+    fields are spliced into the original text, so the existing fields keep
+    their formatting. Missing and null fields produce null.
+
+    Args:
+        source: Input path, '-' for stdin, or a text file object
+        destination: Output path, '-' for stdout, or a text file object
+        columns: Column objects, ``name[:key=value,...]`` specs, or a mapping
+            of field name to options
+        batch_size: Records converted together
+        on_error: 'raise' to stop at the first bad field, 'blank' to write null
+        cache: Optional ResultCache shared across calls
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ValueError: If a line is not a JSON object, an option is invalid, or
+            a field is not a number and on_error is 'raise'
+    """
+    _check_options(batch_size, on_error)
+    columns = _columns(columns)
+    records = 0
+    with ExitStack() as stack:
+        output = _open(stack, destination, 'w')
+        lines = (line for line in _open(stack, source, 'r') if line.strip())
+        for batch in _batches(lines, batch_size):
+            objects = []
+            for offset, line in enumerate(batch):
+                try:
+                    item = json.loads(line, parse_float=Decimal)
+                except ValueError as e:
+                    raise ValueError(f"Record {records + offset + 1}: invalid JSON: {e}") from e
+                if not isinstance(item, dict):
+                    raise ValueError(f"Record {records + offset + 1}: expected a JSON object")
+                objects.append(item)
+
+            converted = [
+                _convert_column([item.get(column.name) for item in objects],
+                                column, on_error, cache, first_line=records + 1)
+                for column in columns
+            ]
+            for line, item, added in zip(batch, objects, zip(*converted)):
+                fields = ', '.join(f"{json.dumps(column.output)}: {json.dumps(words, ensure_ascii=False)}"
+                                   for column, words in zip(columns, added))
+                text = line.rstrip()
+                output.write(f"{text[:-1].rstrip()}{', ' if item else ''}{fields}}}\n")
+            records += len(batch)
+    return records
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m numwordify.io',
+        description='Append word forms of numeric columns in a CSV or JSONL file.',
+    )
+    parser.add_argument('source', help="input file, or '-' for stdin")
+    parser.add_argument('destination', help="output file, or '-' for stdout")
+    parser.add_argument('--column', action='append', required=True, metavar='SPEC',
+                        help="column to convert: name[:lang=..,to=..,output=..,currency=..]")
+    parser.add_argument('--format', choices=('csv', 'jsonl'),
+                        help='input format (default: from the source extension)')
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--on-error', choices=ON_ERROR, default='raise')
+    parser.add_argument('--delimiter', default=',', help='CSV field delimiter')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    args = _parser().parse_args(argv)
+    fmt = args.format or ('jsonl' if args.source.endswith(('.jsonl', '.ndjson')) else 'csv')
+    try:
+        if fmt == 'csv':
+            transform_csv(args.source, args.destination, args.column, args.batch_size,
+                          args.on_error, delimiter=args.delimiter)
+        else:
+            transform_jsonl(args.source, args.destination, args.column, args.batch_size,
+                            args.on_error)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,23 +3,68 @@ Arabic number-to-words converter.
 Uses YAML configuration for translations.
 """
 
-from typing import Union, List
+from typing import Mapping, Optional, Sequence, Tuple, Union, List
 from .base import BaseConverter
 from ..config.loader import ConfigLoader
 from ..config.settings import Settings
 
+# Count classes: the agreement a counted word takes. Scale words and
+# counted nouns share them and differ only in the form each class picks.
+COUNT_ZERO, COUNT_ONE, COUNT_TWO, COUNT_FEW, COUNT_MANY, COUNT_HUNDREDS = range(6)
+
+# Class of a count by its value below 100, and by its last two digits from 100 up
+_SMALL_COUNT_CLASSES = (COUNT_ZERO, COUNT_ONE, COUNT_TWO) + (COUNT_FEW,) * 8 + (COUNT_MANY,) * 89
+_LARGE_COUNT_CLASSES = (COUNT_HUNDREDS,) * 3 + (COUNT_FEW,) * 8 + (COUNT_MANY,) * 89
+
+NOUN_FORMS = ('singular', 'dual', 'plural', 'accusative')
+# A compiled noun holds its form for each count class, then its gender
+NOUN_GENDER = COUNT_HUNDREDS + 1
+
+
+def count_class(number: int) -> int:
+    """Count class of a non-negative integer."""
+    return (_SMALL_COUNT_CLASSES if number < 100 else _LARGE_COUNT_CLASSES)[number % 100]
+
 
 class ArabicConverter(BaseConverter):
     """Arabic language converter using YAML configuration."""
     
-    def __init__(self):
-        """Initialize Arabic converter with configuration."""
-        super().__init__()
-        self.load_config('arabic')
+    CURRENCY_FORMS = ('dual', 'name_with_tanween', 'plural_with_tanween', 'subunit_with_tanween',
+                      'use_tanween_for_main', 'use_tanween_for_subunit', 'subunit_always_singular')
+    
+    OVERLAY_TABLES = {
+        'zero': ('_build_digit_tables', '_build_chunk_tables'),
+        'negative_prefix': (),
+        'plus_prefix': (),
+        'decimal_separator': (),
+        'ordinal_prefix': (),
+        'conjunction': ('_build_chunk_tables',),
+        'digit_group_separator': (),
+    }
+    
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Initialize Arabic converter with configuration.
+        
+        Args:
+            config: Language configuration. If None, the cached arabic.json is used.
+        """
+        super().__init__(config)
+        if config is None:
+            self.load_config('arabic')
         self._initialize_from_config()
     
     def _initialize_from_config(self) -> None:
         """Initialize converter data structures from configuration."""
+        self._read_words()
+        self.currencies: dict = self._compile_currencies(self.config.get('currencies', {}))
+        self._build_digit_tables()
+        self._build_groupings(self.scales, self.scales)
+        self._build_scale_tables()
+        self._build_chunk_tables()
+    
+    def _read_words(self) -> None:
+        """Read the words and separators from the configuration."""
         config = self.config
         self.ones_masculine: List[str] = config.get('ones_masculine', [])
         self.tens_masculine: List[str] = config.get('tens_masculine', [])
@@ -31,12 +76,38 @@ class ArabicConverter(BaseConverter):
         self.scales_plural: List[str] = config.get('scales_plural', [])
         self.zero: str = config.get('zero', 'صفر')
         self.negative_prefix: str = config.get('negative_prefix', 'سالب')
+        self.plus_prefix: str = config.get('plus_prefix', 'زائد')
         self.decimal_separator: str = config.get('decimal_separator', 'فاصلة')
         self.ordinal_prefix: str = config.get('ordinal_prefix', 'ال')
         self.conjunction: str = config.get('conjunction', 'و')
         self.number_separator: str = config.get('number_separator', ' ')
         self.scale_separator: str = config.get('scale_separator', ' ')
-        self.currencies: dict = config.get('currencies', {})
+        self.digit_group_separator: str = config.get('digit_group_separator', '، ')
+    
+    def _build_digit_tables(self) -> None:
+        """Build the tables for digit-by-digit reading in each gender."""
+        self._digit_tables = {
+            'm': self._build_digit_table([self.zero] + self.ones_masculine[1:10]),
+            'f': self._build_digit_table([self.zero] + self.ones_feminine[1:10]),
+        }
+    
+    def _build_scale_tables(self) -> None:
+        """Build the scale words for each count class."""
+        # 1 and 11-99 take the singular, 2 the dual, everything else the plural
+        self._scale_forms = []
+        for scale_index, scale in enumerate(self.scales):
+            dual = self.scales_dual[scale_index] if scale_index < len(self.scales_dual) else scale
+            plural = self.scales_plural[scale_index] if scale_index < len(self.scales_plural) else scale
+            self._scale_forms.append((plural, scale, dual, plural, scale, plural))
+    
+    def _build_chunk_tables(self) -> None:
+        """Build the words for every three-digit chunk in each gender."""
+        # Built once so conversions only index them
+        self._cardinal_words = {
+            'm': [self._small_cardinal(n, 'm') for n in range(1000)],
+            'f': [self._small_cardinal(n, 'f') for n in range(1000)],
+        }
+        self._chunk_separator = f' {self.conjunction} '
     
     def convert(self, number: Union[int, float], to: str = 'cardinal', 
                 gender: str = 'm', **kwargs) -> str:
@@ -45,10 +116,13 @@ class ArabicConverter(BaseConverter):
         
         Args:
             number: Integer or float
-            to: 'cardinal', 'ordinal', or 'currency'
+            to: 'cardinal', 'ordinal', 'currency', or 'digits'
             gender: 'm' (masculine) or 'f' (feminine)
             **kwargs: Additional parameters
                 - currency: Currency code (e.g., 'SAR', 'USD', 'EUR')
+                - minor_units: For 'currency', the amount is an integer count of subunits
+                - grouping: Digit-grouping system (only 'short' is defined)
+                - group_size, group_separator: Digit grouping for 'digits'
         
         Returns:
             str: Number in Arabic words
@@ -56,14 +130,25 @@ class ArabicConverter(BaseConverter):
         # Validate parameters
         to = self._settings.validate_conversion_type(to)
         gender = self._settings.validate_gender(gender)
+        self._grouping_plan(kwargs.get('grouping'))
         
         # Handle currency conversion
         if to == 'currency':
             currency = kwargs.get('currency', 'SAR')
-            return self._to_currency(number, currency, gender)
+            return self._to_currency(number, currency, gender, kwargs.get('minor_units', False))
         
-        is_negative, number = self._handle_negative(number)
-        integer_part, decimal_value, decimal_str = self._handle_decimal(number)
+        if to == 'digits':
+            return self._to_digits(number, self._digit_tables[gender],
+                                   kwargs.get('group_size'), kwargs.get('group_separator'))
+        
+        if isinstance(number, int):
+            # Integers have no decimal part to split
+            is_negative = number < 0
+            integer_part = -number if is_negative else number
+            decimal_value = decimal_str = None
+        else:
+            is_negative, number = self._handle_negative(number)
+            integer_part, decimal_value, decimal_str = self._handle_decimal(number)
         
         if integer_part == 0:
             result = self.zero
@@ -77,7 +162,7 @@ class ArabicConverter(BaseConverter):
             if decimal_value is not None and decimal_value > 0:
                 decimal_words = self._to_cardinal(decimal_value, gender)
             elif decimal_str:
-                decimal_words = ' '.join([self._to_cardinal(int(d), gender) for d in decimal_str])
+                decimal_words = self._read_digits(decimal_str, self._digit_tables[gender])
             else:
                 decimal_words = None
             
@@ -88,6 +173,27 @@ class ArabicConverter(BaseConverter):
     
     def _to_cardinal(self, number: int, gender: str = 'm') -> str:
         """Convert integer to cardinal Arabic words."""
+        cardinal_words = self._cardinal_words['m' if gender == 'm' else 'f']
+        if number < 1000:
+            return cardinal_words[number]
+        
+        result_parts = []
+        
+        for chunk, scale_index in self._split_chunks(number):
+            if scale_index > 0:
+                if chunk == 1 or chunk == 2:
+                    chunk_words = self._get_scale_word(chunk, scale_index)
+                else:
+                    chunk_words = f"{cardinal_words[chunk]} {self._get_scale_word(chunk, scale_index)}"
+            else:
+                chunk_words = cardinal_words[chunk]
+            
+            result_parts.append(chunk_words)
+        
+        return self._chunk_separator.join(result_parts)
+    
+    def _small_cardinal(self, number: int, gender: str = 'm') -> str:
+        """Convert an integer below 1000 to cardinal Arabic words."""
         if number == 0:
             return self.zero
         
@@ -113,33 +219,9 @@ class ArabicConverter(BaseConverter):
             if remainder == 0:
                 return self.hundreds[hundreds_digit]
             
-            return f"{self.hundreds[hundreds_digit]} {self.conjunction} {self._to_cardinal(remainder, gender)}"
-        
-        scale_index = 0
-        result_parts = []
-        
-        while number > 0:
-            chunk = number % 1000
-            number = number // 1000
-            
-            if chunk > 0:
-                if scale_index > 0:
-                    if chunk == 1:
-                        chunk_words = self._get_scale_word(chunk, scale_index)
-                    elif chunk == 2:
-                        chunk_words = self._get_scale_word(chunk, scale_index)
-                    else:
-                        chunk_words = self._to_cardinal(chunk, gender)
-                        scale_word = self._get_scale_word(chunk, scale_index)
-                        chunk_words += f" {scale_word}"
-                else:
-                    chunk_words = self._to_cardinal(chunk, gender)
-                
-                result_parts.insert(0, chunk_words)
-            
-            scale_index += 1
+            return f"{self.hundreds[hundreds_digit]} {self.conjunction} {self._small_cardinal(remainder, gender)}"
         
-        return f' {self.conjunction} '.join(result_parts)
+        raise ValueError(f"Expected a number below 1000, got {number}")
     
     def _get_scale_word(self, number: int, scale_index: int) -> str:
         """Get the appropriate scale word based on number."""
@@ -149,39 +231,81 @@ class ArabicConverter(BaseConverter):
         if scale_index >= len(self.scales):
             return f"(10^{scale_index * 3})"
         
-        if number == 1:
-            return self.scales[scale_index]
-        elif number == 2:
-            if scale_index < len(self.scales_dual):
-                return self.scales_dual[scale_index]
-            return self.scales[scale_index]
-        elif 3 <= number <= 10:
-            if scale_index < len(self.scales_plural):
-                return self.scales_plural[scale_index]
-            return self.scales[scale_index]
+        return self._scale_forms[scale_index][count_class(number)]
+    
+    @staticmethod
+    def compile_noun(forms: Union[Sequence[str], Mapping[str, str]]) -> Tuple[str, ...]:
+        """
+        Compile a noun paradigm into its form for each count class.
+        
+        Args:
+            forms: (singular, dual, plural[, accusative][, gender]) or a
+                mapping with those keys; the accusative singular (tanween)
+                defaults to the singular and the gender of the noun to 'm'
+        
+        Returns:
+            Tuple of the noun form indexed by count class, followed by the
+            noun's gender ('m' or 'f') at NOUN_GENDER
+        
+        Raises:
+            ValueError: If a form is missing or empty, or the gender is invalid
+        """
+        if isinstance(forms, Mapping):
+            unknown = set(forms) - set(NOUN_FORMS) - {'gender'}
+            if unknown:
+                raise ValueError(f"Unknown noun forms: {', '.join(sorted(unknown))}")
+            gender = forms.get('gender', 'm')
+            forms = [forms.get(key) for key in NOUN_FORMS]
         else:
-            last_two_digits = number % 100
-            if 11 <= last_two_digits <= 99:
-                return self.scales[scale_index]
-            elif last_two_digits == 0:
-                if scale_index < len(self.scales_plural):
-                    return self.scales_plural[scale_index]
-                return self.scales[scale_index]
-            elif last_two_digits <= 10:
-                if scale_index < len(self.scales_plural):
-                    return self.scales_plural[scale_index]
-                return self.scales[scale_index]
-            else:
-                if scale_index < len(self.scales_plural):
-                    return self.scales_plural[scale_index]
-                return self.scales[scale_index]
+            forms = list(forms)
+            gender = 'm'
+            last = forms[-1] if len(forms) in (4, 5) else None
+            if isinstance(last, str) and last.lower() in Settings.GENDER_OPTIONS:
+                gender = forms.pop()
+        if len(forms) == 3:
+            forms.append(forms[0])
+        if len(forms) != 4 or not all(isinstance(form, str) and form for form in forms[:3]):
+            raise ValueError(
+                f"Noun forms must be {', '.join(NOUN_FORMS[:3])} and optionally "
+                f"{NOUN_FORMS[3]} and gender, got {forms!r}"
+            )
+        if not isinstance(gender, str):
+            raise ValueError(f"Invalid noun gender: {gender!r}")
+        gender = Settings.validate_gender(gender)
+        singular, dual, plural, accusative = forms
+        accusative = accusative or singular
+        # Zero and round hundreds take the singular, 11-99 the accusative
+        return (singular, singular, dual, plural, accusative, singular, gender)
+    
+    def count_noun(self, number: int, noun: Tuple[str, ...]) -> str:
+        """
+        Say a count with a noun agreeing with it.
+        
+        The number words take the noun's gender table, which gives 3-10
+        the opposite form (polarity): ثلاثة كتب but ثلاث ساعات.
+        
+        Args:
+            number: Non-negative integer count
+            noun: Paradigm from compile_noun
+        
+        Returns:
+            str: The count and noun; the noun comes first for a count of
+            one, and a count of two is the dual noun alone
+        """
+        if number == 2:
+            return noun[COUNT_TWO]
+        words = self._to_cardinal(number, noun[NOUN_GENDER])
+        if number == 1:
+            return f"{noun[COUNT_ONE]} {words}"
+        return f"{words} {noun[count_class(number)]}"
     
     def _to_ordinal(self, number: int, gender: str = 'm') -> str:
         """Convert integer to ordinal Arabic words."""
         cardinal = self._to_cardinal(number, gender)
         return f"{self.ordinal_prefix}{cardinal}"
     
-    def _to_currency(self, number: Union[int, float], currency: str, gender: str = 'm') -> str:
+    def _to_currency(self, number: Union[int, float], currency: str, gender: str = 'm',
+                     minor_units: bool = False) -> str:
         """Convert number to currency words in Arabic."""
         if currency not in self.currencies:
             raise ValueError(
@@ -190,13 +314,8 @@ class ArabicConverter(BaseConverter):
             )
         
         currency_info = self.currencies[currency]
-        subunit_factor = currency_info.get('subunit_factor', 100)
-        
-        is_negative, number = self._handle_negative(number)
-        
-        total_subunits = int(round(number * subunit_factor))
-        main_units = total_subunits // subunit_factor
-        subunits = total_subunits % subunit_factor
+        is_negative, main_units, subunits = self._split_amount(
+            number, currency_info['subunit_factor'], minor_units)
         
         parts = []
         
@@ -206,22 +325,7 @@ class ArabicConverter(BaseConverter):
             else:
                 main_words = self._to_cardinal(main_units, gender)
             
-            use_tanween_main = currency_info.get('use_tanween_for_main', True)
-            
-            if main_units == 1:
-                if use_tanween_main:
-                    currency_name = currency_info.get('name_with_tanween', currency_info['name'])
-                else:
-                    currency_name = currency_info['name']
-            elif main_units == 2:
-                currency_name = currency_info.get('dual', currency_info.get('plural', currency_info['name']))
-            elif main_units >= 3 and main_units <= 10:
-                currency_name = currency_info.get('plural', currency_info['name'])
-            else:
-                if use_tanween_main:
-                    currency_name = currency_info.get('name_with_tanween', currency_info['name'])
-                else:
-                    currency_name = currency_info.get('plural_with_tanween', currency_info.get('plural', currency_info['name']))
+            currency_name = self._currency_name(currency_info, main_units)
             
             if main_units == 1:
                 parts.append(f"{currency_name} {main_words}")
@@ -230,20 +334,7 @@ class ArabicConverter(BaseConverter):
         
         if subunits > 0:
             subunit_words = self._to_cardinal(subunits, gender)
-            use_tanween = currency_info.get('use_tanween_for_subunit', False)
-            subunit_always_singular = currency_info.get('subunit_always_singular', False)
-            
-            if subunits == 1:
-                if use_tanween:
-                    subunit_name = currency_info.get('subunit_with_tanween', currency_info['subunit'])
-                else:
-                    subunit_name = currency_info['subunit']
-            elif subunit_always_singular:
-                subunit_name = currency_info.get('subunit_with_tanween', currency_info['subunit'])
-            elif use_tanween:
-                subunit_name = currency_info.get('subunit_with_tanween', currency_info['subunit'])
-            else:
-                subunit_name = currency_info.get('subunit_plural', currency_info['subunit'])
+            subunit_name = self._subunit_name(currency_info, subunits)
             parts.append(f"{subunit_words} {subunit_name}")
         
         if not parts:
@@ -255,3 +346,49 @@ class ArabicConverter(BaseConverter):
             result = f"{self.negative_prefix} {result}"
         
         return result
+    
+    def _currency_name(self, currency_info: dict, main_units: int) -> str:
+        """Resolve the main unit name agreeing with the count."""
+        forms = currency_info['forms']
+        if main_units == 1:
+            return forms[0]
+        elif main_units == 2:
+            return forms[1]
+        elif main_units >= 3 and main_units <= 10:
+            return forms[2]
+        return forms[3]
+    
+    def _subunit_name(self, currency_info: dict, subunits: int) -> str:
+        """Resolve the subunit name agreeing with the count."""
+        forms = currency_info['subunit_forms']
+        return forms[0] if subunits == 1 else forms[1]
+    
+    def _compile_currency(self, code: str, info: dict) -> dict:
+        """
+        Resolve a currency entry, adding its agreement forms.
+        
+        'forms' holds the main unit name for counts of 1, 2, 3-10 and
+        anything else; 'subunit_forms' holds the subunit name for 1 and
+        anything else.
+        """
+        compiled = super()._compile_currency(code, info)
+        name = compiled['name']
+        plural = info.get('plural', name)
+        use_tanween_main = info.get('use_tanween_for_main', True)
+        use_tanween = info.get('use_tanween_for_subunit', False)
+        subunit = compiled['subunit']
+        subunit_tanween = info.get('subunit_with_tanween', subunit)
+        
+        one = info.get('name_with_tanween', name) if use_tanween_main else name
+        if use_tanween_main:
+            many = info.get('name_with_tanween', name)
+        else:
+            many = info.get('plural_with_tanween', plural)
+        compiled['forms'] = (one, info.get('dual', plural), plural, many)
+        
+        if info.get('subunit_always_singular', False) or use_tanween:
+            subunit_many = subunit_tanween
+        else:
+            subunit_many = info.get('subunit_plural', subunit)
+        compiled['subunit_forms'] = (subunit_tanween if use_tanween else subunit, subunit_many)
+        return compiled
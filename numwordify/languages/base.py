@@ -2,14 +2,109 @@
 Base converter class for language implementations.
 """
 
+import copy
+import re
+import string
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional, Union, Dict, Any
+from decimal import Decimal
+from typing import Tuple, Optional, Union, Dict, Any, List
 from ..config.settings import Settings
 
+# Digit characters read in digit-by-digit mode, indexed by value:
+# ASCII, Arabic-Indic and Extended Arabic-Indic (Persian) digits
+DIGIT_SETS = ('0123456789', '\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669',
+              '\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9')
+
+# Digit strings may hold letters (IBANs) and group separators (phone numbers)
+_DIGIT = re.compile('[' + ''.join(DIGIT_SETS) + ']')
+_DIGIT_GROUP = re.compile('[' + ''.join(DIGIT_SETS) + string.ascii_letters + ']+')
+_DIGIT_SEPARATORS = re.compile(r'[\s\-()]+')
+
+
+class GroupingPlan:
+    """
+    Precompiled chunking plan for one digit-grouping system.
+    
+    A system is described in the language data by its group sizes, counted
+    in digits from the right, and its scale words:
+    
+        "indian": {"groups": [3, 2, 2], "nested": true,
+                   "scales": ["", "thousand", "lakh", "crore"]}
+    
+    The last group size repeats for larger numbers. In a nested system
+    everything above the listed groups forms one chunk under the last scale
+    word instead (so 10^12 is "one lakh crore").
+    """
+    
+    __slots__ = ('name', 'scales', 'ordinal_scales', 'nested', 'unit', '_divisors', '_repeat', '_sizes')
+    
+    def __init__(self, name: str, groups: List[int], scales: List[str],
+                 ordinal_scales: List[str], nested: bool = False):
+        if not groups or any(not isinstance(size, int) or size < 1 for size in groups):
+            raise ValueError(f"Invalid groups for grouping '{name}': {groups!r}")
+        self.name = name
+        self.scales = scales
+        self.ordinal_scales = ordinal_scales
+        self.nested = nested
+        self._sizes = tuple(groups)
+        divisors = tuple(10 ** size for size in groups)
+        # Divisor of the units group (1000 for every built-in system)
+        self.unit = divisors[0]
+        if nested:
+            self._divisors, self._repeat = divisors, 0
+        else:
+            self._divisors, self._repeat = divisors[:-1], divisors[-1]
+    
+    def split_chunks(self, number: int) -> List[Tuple[int, int]]:
+        """Split a positive integer into its non-zero chunks.
+        
+        Returns:
+            List of (chunk, scale_index) pairs, most significant first
+        """
+        chunks = []
+        scale_index = 0
+        for divisor in self._divisors:
+            if not number:
+                break
+            number, chunk = divmod(number, divisor)
+            if chunk:
+                chunks.append((chunk, scale_index))
+            scale_index += 1
+        if number:
+            if self._repeat:
+                divisor = self._repeat
+                while number > 0:
+                    number, chunk = divmod(number, divisor)
+                    if chunk:
+                        chunks.append((chunk, scale_index))
+                    scale_index += 1
+            else:
+                chunks.append((number, scale_index))
+        chunks.reverse()
+        return chunks
+    
+    def exponent(self, scale_index: int) -> int:
+        """Power of ten of a scale index."""
+        sizes = self._sizes
+        if scale_index <= len(sizes):
+            return sum(sizes[:scale_index])
+        return sum(sizes) + (scale_index - len(sizes)) * sizes[-1]
+
 
 class BaseConverter(ABC):
     """Base class for all language converters."""
     
+    # Currencies registered at runtime, by language name. They are merged
+    # into every converter built for the language, including after a reload.
+    _registered_currencies: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    
+    # Optional currency keys the language reads besides the common ones
+    CURRENCY_FORMS: Tuple[str, ...] = ()
+    
+    # Options a tenant overlay may override, with the table builders that
+    # read them (see overlaid)
+    OVERLAY_TABLES: Dict[str, Tuple[str, ...]] = {}
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize converter with configuration.
@@ -19,6 +114,11 @@ class BaseConverter(ABC):
         """
         self._config = config
         self._settings = Settings
+        self._groupings: Dict[str, GroupingPlan] = {}
+        self._plan: Optional[GroupingPlan] = None
+        self._styled_variants: Dict[str, 'BaseConverter'] = {}
+        # Bumped when variants built from this converter go stale
+        self._variants_version = 0
     
     @property
     def config(self) -> Dict[str, Any]:
@@ -37,6 +137,142 @@ class BaseConverter(ABC):
         from ..config.loader import ConfigLoader
         self._config = ConfigLoader.load_language_config(language)
     
+    def styled(self, style: str) -> 'BaseConverter':
+        """
+        Get the variant of this converter for a style profile.
+        
+        The profile's separators and conjunction replace the language
+        data's before the tables are built, and its casing is applied to
+        the built tables, so a variant converts exactly as fast as the
+        converter itself. Variants are built on first use and kept with
+        the converter, so a reload drops them with it.
+        
+        Args:
+            style: Profile name from Settings.STYLES or the language data's
+                "styles"; names joined with '+' combine, later ones winning
+                ('british+upper')
+        
+        Returns:
+            BaseConverter: The styled converter
+        
+        Raises:
+            ValueError: If a profile is unknown or sets an unsupported option
+        """
+        variant = self._styled_variants.get(style)
+        if variant is None:
+            profile = self.style_profile(style)
+            casing = profile.pop('casing', None)
+            config = dict(self.config)
+            config.update(profile)
+            variant = type(self)(config)
+            # Keep the currencies as compiled here (overlays may override some)
+            variant.currencies = self.currencies
+            if casing is not None:
+                variant._apply_casing(casing)
+            self._styled_variants[style] = variant
+        return variant
+    
+    def overlaid(self, overlay: Any) -> 'BaseConverter':
+        """
+        Build the variant of this converter for a tenant overlay.
+        
+        The variant is a shallow copy sharing every table with this
+        converter except those built from an overridden option
+        (OVERLAY_TABLES), which are rebuilt, and the currency map, which
+        is copied when the overlay overrides currencies so that only those
+        entries are compiled. The overlay keeps the variant until
+        _variants_version changes.
+        
+        Args:
+            overlay: A LanguageOverlay for this converter's language
+        
+        Returns:
+            BaseConverter: The converter with the overlay applied
+        
+        Raises:
+            ValueError: If an overridden currency entry is invalid
+        """
+        variant = copy.copy(self)
+        variant._drop_variants()
+        if overlay.currencies:
+            registered = self._registered_currencies.get(self.config.get('language'), {})
+            entries = self.config.get('currencies', {})
+            variant.currencies = dict(self.currencies)
+            for code, info in overlay.currencies.items():
+                # Overrides may name only the forms they change
+                entry = dict(registered.get(code) or entries.get(code) or {})
+                entry.update(info)
+                variant.currencies[code] = variant._compile_currency(code, entry)
+        if overlay.overrides:
+            variant._config = dict(self.config)
+            variant._config.update(overlay.overrides)
+            variant._read_words()
+            builders: List[str] = []
+            for key in overlay.overrides:
+                builders.extend(name for name in self.OVERLAY_TABLES[key] if name not in builders)
+            for name in builders:
+                getattr(variant, name)()
+        return variant
+    
+    def _drop_variants(self) -> None:
+        """Forget the styled and overlay variants; they are rebuilt on next use."""
+        self._styled_variants = {}
+        self._variants_version += 1
+    
+    def _read_words(self) -> None:
+        """Read the words and separators from the configuration."""
+    
+    def style_profile(self, style: str) -> Dict[str, Any]:
+        """
+        Resolve a style name into the options it overrides.
+        
+        Raises:
+            ValueError: If a profile is unknown or sets an unsupported option
+        """
+        if not isinstance(style, str):
+            raise ValueError(f"Style must be a profile name, got {type(style).__name__}")
+        styles = self.config.get('styles', {})
+        profile: Dict[str, Any] = {}
+        for name in style.lower().split('+'):
+            overrides = styles.get(name.strip(), Settings.STYLES.get(name.strip()))
+            if overrides is None:
+                raise ValueError(
+                    f"Unsupported style: {name}. "
+                    f"Supported: {sorted(set(Settings.STYLES) | set(styles))}"
+                )
+            profile.update(overrides)
+        unsupported = sorted(set(profile) - set(Settings.STYLE_KEYS))
+        if unsupported:
+            raise ValueError(
+                f"Style {style} sets unsupported options {unsupported}. "
+                f"Supported: {list(Settings.STYLE_KEYS)}"
+            )
+        if profile.get('casing', 'upper') not in Settings.CASINGS:
+            raise ValueError(
+                f"Invalid casing: {profile['casing']}. "
+                f"Must be one of: {list(Settings.CASINGS)}"
+            )
+        return profile
+    
+    def _apply_casing(self, casing: str) -> None:
+        """Apply a casing to every string in the built tables."""
+        case = Settings.CASINGS[casing]
+        
+        def apply(value: Any) -> Any:
+            if isinstance(value, str):
+                return case(value)
+            if isinstance(value, list):
+                return [apply(item) for item in value]
+            if isinstance(value, tuple):
+                return tuple(apply(item) for item in value)
+            if isinstance(value, dict):
+                return {key: apply(item) for key, item in value.items()}
+            return value
+        
+        for name, value in list(vars(self).items()):
+            if name not in ('_config', '_styled_variants'):
+                setattr(self, name, apply(value))
+    
     @abstractmethod
     def convert(self, number: Union[int, float], to: str = 'cardinal', **kwargs) -> str:
         """
@@ -53,6 +289,66 @@ class BaseConverter(ABC):
         """
         pass
     
+    def _compile_currencies(self, currencies: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Compile the language's currencies plus the registered ones."""
+        compiled = {code: self._compile_currency(code, info) for code, info in currencies.items()}
+        for code, info in self._registered_currencies.get(self.config.get('language'), {}).items():
+            compiled[code] = self._compile_currency(code, info)
+        return compiled
+    
+    def _compile_currency(self, code: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve a currency entry into the structure _to_currency reads.
+        
+        Defaults are filled in once here, so conversions index the result
+        directly. Languages extend this with their own name forms.
+        
+        Raises:
+            ValueError: If the entry lacks a name, or a subunit name when it
+                has subunits
+        """
+        if not info.get('name'):
+            raise ValueError(f"Currency {code} has no name")
+        compiled = dict(info)
+        compiled.setdefault('plural', info['name'])
+        factor = compiled.setdefault('subunit_factor', 100)
+        if factor > 1 and not info.get('subunit'):
+            raise ValueError(f"Currency {code} has subunits but no subunit name")
+        compiled.setdefault('subunit', '')
+        compiled.setdefault('subunit_plural', compiled['subunit'])
+        return compiled
+    
+    def _split_amount(self, number: Union[int, float], subunit_factor: int,
+                      minor_units: bool = False) -> Tuple[bool, int, int]:
+        """
+        Split a currency amount into main units and subunits.
+        
+        Args:
+            number: Amount in main units, or in subunits when minor_units is set
+            subunit_factor: Subunits per main unit
+            minor_units: The amount is an integer count of subunits (cents,
+                halalas, fils) and is split with integer arithmetic only
+        
+        Returns:
+            Tuple of (is_negative, main_units, subunits)
+        
+        Raises:
+            TypeError: If minor_units is set and the amount is not an integer
+        """
+        if minor_units:
+            if not isinstance(number, int) or isinstance(number, bool):
+                raise TypeError(
+                    f"minor_units amounts must be int, got {type(number).__name__}"
+                )
+            is_negative = number < 0
+            total_subunits = -number if is_negative else number
+        else:
+            is_negative, number = self._handle_negative(number)
+            # Convert to smallest unit (e.g., cents, halalas)
+            total_subunits = int(round(number * subunit_factor))
+        main_units, subunits = divmod(total_subunits, subunit_factor)
+        return is_negative, main_units, subunits
+    
     def _handle_negative(self, number: Union[int, float]) -> Tuple[bool, Union[int, float]]:
         """Handle negative numbers.
         
@@ -63,6 +359,122 @@ class BaseConverter(ABC):
             return True, abs(number)
         return False, number
     
+    @staticmethod
+    def _build_digit_table(words: List[str]) -> Dict[int, str]:
+        """
+        Build a str.translate table reading each digit as a word.
+        
+        Args:
+            words: Words for the digit values 0-9
+        
+        Returns:
+            Table mapping every supported digit character to its word
+            followed by a space; Latin letters (in IBANs) read as capitals
+        """
+        table = {ord(char): f"{char.upper()} " for char in string.ascii_letters}
+        for digits in DIGIT_SETS:
+            for value, char in enumerate(digits):
+                table[ord(char)] = f"{words[value]} "
+        return table
+    
+    def _read_digits(self, digits: str, table: Dict[int, str]) -> str:
+        """Read a string of digit characters one digit at a time."""
+        return digits.translate(table)[:-1]
+    
+    def _to_digits(self, number: Union[int, float, str], table: Dict[int, str],
+                   group_size: Optional[int] = None, group_separator: Optional[str] = None) -> str:
+        """
+        Read a number or digit string digit by digit.
+        
+        Args:
+            number: Integer, float, or string of digits (ASCII or Arabic-Indic)
+                and Latin letters, optionally separated by spaces, hyphens or
+                parentheses and starting with '+' or '-'
+            table: Digit table from _build_digit_table
+            group_size: Regroup the digits into groups of this size from the
+                left. By default, groups separated in a string input are kept.
+            group_separator: Text between groups (defaults to the language's
+                digit_group_separator)
+        
+        Returns:
+            str: Digits in words
+        """
+        if group_separator is None:
+            group_separator = self.digit_group_separator
+        prefix = ''
+        suffix = ''
+        
+        if isinstance(number, str):
+            text = number.strip()
+            if text.startswith('-'):
+                prefix = f"{self.negative_prefix} "
+                text = text[1:].lstrip()
+            elif text.startswith('+'):
+                prefix = f"{self.plus_prefix} "
+                text = text[1:].lstrip()
+            groups = [group for group in _DIGIT_SEPARATORS.split(text) if group]
+            if (text[:1] in ('-', '+') or not _DIGIT.search(text)
+                    or not all(_DIGIT_GROUP.fullmatch(group) for group in groups)):
+                raise ValueError(f"Invalid digit string: {number!r}")
+        else:
+            is_negative, number = self._handle_negative(number)
+            if is_negative:
+                prefix = f"{self.negative_prefix} "
+            integer_part, _, decimal_str = self._handle_decimal(number)
+            groups = [str(integer_part)]
+            if decimal_str:
+                suffix = f" {self.decimal_separator} {self._read_digits(decimal_str, table)}"
+        
+        if group_size is not None:
+            if group_size < 1:
+                raise ValueError(f"group_size must be positive, got {group_size}")
+            digits = ''.join(groups)
+            groups = [digits[i:i + group_size] for i in range(0, len(digits), group_size)]
+        
+        words = group_separator.join(self._read_digits(group, table) for group in groups)
+        return f"{prefix}{words}{suffix}"
+    
+    def _build_groupings(self, scales: List[str], ordinal_scales: List[str]) -> None:
+        """
+        Compile the grouping systems of the language data.
+        
+        Systems without their own scale words use the language's default
+        scales. The default system is the one named by Settings.DEFAULT_GROUPING.
+        """
+        specs = self.config.get('grouping') or {Settings.DEFAULT_GROUPING: {'groups': [3]}}
+        self._groupings = {
+            name: GroupingPlan(name, spec.get('groups', [3]), spec.get('scales', scales),
+                               spec.get('ordinal_scales', spec.get('scales', ordinal_scales)),
+                               spec.get('nested', False))
+            for name, spec in specs.items()
+        }
+        self._plan = self._groupings[Settings.DEFAULT_GROUPING]
+    
+    def _grouping_plan(self, grouping: Optional[str] = None) -> GroupingPlan:
+        """
+        Get the chunking plan of a grouping system.
+        
+        Raises:
+            ValueError: If the language does not define the system
+        """
+        if grouping is None:
+            return self._plan
+        plan = self._groupings.get(grouping.lower() if isinstance(grouping, str) else grouping)
+        if plan is None:
+            raise ValueError(
+                f"Unsupported grouping: {grouping}. "
+                f"Supported: {list(self._groupings.keys())}"
+            )
+        return plan
+    
+    def _split_chunks(self, number: int) -> List[Tuple[int, int]]:
+        """Split a positive integer into chunks with the default grouping.
+        
+        Returns:
+            List of (chunk, scale_index) pairs, most significant first
+        """
+        return self._plan.split_chunks(number)
+    
     def _handle_decimal(self, number: Union[int, float]) -> Tuple[Union[int, float], Optional[int], Optional[str]]:
         """Handle decimal numbers.
         
@@ -74,7 +486,7 @@ class BaseConverter(ABC):
             - decimal_str: The decimal part as a string for digit-by-digit reading
               None if no decimal part
         """
-        if isinstance(number, float):
+        if isinstance(number, (float, Decimal)):
             integer_part = int(number)
             # Convert to string and split to get decimal part
             # Use configurable precision
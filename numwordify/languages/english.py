@@ -3,8 +3,8 @@ English number-to-words converter.
 Uses JSON configuration for translations.
 """
 
-from typing import Union, List
-from .base import BaseConverter
+from typing import Optional, Union, List
+from .base import BaseConverter, GroupingPlan
 from ..config.loader import ConfigLoader
 from ..config.settings import Settings
 
@@ -12,14 +12,43 @@ from ..config.settings import Settings
 class EnglishConverter(BaseConverter):
     """English language converter using JSON configuration."""
     
-    def __init__(self):
-        """Initialize English converter with configuration."""
-        super().__init__()
-        self.load_config('english')
+    OVERLAY_TABLES = {
+        'zero': ('_build_digit_tables', '_build_chunk_tables'),
+        'zeroth': ('_build_chunk_tables',),
+        'hundred': ('_build_chunk_tables',),
+        'negative_prefix': (),
+        'plus_prefix': (),
+        'decimal_separator': (),
+        'number_separator': ('_build_chunk_tables',),
+        'scale_separator': ('_build_scale_tables',),
+        'conjunction': ('_build_chunk_tables',),
+        'amount_separator': (),
+        'digit_group_separator': (),
+    }
+    
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Initialize English converter with configuration.
+        
+        Args:
+            config: Language configuration. If None, the cached english.json is used.
+        """
+        super().__init__(config)
+        if config is None:
+            self.load_config('english')
         self._initialize_from_config()
     
     def _initialize_from_config(self) -> None:
         """Initialize converter data structures from configuration."""
+        self._read_words()
+        self.currencies: dict = self._compile_currencies(self.config.get('currencies', {}))
+        self._build_digit_tables()
+        self._build_groupings(self.scales, self.ordinal_scales)
+        self._build_chunk_tables()
+        self._build_scale_tables()
+    
+    def _read_words(self) -> None:
+        """Read the words and separators from the configuration."""
         config = self.config
         self.ones: List[str] = config.get('ones', [])
         self.tens: List[str] = config.get('tens', [])
@@ -31,10 +60,40 @@ class EnglishConverter(BaseConverter):
         self.zeroth: str = config.get('zeroth', 'zeroth')
         self.hundred: str = config.get('hundred', 'hundred')
         self.negative_prefix: str = config.get('negative_prefix', 'negative')
+        self.plus_prefix: str = config.get('plus_prefix', 'plus')
         self.decimal_separator: str = config.get('decimal_separator', 'point')
         self.number_separator: str = config.get('number_separator', '-')
         self.scale_separator: str = config.get('scale_separator', ' ')
-        self.currencies: dict = config.get('currencies', {})
+        self.digit_group_separator: str = config.get('digit_group_separator', ', ')
+        # British usage: "one hundred and five", "one thousand and five"
+        self.conjunction: Optional[str] = config.get('conjunction')
+        self.amount_separator: str = config.get('amount_separator', ' and ')
+        self._hundred_separator = f" {self.conjunction} " if self.conjunction else " "
+    
+    def _build_digit_tables(self) -> None:
+        """Build the table for digit-by-digit reading."""
+        self._digit_table = self._build_digit_table([self.zero] + self.ones[1:10])
+    
+    def _build_chunk_tables(self) -> None:
+        """Build the words for every three-digit chunk, so conversions only index them."""
+        self._cardinal_words: List[str] = [self._small_cardinal(n) for n in range(1000)]
+        self._ordinal_words: List[str] = [self._small_ordinal(n) for n in range(1000)]
+        # The units chunk of a larger number, which takes the conjunction
+        # before a value below 100
+        if self.conjunction:
+            self._final_cardinal_words = [self._conjoined(n, words) for n, words in enumerate(self._cardinal_words)]
+            self._final_ordinal_words = [self._conjoined(n, words) for n, words in enumerate(self._ordinal_words)]
+        else:
+            self._final_cardinal_words = self._cardinal_words
+            self._final_ordinal_words = self._ordinal_words
+    
+    def _build_scale_tables(self) -> None:
+        """Build the scale suffixes of every grouping system."""
+        self._scale_suffixes = {
+            name: ([f"{self.scale_separator}{scale}" for scale in plan.scales],
+                   [f"{self.scale_separator}{scale}" for scale in plan.ordinal_scales])
+            for name, plan in self._groupings.items()
+        }
     
     def convert(self, number: Union[int, float], to: str = 'cardinal', **kwargs) -> str:
         """
@@ -42,28 +101,42 @@ class EnglishConverter(BaseConverter):
         
         Args:
             number: Integer or float
-            to: 'cardinal', 'ordinal', or 'currency'
+            to: 'cardinal', 'ordinal', 'currency', or 'digits'
             **kwargs: Additional parameters
                 - currency: Currency code (e.g., 'SAR', 'USD', 'EUR')
+                - minor_units: For 'currency', the amount is an integer count of subunits
+                - grouping: Digit-grouping system ('short', 'long', 'indian')
+                - group_size, group_separator: Digit grouping for 'digits'
         
         Returns:
             str: Number in English words
         """
         # Validate conversion type
         to = self._settings.validate_conversion_type(to)
+        plan = self._grouping_plan(kwargs.get('grouping'))
         
         # Handle currency conversion
         if to == 'currency':
             currency = kwargs.get('currency', 'USD')
-            return self._to_currency(number, currency)
+            return self._to_currency(number, currency, plan, kwargs.get('minor_units', False))
         
-        is_negative, number = self._handle_negative(number)
-        integer_part, decimal_value, decimal_str = self._handle_decimal(number)
+        if to == 'digits':
+            return self._to_digits(number, self._digit_table,
+                                   kwargs.get('group_size'), kwargs.get('group_separator'))
+        
+        if isinstance(number, int):
+            # Integers have no decimal part to split
+            is_negative = number < 0
+            integer_part = -number if is_negative else number
+            decimal_value = decimal_str = None
+        else:
+            is_negative, number = self._handle_negative(number)
+            integer_part, decimal_value, decimal_str = self._handle_decimal(number)
         
         if integer_part == 0:
             result = self.zeroth if to == 'ordinal' else self.zero
         else:
-            result = self._to_ordinal(integer_part) if to == 'ordinal' else self._to_cardinal(integer_part)
+            result = self._to_ordinal(integer_part, plan) if to == 'ordinal' else self._to_cardinal(integer_part, plan)
         
         if is_negative:
             result = f"{self.negative_prefix} {result}"
@@ -72,7 +145,7 @@ class EnglishConverter(BaseConverter):
             if decimal_value is not None and decimal_value > 0:
                 decimal_words = self._to_cardinal(decimal_value)
             elif decimal_str:
-                decimal_words = ' '.join([self._to_cardinal(int(d)) for d in decimal_str])
+                decimal_words = self._read_digits(decimal_str, self._digit_table)
             else:
                 decimal_words = None
             
@@ -81,8 +154,29 @@ class EnglishConverter(BaseConverter):
         
         return result
     
-    def _to_cardinal(self, number: int) -> str:
+    def _to_cardinal(self, number: int, plan: Optional[GroupingPlan] = None) -> str:
         """Convert integer to cardinal English words."""
+        if number < 1000:
+            return self._cardinal_words[number]
+        
+        # Handle larger numbers
+        if plan is None:
+            plan = self._plan
+        cardinal_words = self._cardinal_words
+        result_parts = []
+        for chunk, scale_index in plan.split_chunks(number):
+            # Chunks are below 1000 except the top chunk of a nested system
+            if scale_index > 0:
+                chunk_words = cardinal_words[chunk] if chunk < 1000 else self._to_cardinal(chunk, plan)
+                chunk_words += self._scale_suffix(scale_index, plan=plan)
+            else:
+                chunk_words = self._final_cardinal_words[chunk] if chunk < 1000 else self._to_cardinal(chunk, plan)
+            result_parts.append(chunk_words)
+        
+        return ' '.join(result_parts)
+    
+    def _small_cardinal(self, number: int) -> str:
+        """Convert an integer below 1000 to cardinal English words."""
         if number == 0:
             return self.zero
         
@@ -101,33 +195,58 @@ class EnglishConverter(BaseConverter):
             remainder = number % 100
             result = f"{self.ones[hundreds]} {self.hundred}"
             if remainder > 0:
-                result += f" {self._to_cardinal(remainder)}"
+                result += f"{self._hundred_separator}{self._small_cardinal(remainder)}"
             return result
         
-        # Handle larger numbers
-        scale_index = 0
+        raise ValueError(f"Expected a number below 1000, got {number}")
+    
+    def _conjoined(self, number: int, words: str) -> str:
+        """Words for a units chunk following higher chunks."""
+        return f"{self.conjunction} {words}" if 0 < number < 100 else words
+    
+    def _scale_suffix(self, scale_index: int, ordinal: bool = False,
+                      plan: Optional[GroupingPlan] = None) -> str:
+        """Get the separator and scale word appended to a chunk."""
+        if plan is None:
+            plan = self._plan
+        suffixes = self._scale_suffixes[plan.name][ordinal]
+        if scale_index < len(suffixes):
+            return suffixes[scale_index]
+        # For very large numbers beyond our scale list
+        return f" (10^{plan.exponent(scale_index)})"
+    
+    def _to_ordinal(self, number: int, plan: Optional[GroupingPlan] = None) -> str:
+        """Convert integer to ordinal English words."""
+        if number < 1000:
+            return self._ordinal_words[number]
+        
+        # For larger numbers, use cardinal + ordinal suffix.
+        # The ordinal form goes on the units chunk when it repeats the
+        # most significant chunk's value.
+        if plan is None:
+            plan = self._plan
+        cardinal_words = self._cardinal_words
+        chunks = plan.split_chunks(number)
+        last_chunk = (chunks[0][0], 0)
         result_parts = []
-        
-        while number > 0:
-            chunk = number % 1000
-            number = number // 1000
+        for chunk, scale_index in chunks:
+            is_last = (chunk, scale_index) == last_chunk
+            if is_last:
+                chunk_words = self._final_ordinal_words[chunk]
+            elif scale_index == 0 and chunk < 1000:
+                chunk_words = self._final_cardinal_words[chunk]
+            else:
+                chunk_words = cardinal_words[chunk] if chunk < 1000 else self._to_cardinal(chunk, plan)
             
-            if chunk > 0:
-                chunk_words = self._to_cardinal(chunk)
-                if scale_index > 0:
-                    if scale_index < len(self.scales):
-                        chunk_words += f"{self.scale_separator}{self.scales[scale_index]}"
-                    else:
-                        # For very large numbers beyond our scale list
-                        chunk_words += f" (10^{scale_index * 3})"
-                result_parts.insert(0, chunk_words)
+            if scale_index > 0:
+                chunk_words += self._scale_suffix(scale_index, ordinal=is_last, plan=plan)
             
-            scale_index += 1
+            result_parts.append(chunk_words)
         
         return ' '.join(result_parts)
     
-    def _to_ordinal(self, number: int) -> str:
-        """Convert integer to ordinal English words."""
+    def _small_ordinal(self, number: int) -> str:
+        """Convert an integer below 1000 to ordinal English words."""
         if number == 0:
             return self.zeroth
         
@@ -146,55 +265,15 @@ class EnglishConverter(BaseConverter):
             remainder = number % 100
             result = f"{self.ones[hundreds]} {self.hundred}"
             if remainder > 0:
-                result += f" {self._to_ordinal(remainder)}"
+                result += f"{self._hundred_separator}{self._small_ordinal(remainder)}"
             else:
                 result += "th"
             return result
         
-        # For larger numbers, use cardinal + ordinal suffix
-        scale_index = 0
-        result_parts = []
-        last_chunk = None
-        
-        temp_number = number
-        while temp_number > 0:
-            chunk = temp_number % 1000
-            temp_number = temp_number // 1000
-            if chunk > 0:
-                last_chunk = (chunk, scale_index)
-        
-        temp_number = number
-        scale_index = 0
-        while temp_number > 0:
-            chunk = temp_number % 1000
-            temp_number = temp_number // 1000
-            
-            if chunk > 0:
-                is_last = (chunk, scale_index) == last_chunk
-                if is_last:
-                    chunk_words = self._to_ordinal(chunk)
-                else:
-                    chunk_words = self._to_cardinal(chunk)
-                
-                if scale_index > 0:
-                    if is_last:
-                        if scale_index < len(self.ordinal_scales):
-                            chunk_words += f"{self.scale_separator}{self.ordinal_scales[scale_index]}"
-                        else:
-                            chunk_words += f" (10^{scale_index * 3})"
-                    else:
-                        if scale_index < len(self.scales):
-                            chunk_words += f"{self.scale_separator}{self.scales[scale_index]}"
-                        else:
-                            chunk_words += f" (10^{scale_index * 3})"
-                
-                result_parts.insert(0, chunk_words)
-            
-            scale_index += 1
-        
-        return ' '.join(result_parts)
+        raise ValueError(f"Expected a number below 1000, got {number}")
     
-    def _to_currency(self, number: Union[int, float], currency: str) -> str:
+    def _to_currency(self, number: Union[int, float], currency: str,
+                     plan: Optional[GroupingPlan] = None, minor_units: bool = False) -> str:
         """Convert number to currency words."""
         if currency not in self.currencies:
             raise ValueError(
@@ -203,16 +282,8 @@ class EnglishConverter(BaseConverter):
             )
         
         currency_info = self.currencies[currency]
-        subunit_factor = currency_info.get('subunit_factor', 100)
-        
-        is_negative, number = self._handle_negative(number)
-        
-        # Convert to smallest unit (e.g., cents, halalas)
-        total_subunits = int(round(number * subunit_factor))
-        
-        # Get main unit and subunit
-        main_units = total_subunits // subunit_factor
-        subunits = total_subunits % subunit_factor
+        is_negative, main_units, subunits = self._split_amount(
+            number, currency_info['subunit_factor'], minor_units)
         
         # Build result
         parts = []
@@ -222,29 +293,35 @@ class EnglishConverter(BaseConverter):
             if main_units == 0:
                 main_words = self.zero
             else:
-                main_words = self._to_cardinal(main_units)
+                main_words = self._to_cardinal(main_units, plan)
             
-            if main_units == 1:
-                currency_name = currency_info['name']
-            else:
-                currency_name = currency_info.get('plural', currency_info['name'])
+            currency_name = self._currency_name(currency_info, main_units)
             parts.append(f"{main_words} {currency_name}")
         
         if subunits > 0:
             subunit_words = self._to_cardinal(subunits)
-            if subunits == 1:
-                subunit_name = currency_info['subunit']
-            else:
-                subunit_name = currency_info.get('subunit_plural', currency_info['subunit'])
+            subunit_name = self._currency_name(currency_info, subunits, subunit=True)
             parts.append(f"{subunit_words} {subunit_name}")
         
         if not parts:
             # Completely zero amount
             parts.append(f"{self.zero} {currency_info['name']}")
         
-        result = ' and '.join(parts)
+        result = self.amount_separator.join(parts)
         
         if is_negative:
             result = f"{self.negative_prefix} {result}"
         
         return result
+    
+    def _currency_name(self, currency_info: dict, count: int, subunit: bool = False) -> str:
+        """Resolve the singular or plural unit name for a count."""
+        forms = currency_info['subunit_forms' if subunit else 'forms']
+        return forms[0] if count == 1 else forms[1]
+    
+    def _compile_currency(self, code: str, info: dict) -> dict:
+        """Resolve a currency entry, adding its (singular, plural) name pairs."""
+        compiled = super()._compile_currency(code, info)
+        compiled['forms'] = (compiled['name'], compiled['plural'])
+        compiled['subunit_forms'] = (compiled['subunit'], compiled['subunit_plural'])
+        return compiled
@@ -0,0 +1,172 @@
+"""
+Input limits for services converting untrusted numbers.
+
+Settings.MAX_DIGITS, Settings.MAX_OUTPUT_LENGTH and Settings.MAX_COST are
+checked before a conversion starts, from the size of the input alone, so
+a rejected input costs no more than counting its digits (an integer's
+bit length). Every limit is off (None) by default.
+
+    Settings.MAX_DIGITS = 60
+    Settings.MAX_OUTPUT_LENGTH = 2000
+    num2words(10 ** 100)  # raises InputLimitError
+"""
+
+import weakref
+from decimal import Decimal
+from typing import Any, Tuple, Union
+
+from .config.settings import Settings
+from .exceptions import InputLimitError
+
+_powers_of_ten = {}
+_widths: 'weakref.WeakKeyDictionary[Any, Tuple[int, int, int, int]]' = weakref.WeakKeyDictionary()
+
+
+def limits_active() -> bool:
+    """Whether any input limit is configured."""
+    return (Settings.MAX_DIGITS is not None or Settings.MAX_OUTPUT_LENGTH is not None
+            or Settings.MAX_COST is not None)
+
+
+def _power_of_ten(exponent: int) -> int:
+    power = _powers_of_ten.get(exponent)
+    if power is None:
+        if len(_powers_of_ten) > 64:
+            _powers_of_ten.clear()
+        power = _powers_of_ten[exponent] = 10 ** exponent
+    return power
+
+
+def _integer_digits(number: int) -> int:
+    """Digits of a non-negative integer, or up to two more (never fewer)."""
+    # floor(bits * log10(2)) + 1, without formatting the number; 0.30103 is
+    # just above log10(2), so the estimate can only round up
+    return number.bit_length() * 30103 // 100000 + 1
+
+
+def digit_counts(number: Union[int, float, Decimal, str]) -> Tuple[int, int]:
+    """
+    Estimate the digits a conversion reads, without formatting the number.
+
+    Integer digits may be over by up to two; decimal digits are capped at
+    Settings.MAX_DECIMAL_DIGITS, the most a conversion reads.
+
+    Returns:
+        Tuple of (integer_digits, decimal_digits)
+    """
+    if isinstance(number, str):
+        return len(number), 0
+    if isinstance(number, float):
+        if number != number or number in (float('inf'), float('-inf')):
+            return 0, 0
+        if number.is_integer():
+            number = int(number)
+            return _integer_digits(-number if number < 0 else number), 0
+        # The shortest repr holds the decimals a conversion can read
+        number = Decimal(repr(number))
+    if isinstance(number, Decimal):
+        if not number.is_finite():
+            return 0, 0
+        _, digits, exponent = number.as_tuple()
+        decimals = min(max(-exponent, 0), Settings.MAX_DECIMAL_DIGITS)
+        return max(len(digits) + exponent, 1), decimals
+    return _integer_digits(-number if number < 0 else number), 0
+
+
+def estimate_cost(number: Union[int, float, Decimal, str], to: str = 'cardinal') -> int:
+    """
+    Default cost estimate of converting a number.
+
+    The unit is one step of chunk arithmetic on a number of at most three
+    digits: splitting an n-chunk integer repeatedly divides numbers that
+    are n, n - 1, ... chunks long, so the cost grows with the square of
+    its length. Fractional inputs add a step for formatting the decimals
+    and one per three decimal digits.
+
+    Examples:
+        >>> estimate_cost(123456789)
+        6
+    """
+    integer_digits, decimal_digits = digit_counts(number)
+    if to == 'digits':
+        return integer_digits + decimal_digits
+    chunks = (integer_digits + 2) // 3
+    cost = chunks * (chunks + 1) // 2
+    if decimal_digits:
+        cost += 1 + (decimal_digits + 2) // 3
+    return cost
+
+
+def _converter_widths(converter: Any) -> Tuple[int, int, int, int]:
+    """(longest chunk words, longest scale word, longest table string, smallest group)."""
+    widths = _widths.get(converter)
+    if widths is None:
+        def longest(value: Any) -> int:
+            if isinstance(value, str):
+                return len(value)
+            if isinstance(value, dict):
+                return max(map(longest, value.values()), default=0)
+            if isinstance(value, (list, tuple)):
+                return max(map(longest, value), default=0)
+            return 0
+        tables = vars(converter)
+        chunk = longest([tables.get('_cardinal_words', ()), tables.get('_ordinal_words', ())])
+        # Scale words, or "(10^n)" beyond the last one
+        scale = max(longest([tables.get(name, ()) for name in
+                             ('_scale_suffixes', '_scale_forms', 'scales', 'ordinal_scales')]), 16)
+        group = min((min(plan._sizes) for plan in converter._groupings.values()), default=3)
+        widths = _widths[converter] = (chunk, scale, longest(tables), group)
+    return widths
+
+
+def output_length_bound(converter: Any, number: Union[int, float, Decimal, str],
+                        to: str = 'cardinal') -> int:
+    """
+    Upper bound on the length of a conversion's output.
+
+    Computed from the digit counts and the longest words in the
+    converter's tables; the real output is usually much shorter.
+    """
+    integer_digits, decimal_digits = digit_counts(number)
+    chunk, scale, word, group = _converter_widths(converter)
+    # Negative prefix, decimal separator, currency names, ordinal prefix
+    fixed = 4 * (word + 1)
+    if to == 'digits':
+        return fixed + (integer_digits + decimal_digits) * (2 * word + 1)
+    chunks = -(-integer_digits // group) + 1 + -(-decimal_digits // group)
+    # Each chunk: its words, a scale word and a separator (at most " و ")
+    return fixed + chunks * (chunk + scale + 3)
+
+
+def check_limits(number: Union[int, float, Decimal, str], converter: Any,
+                 to: str = 'cardinal') -> None:
+    """
+    Reject a number over any configured limit before converting it.
+
+    Raises:
+        InputLimitError: If the number exceeds MAX_DIGITS, MAX_OUTPUT_LENGTH
+            or MAX_COST
+    """
+    max_digits = Settings.MAX_DIGITS
+    if max_digits is not None:
+        integer_digits, decimal_digits = digit_counts(number)
+        digits = integer_digits + decimal_digits
+        if max_digits < digits <= max_digits + 2 and isinstance(number, (int, float)):
+            # The integer estimate may be over: settle it exactly
+            allowed = max_digits - decimal_digits
+            if allowed >= 0 and abs(int(number)) < _power_of_ten(allowed):
+                digits = max_digits
+        if digits > max_digits:
+            raise InputLimitError('MAX_DIGITS', digits, max_digits)
+
+    max_length = Settings.MAX_OUTPUT_LENGTH
+    if max_length is not None:
+        bound = output_length_bound(converter, number, to)
+        if bound > max_length:
+            raise InputLimitError('MAX_OUTPUT_LENGTH', bound, max_length)
+
+    max_cost = Settings.MAX_COST
+    if max_cost is not None:
+        cost = (Settings.COST_ESTIMATOR or estimate_cost)(number, to)
+        if cost > max_cost:
+            raise InputLimitError('MAX_COST', cost, max_cost)
@@ -0,0 +1,109 @@
+"""
+Arabic counts with agreeing nouns.
+
+A noun counted in Arabic changes form with the count: the singular after
+one, the dual after two, the plural after three to ten, the accusative
+singular (tanween) after eleven to ninety-nine, and so on by the last two
+digits. count_noun applies the same count classes as the scale words
+(ألف، ألفان، آلاف) to any noun, and says the number in the noun's gender.
+Paradigms are compiled once into a table indexed by count class, so a
+call is a table lookup plus the number words.
+
+Examples:
+    >>> count_noun(3, ('كتاب', 'كتابان', 'كتب', 'كتاباً'))
+    'ثلاثة كتب'
+    >>> count_noun(3, {'singular': 'ساعة', 'dual': 'ساعتان', 'plural': 'ساعات', 'gender': 'f'})
+    'ثلاث ساعات'
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Mapping, Sequence, Tuple, Union
+
+from .converter import NumberConverter
+
+NounForms = Union[Sequence[str], Mapping[str, str]]
+
+
+@lru_cache(maxsize=1024)
+def _compile(forms: Tuple[str, ...]) -> Tuple[str, ...]:
+    return NumberConverter._converter_classes['arabic'].compile_noun(forms)
+
+
+@lru_cache(maxsize=1024)
+def _compile_mapping(items: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    return NumberConverter._converter_classes['arabic'].compile_noun(dict(items))
+
+
+def _paradigm(noun_forms: NounForms) -> Tuple[str, ...]:
+    """Compiled paradigm of a noun, cached by its forms."""
+    try:
+        if isinstance(noun_forms, Mapping):
+            return _compile_mapping(tuple(sorted(noun_forms.items())))
+        return _compile(tuple(noun_forms))
+    except TypeError:
+        # Unhashable forms are invalid; compiling says why
+        return NumberConverter._converter_classes['arabic'].compile_noun(noun_forms)
+
+
+def _check_count(number: int) -> None:
+    if not isinstance(number, int) or isinstance(number, bool):
+        raise TypeError(f"Count must be int, got {type(number).__name__}")
+    if number < 0:
+        raise ValueError(f"Count must not be negative, got {number}")
+
+
+def count_noun(n: int, noun_forms: NounForms) -> str:
+    """
+    Say a count followed by an Arabic noun agreeing with it.
+
+    Args:
+        n: Non-negative integer count
+        noun_forms: (singular, dual, plural[, accusative singular][, gender])
+            or a mapping with the keys singular, dual, plural, accusative and
+            gender; gender is the noun's, 'm' (default) or 'f'
+
+    Returns:
+        str: The count in words and the noun; for a count of one the noun
+        comes first, as in currency amounts, and a count of two is the dual
+        noun alone
+
+    Raises:
+        TypeError: If n is not an integer
+        ValueError: If n is negative, a noun form is missing or the gender
+            is invalid
+
+    Examples:
+        >>> count_noun(1, ('يوم', 'يومان', 'أيام', 'يوماً'))
+        'يوم واحد'
+        >>> count_noun(15, ('يوم', 'يومان', 'أيام', 'يوماً'))
+        'خمسة عشر يوماً'
+    """
+    return count_nouns([n], noun_forms)[0]
+
+
+def count_nouns(numbers: Iterable[int], noun_forms: NounForms) -> List[str]:
+    """
+    Say many counts of the same noun.
+
+    The paradigm is resolved once for the whole batch and repeated counts
+    are said once.
+
+    Returns:
+        List of results in input order
+
+    Examples:
+        >>> count_nouns([2, 11], {'singular': 'ملف', 'dual': 'ملفان', 'plural': 'ملفات'})
+        ['ملفان', 'أحد عشر ملف']
+    """
+    noun = _paradigm(noun_forms)
+    NumberConverter._initialize_converters()
+    converter = NumberConverter._converters['arabic']
+    results: List[str] = []
+    memo = {}
+    for number in numbers:
+        _check_count(number)
+        words = memo.get(number)
+        if words is None:
+            words = memo[number] = converter.count_noun(number, noun)
+        results.append(words)
+    return results
@@ -0,0 +1,162 @@
+"""
+Multi-core conversion of a single huge integer.
+
+Once a number is written out in decimal, its digit groups render
+independently: only the scale word of each group and the separators
+between them depend on position. parallel_words cuts the digits into
+contiguous runs of whole groups, renders each run in a worker process
+with the scale index of its first group, and joins the results. The
+output is identical to num2words for the same number.
+
+Converting a huge int to decimal digits is itself quadratic in CPython
+before 3.12 (and capped by sys.set_int_max_str_digits), so ints are
+converted by splitting their bits and recombining with the decimal
+module, whose arithmetic on huge numbers is subquadratic.
+"""
+
+import decimal
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .converter import NumberConverter
+from .limits import check_limits, limits_active
+from .streaming import GroupRenderer, _DigitReader
+
+# Below this many digits a number is rendered in the calling process
+PARALLEL_THRESHOLD = 100_000
+SEGMENTS_PER_WORKER = 4  # Smaller runs even out the workers' finishing times
+_DIRECT_BITS = 2048  # Ints this small are converted by Decimal directly
+
+
+def parallel_words(number: Union[int, str], lang: str = 'en', workers: Optional[int] = None,
+                   executor: Optional[Executor] = None, **kwargs) -> str:
+    """
+    Convert one huge integer to cardinal words using several processes.
+
+    Args:
+        number: Integer, or its digit string (see stream_words for the
+            accepted characters)
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        workers: Worker processes to start (default: os.cpu_count()); 1
+            renders in the calling process
+        executor: Existing executor to submit the runs to, instead of a
+            pool started and shut down for this call
+        **kwargs: gender (Arabic), grouping (English), style or overlay
+
+    Returns:
+        Number in words, identical to num2words
+
+    Raises:
+        TypeError: If number is neither an int nor a str
+        ValueError: If the options or digits are invalid, or the grouping is nested
+        InputLimitError: If the number exceeds a limit set in Settings
+
+    Examples:
+        >>> parallel_words(10 ** 6 + 21)
+        'one million twenty-one'
+    """
+    NumberConverter._initialize_converters()
+    converter, _, options = NumberConverter._resolve(lang, 'cardinal', dict(kwargs))
+    renderer = GroupRenderer(converter, options)
+    if isinstance(number, bool) or not isinstance(number, (int, str)):
+        raise TypeError(f"Expected an int or a digit string, got {type(number).__name__}")
+    if isinstance(number, int):
+        if limits_active():
+            check_limits(number, converter, 'cardinal')
+        negative = number < 0
+        digits = decimal_digits(-number if negative else number)
+    else:
+        reader = _DigitReader(number, len(number) or 1)
+        reader.count()
+        digits = ''.join(reader.blocks()).lstrip('0') or '0'
+        negative = reader.negative
+        if limits_active():
+            # The limits read a digit string's length as its digit count
+            check_limits(digits, converter, 'cardinal')
+
+    significant = digits.lstrip('0')
+    if not significant:
+        return renderer.zero
+    digits = significant
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, got {workers}")
+
+    if executor is None and (workers == 1 or len(digits) < PARALLEL_THRESHOLD):
+        scale_index, size = renderer.layout(len(digits))
+        words = renderer.separator.join(renderer.render(digits, scale_index, size)[0])
+    else:
+        segments = _segments(renderer, len(digits), workers * SEGMENTS_PER_WORKER)
+        tasks = [(lang, kwargs, digits[start:end], scale_index, size, start > 0)
+                 for start, end, scale_index, size in segments]
+        if executor is None:
+            with ProcessPoolExecutor(workers) as pool:
+                parts = list(pool.map(_render_segment, *zip(*tasks)))
+        else:
+            parts = list(executor.map(_render_segment, *zip(*tasks)))
+        words = renderer.separator.join(part for part in parts if part)
+    return renderer.negative + words if negative else words
+
+
+def _segments(renderer: GroupRenderer, length: int, count: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Cut a number into runs of whole groups.
+
+    Returns:
+        List of (start, end, scale_index, size): the digit slice of each run,
+        and the scale index and size of its first group
+    """
+    top, top_size = renderer.layout(length)
+    exponent = renderer.plan.exponent
+
+    def start(scale_index: int) -> int:
+        return 0 if scale_index == top else length - exponent(scale_index + 1)
+
+    groups = top + 1
+    count = min(count, groups)
+    bounds = [top - groups * part // count for part in range(count + 1)]
+    return [(start(first), start(last), first, top_size if first == top else renderer.group_size(first))
+            for first, last in zip(bounds, bounds[1:])]
+
+
+def _render_segment(lang: str, options: Dict[str, Any], digits: str, scale_index: int,
+                    size: int, higher: bool) -> str:
+    """Render a run of groups in a worker process."""
+    NumberConverter._initialize_converters()
+    converter, _, options = NumberConverter._resolve(lang, 'cardinal', dict(options))
+    renderer = GroupRenderer(converter, options)
+    return renderer.separator.join(renderer.render(digits, scale_index, size, higher)[0])
+
+
+def decimal_digits(number: int) -> str:
+    """
+    Decimal digits of a non-negative integer, in subquadratic time.
+
+    The bits are split in halves recursively and the halves recombined as
+    Decimals (high * 2**k + low), so the work is done by the decimal
+    module's fast multiplication rather than int-to-str conversion.
+    """
+    if number.bit_length() <= _DIRECT_BITS:
+        return str(number)
+    powers: Dict[int, decimal.Decimal] = {}
+    with decimal.localcontext() as context:
+        context.prec = decimal.MAX_PREC
+        context.Emax = decimal.MAX_EMAX
+        two = decimal.Decimal(2)
+
+        def power(exponent: int) -> decimal.Decimal:
+            result = powers.get(exponent)
+            if result is None:
+                result = powers[exponent] = two ** exponent
+            return result
+
+        def convert(value: int, bits: int) -> decimal.Decimal:
+            if bits <= _DIRECT_BITS:
+                return decimal.Decimal(value)
+            half = bits >> 1
+            high = value >> half
+            return convert(value - (high << half), half) + convert(high, bits - half) * power(half)
+
+        return str(convert(number, number.bit_length()))
@@ -0,0 +1,416 @@
+"""
+Per-stage profiling for numwordify conversion hot paths.
+
+Runs a representative (or user-supplied) workload under cProfile and
+attributes the time to the stages of a conversion: validation, decimal
+splitting, digit reading, chunk decomposition, scale-word selection,
+currency-name resolution and string assembly. Allocation counts are measured in a
+separate tracemalloc pass so they do not skew the timings.
+
+Usage:
+    python -m numwordify.profile
+    python -m numwordify.profile --lang ar --to currency --currency KWD
+    python -m numwordify.profile --workload numbers.txt --pstats out.prof
+"""
+
+import argparse
+import cProfile
+import gc
+import io
+import os
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .converter import convert_batch, num2words
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+HARNESS_FILE = os.path.abspath(__file__)
+
+STAGES = (
+    'validation',
+    'decimal splitting',
+    'digit reading',
+    'chunk decomposition',
+    'scale words',
+    'currency names',
+    'string assembly',
+)
+
+# Package functions that make up a stage; every other package function
+# counts as string assembly.
+STAGE_FUNCTIONS = {
+    '_handle_decimal': 'decimal splitting',
+    '_read_digits': 'digit reading',
+    '_split_chunks': 'chunk decomposition',
+    'split_chunks': 'chunk decomposition',
+    '_scale_suffix': 'scale words',
+    '_get_scale_word': 'scale words',
+    '_currency_name': 'currency names',
+    '_subunit_name': 'currency names',
+}
+
+FuncKey = Tuple[str, int, str]
+
+
+def representative_workload(size: int = 5000, seed: int = 0) -> List[Union[int, float]]:
+    """
+    Build a deterministic mix of the inputs seen in production.
+
+    Mostly small and medium integers, with some large integers,
+    two-decimal amounts, long decimals and negatives.
+    """
+    rng = random.Random(seed)
+    numbers: List[Union[int, float]] = []
+    for _ in range(size):
+        kind = rng.random()
+        if kind < 0.4:
+            number: Union[int, float] = rng.randrange(1000)
+        elif kind < 0.7:
+            number = rng.randrange(10 ** rng.randint(4, 9))
+        elif kind < 0.8:
+            number = rng.randrange(10 ** rng.randint(10, 30))
+        elif kind < 0.95:
+            number = round(rng.uniform(0, 100000), 2)
+        else:
+            number = round(rng.uniform(0, 1000), rng.randint(3, 8))
+        if rng.random() < 0.05:
+            number = -number
+        numbers.append(number)
+    return numbers
+
+
+def load_workload(path: str) -> List[Union[int, float]]:
+    """Read one number per line; blank lines and '#' comments are skipped."""
+    numbers: List[Union[int, float]] = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            token = line.strip()
+            if not token or token.startswith('#'):
+                continue
+            try:
+                numbers.append(int(token))
+            except ValueError:
+                numbers.append(float(token))
+    return numbers
+
+
+def _stage_of(func: FuncKey) -> Optional[str]:
+    """Map a profiled function to its stage, or None if it is not ours."""
+    filename, _, name = func
+    if not filename.startswith(PACKAGE_DIR) or filename == HARNESS_FILE:
+        return None
+    if name.startswith('validate_'):
+        return 'validation'
+    return STAGE_FUNCTIONS.get(name, 'string assembly')
+
+
+def stage_breakdown(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    Attribute profiled self-time to conversion stages.
+
+    Time spent in builtins and other non-package functions is charged to
+    the package function that called them, so e.g. ``divmod`` counts as
+    chunk decomposition and ``str.join`` as string assembly.
+
+    Returns:
+        Dictionary mapping each stage (plus 'other') to seconds
+    """
+    totals = {stage: 0.0 for stage in STAGES}
+    totals['other'] = 0.0
+    raw = stats.stats  # type: ignore[attr-defined]
+    for func, (_, _, tottime, _, callers) in raw.items():
+        stage = _stage_of(func)
+        if stage is not None:
+            totals[stage] += tottime
+            continue
+        # Split foreign self-time between callers by their share of it
+        caller_time = sum(entry[2] for entry in callers.values())
+        if not caller_time:
+            continue
+        for caller, entry in callers.items():
+            if caller[0] == HARNESS_FILE:
+                continue
+            caller_stage = _stage_of(caller) or 'other'
+            totals[caller_stage] += tottime * entry[2] / caller_time
+    return totals
+
+
+def measure_allocations(convert: Callable[[Any], str],
+                        numbers: Iterable[Union[int, float]]) -> Dict[str, float]:
+    """
+    Count memory allocations made while converting a workload.
+
+    Returns:
+        Dictionary with retained blocks/bytes (the results), the traced peak
+        and the number of garbage collections triggered
+    """
+    numbers = list(numbers)
+    gc.collect()
+    collections_before = sum(gen['collections'] for gen in gc.get_stats())
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        results = [convert(number) for number in numbers]
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    collections = sum(gen['collections'] for gen in gc.get_stats()) - collections_before
+    diff = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+    calls = max(len(results), 1)
+    return {
+        'calls': len(results),
+        'retained_blocks': blocks,
+        'retained_bytes': size,
+        'blocks_per_call': blocks / calls,
+        'bytes_per_call': size / calls,
+        'peak_bytes': peak,
+        'gc_collections': collections,
+    }
+
+
+def measure_call_allocations(convert: Callable[[Any], str],
+                             numbers: Iterable[Union[int, float]]) -> Dict[str, float]:
+    """
+    Measure the memory single conversions allocate while they run.
+
+    Each call runs with the traced peak reset and its result dropped, so
+    the peak is the most memory one call held at once: intermediate
+    strings, lists and tuples plus the result itself. Whatever is still
+    allocated after all the calls is reported as leaked.
+
+    Returns:
+        Dictionary with the largest and mean per-call peak bytes and the
+        leaked blocks and bytes
+    """
+    numbers = list(numbers)
+    convert(numbers[0] if numbers else 0)
+    gc.collect()
+    reset_peak = getattr(tracemalloc, 'reset_peak', None)  # Python 3.9+
+    peaks = []
+    if reset_peak is None:
+        # Without reset_peak each call is traced on its own, and the leak
+        # check below runs the calls again
+        for number in numbers:
+            tracemalloc.start()
+            try:
+                convert(number)
+                peaks.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        number = None
+        for number in numbers:
+            if reset_peak is None:
+                convert(number)
+                continue
+            reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            convert(number)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - start)
+        del number
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # Only memory allocated by the package itself counts as leaked
+    leaked = [stat for stat in after.compare_to(before, 'filename')
+              if _stage_of((stat.traceback[0].filename, 0, '')) is not None]
+    return {
+        'calls': len(peaks),
+        'max_peak_bytes': max(peaks, default=0),
+        'mean_peak_bytes': sum(peaks) / max(len(peaks), 1),
+        'leaked_blocks': sum(stat.count_diff for stat in leaked),
+        'leaked_bytes': sum(stat.size_diff for stat in leaked),
+    }
+
+
+def batch_peak_memory(numbers: Iterable[Union[int, float]], lang: str = 'en',
+                      to: str = 'cardinal', **kwargs) -> Dict[str, float]:
+    """
+    Measure peak memory of one convert_batch call.
+
+    The input list exists before tracing starts, so the peak covers the
+    result list, the result strings and the conversion's working memory.
+
+    Returns:
+        Dictionary with the item count, peak bytes, peak bytes per item and
+        the traced wall time
+    """
+    numbers = list(numbers)
+    convert_batch(numbers[:1] or [0], lang=lang, to=to, **kwargs)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        results = convert_batch(numbers, lang=lang, to=to, **kwargs)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    items = max(len(results), 1)
+    del results
+    return {
+        'items': len(numbers),
+        'peak_bytes': peak,
+        'bytes_per_item': peak / items,
+        'seconds': seconds,
+    }
+
+
+def profile_conversions(numbers: Iterable[Union[int, float]], lang: str = 'en',
+                        to: str = 'cardinal', **kwargs) -> Dict[str, Any]:
+    """
+    Profile converting a workload in one language and form.
+
+    Args:
+        numbers: Numbers to convert
+        lang: Language code
+        to: Conversion type
+        **kwargs: Passed through to num2words (currency, gender, ...)
+
+    Returns:
+        Dictionary with the unprofiled wall time, per-stage seconds,
+        the pstats.Stats object and allocation counts
+    """
+    numbers = list(numbers)
+
+    def convert(number):
+        return num2words(number, lang=lang, to=to, **kwargs)
+
+    # Warm up so lazy initialization does not land in the measurements
+    convert(numbers[0] if numbers else 0)
+
+    start = time.perf_counter()
+    for number in numbers:
+        convert(number)
+    wall = time.perf_counter() - start
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for number in numbers:
+        convert(number)
+    profiler.disable()
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+
+    return {
+        'lang': lang,
+        'to': to,
+        'options': kwargs,
+        'calls': len(numbers),
+        'seconds': wall,
+        'stages': stage_breakdown(stats),
+        'stats': stats,
+        'allocations': measure_allocations(convert, numbers),
+    }
+
+
+def format_report(result: Dict[str, Any], top: int = 0) -> str:
+    """Render a profiling result as a plain-text report."""
+    options = ''.join(f", {key}={value}" for key, value in result['options'].items())
+    calls = max(result['calls'], 1)
+    lines = [
+        f"== lang={result['lang']} to={result['to']}{options} ==",
+        f"{result['calls']} conversions in {result['seconds'] * 1000:.1f} ms "
+        f"({result['seconds'] / calls * 1e6:.2f} us/call, unprofiled)",
+        "",
+        f"{'stage':<22}{'seconds':>10}{'share':>9}",
+    ]
+    stages = result['stages']
+    total = sum(stages.values()) or 1.0
+    for stage, seconds in stages.items():
+        lines.append(f"{stage:<22}{seconds:>10.4f}{seconds / total:>9.1%}")
+
+    allocations = result['allocations']
+    lines.extend([
+        "",
+        f"allocations: {allocations['blocks_per_call']:.1f} blocks / "
+        f"{allocations['bytes_per_call']:.0f} bytes retained per call, "
+        f"peak {allocations['peak_bytes'] / 1024:.1f} KiB, "
+        f"{allocations['gc_collections']} gc collections",
+    ])
+
+    if top:
+        stream = io.StringIO()
+        result['stats'].stream = stream
+        result['stats'].sort_stats('tottime').print_stats(top)
+        lines.extend(["", stream.getvalue().rstrip()])
+
+    return '\n'.join(lines)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m numwordify.profile',
+        description='Break down numwordify conversion time by stage.',
+    )
+    parser.add_argument('--lang', nargs='+', default=['en', 'ar'],
+                        help='languages to profile (default: en ar)')
+    parser.add_argument('--to', nargs='+', default=['cardinal', 'ordinal', 'currency'],
+                        help='conversion types to profile (default: all)')
+    parser.add_argument('--currency', help='currency code for currency conversion')
+    parser.add_argument('--gender', help="Arabic gender ('m' or 'f')")
+    parser.add_argument('--workload', help='file with one number per line')
+    parser.add_argument('--size', type=int, default=5000,
+                        help='size of the generated workload (default: 5000)')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the generated workload')
+    parser.add_argument('--top', type=int, default=0,
+                        help='also print the N most expensive functions')
+    parser.add_argument('--pstats', metavar='PATH',
+                        help='dump cProfile stats to PATH (suffixed per language and form)')
+    parser.add_argument('--batch', type=int, metavar='N',
+                        help='also report peak memory of converting N numbers in one batch '
+                             '(e.g. 1000000)')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    args = _parser().parse_args(argv)
+    if args.workload:
+        numbers = load_workload(args.workload)
+    else:
+        numbers = representative_workload(args.size, args.seed)
+
+    kwargs: Dict[str, Any] = {}
+    if args.currency:
+        kwargs['currency'] = args.currency
+
+    reports = []
+    for lang in args.lang:
+        for to in args.to:
+            options = dict(kwargs)
+            if args.gender and lang.lower() in ('ar', 'arabic'):
+                options['gender'] = args.gender
+            if to != 'currency':
+                options.pop('currency', None)
+            result = profile_conversions(numbers, lang=lang, to=to, **options)
+            report = format_report(result, top=args.top)
+            if args.batch:
+                if args.workload:
+                    batch = (numbers * (args.batch // max(len(numbers), 1) + 1))[:args.batch]
+                else:
+                    batch = representative_workload(args.batch, args.seed)
+                memory = batch_peak_memory(batch, lang=lang, to=to, **options)
+                report += (f"\nbatch of {memory['items']}: peak {memory['peak_bytes'] / 2 ** 20:.1f} MiB "
+                           f"({memory['bytes_per_item']:.0f} bytes/item), {memory['seconds']:.1f} s traced")
+            reports.append(report)
+            if args.pstats:
+                root, ext = os.path.splitext(args.pstats)
+                result['stats'].dump_stats(f"{root}.{lang}.{to}{ext or '.prof'}")
+
+    print('\n\n'.join(reports))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Incremental conversion of integer ranges.
+
+Consecutive numbers share everything above their lowest three-digit
+chunk, so the words for the higher chunks change only once every thousand
+values. iter_range renders that prefix once per change, looks the low
+chunk up in a table filled on first use, and joins the two, like an
+odometer. Memory use is bounded by the 1000-entry tables whatever the
+length of the range.
+"""
+
+from typing import Any, Callable, Iterator, List, Optional
+
+from .converter import NumberConverter
+from .limits import check_limits, limits_active
+from .languages.base import GroupingPlan
+from .languages.english import EnglishConverter
+
+
+class _LazyTable:
+    """Words for 0-999, each rendered on first use."""
+
+    __slots__ = ('_render', '_words')
+
+    def __init__(self, render: Callable[[int], str]):
+        self._render = render
+        self._words: List[Optional[str]] = [None] * 1000
+
+    def __getitem__(self, low: int) -> str:
+        words = self._words[low]
+        if words is None:
+            words = self._words[low] = self._render(low)
+        return words
+
+
+def iter_range(start: int, stop: Optional[int] = None, step: int = 1, lang: str = 'en',
+               to: str = 'cardinal', **kwargs) -> Iterator[str]:
+    """
+    Yield the words for every number of ``range(start, stop, step)``.
+
+    Output is identical to calling num2words on each number. Cardinal and
+    ordinal ranges reuse the rendered higher chunks between numbers; other
+    conversion types are converted one by one with options validated once.
+
+    Args:
+        start: First number (or the stop value when stop is omitted)
+        stop: End of the range, exclusive
+        step: Increment, may be negative
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        to: Conversion type ('cardinal', 'ordinal', 'currency', 'digits')
+        **kwargs: Additional language-specific parameters (e.g., gender)
+
+    Returns:
+        Iterator of strings
+
+    Raises:
+        TypeError: If start, stop or step is not an integer
+        ValueError: If step is zero or the options are invalid
+        InputLimitError: If the range reaches a number over a limit set in Settings
+
+    Examples:
+        >>> list(iter_range(999, 1002))
+        ['nine hundred ninety-nine', 'one thousand', 'one thousand one']
+    """
+    if stop is None:
+        start, stop = 0, start
+    for value in (start, stop, step):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"Range bounds must be int, got {type(value).__name__}")
+    if step == 0:
+        raise ValueError("step must not be zero")
+
+    NumberConverter._initialize_converters()
+    converter, to, options = NumberConverter._resolve(lang, to, dict(kwargs))
+    numbers = range(start, stop, step)
+    if limits_active() and numbers:
+        # The largest magnitude in the range bounds every number in it
+        check_limits(max(abs(numbers[0]), abs(numbers[-1])), converter, to)
+
+    plan = converter._grouping_plan(options.get('grouping'))
+    if to not in ('cardinal', 'ordinal') or plan.unit != 1000:
+        return (converter.convert(number, to=to, **options) for number in numbers)
+    if isinstance(converter, EnglishConverter):
+        return _english_odometer(converter, numbers, to == 'ordinal', plan)
+    gender = converter._settings.validate_gender(options.get('gender', 'm'))
+    return _arabic_odometer(converter, numbers, to == 'ordinal', gender)
+
+
+def _english_odometer(converter: Any, numbers: range, ordinal: bool,
+                      plan: GroupingPlan) -> Iterator[str]:
+    def cardinal(number: int) -> str:
+        return converter._to_cardinal(number, plan)
+
+    low_cardinal = _LazyTable(cardinal)
+    low_ordinal = _LazyTable(converter._to_ordinal)
+    small = low_ordinal if ordinal else low_cardinal
+    # After higher chunks the units chunk may take the style's conjunction
+    final_cardinal, final_ordinal = converter._final_cardinal_words, converter._final_ordinal_words
+    negative = f"{converter.negative_prefix} "
+
+    cached_high = -1
+    prefix = ''
+    top_chunk = 0
+    for number in numbers:
+        high, low = divmod(-number if number < 0 else number, 1000)
+        if high == 0:
+            words = small[low]
+        else:
+            if high != cached_high:
+                cached_high = high
+                prefix = cardinal(high * 1000)
+                top_chunk = plan.split_chunks(high * 1000)[0][0]
+            if low == 0:
+                words = prefix
+            elif ordinal and low == top_chunk:
+                # The ordinal form lands on the units chunk only when it
+                # repeats the most significant chunk (see _to_ordinal)
+                words = f"{prefix} {final_ordinal[low]}"
+            else:
+                words = f"{prefix} {final_cardinal[low]}"
+        yield f"{negative}{words}" if number < 0 else words
+
+
+def _arabic_odometer(converter: Any, numbers: range, ordinal: bool, gender: str) -> Iterator[str]:
+    def cardinal(number: int) -> str:
+        return converter._to_cardinal(number, gender)
+
+    low_cardinal = _LazyTable(cardinal)
+    ordinal_prefix = converter.ordinal_prefix if ordinal else ''
+    if ordinal:
+        small = _LazyTable(lambda low: f"{ordinal_prefix}{cardinal(low)}" if low else converter.zero)
+    else:
+        small = low_cardinal
+    separator = f" {converter.conjunction} "
+    negative = f"{converter.negative_prefix} "
+
+    cached_high = -1
+    prefix = ''
+    for number in numbers:
+        high, low = divmod(-number if number < 0 else number, 1000)
+        if high == 0:
+            words = small[low]
+        else:
+            if high != cached_high:
+                cached_high = high
+                prefix = f"{ordinal_prefix}{cardinal(high * 1000)}"
+            words = f"{prefix}{separator}{low_cardinal[low]}" if low else prefix
+        yield f"{negative}{words}" if number < 0 else words
+
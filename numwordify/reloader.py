@@ -0,0 +1,87 @@
+"""
+Background reloading of language data.
+
+LanguageDataWatcher polls the modification times of the language JSON
+files and calls NumberConverter.reload() when one changes. The reload
+builds new converters off to the side and swaps them in atomically, so
+conversions running on other threads never wait for it.
+
+Example:
+    >>> watcher = LanguageDataWatcher(interval=2.0).start()
+    >>> ...
+    >>> watcher.stop()
+"""
+
+import threading
+from typing import Callable, Iterable, List, Optional
+
+from .converter import NumberConverter
+
+
+class LanguageDataWatcher:
+    """
+    Reload language data whenever its file changes.
+
+    Args:
+        interval: Seconds between checks
+        languages: Languages to watch (default: all supported)
+        on_reload: Called with the names of the reloaded languages
+        on_error: Called with the exception when a reload fails; the
+            current data stays in place and the next change is retried
+    """
+
+    def __init__(self, interval: float = 1.0, languages: Optional[Iterable[str]] = None,
+                 on_reload: Optional[Callable[[List[str]], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        self.interval = interval
+        self.languages = list(languages) if languages is not None else None
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.reloads = 0
+        self.last_error: Optional[Exception] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> List[str]:
+        """Reload changed languages now; return the names reloaded."""
+        try:
+            reloaded = NumberConverter.reload(self.languages)
+        except (OSError, ValueError) as e:
+            self.last_error = e
+            if self.on_error is not None:
+                self.on_error(e)
+            return []
+        if reloaded:
+            self.reloads += 1
+            if self.on_reload is not None:
+                self.on_reload(reloaded)
+        return reloaded
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> 'LanguageDataWatcher':
+        """Start polling in a daemon thread."""
+        if self._thread is None or not self._thread.is_alive():
+            # Record the current files so only later changes trigger a reload
+            NumberConverter._initialize_converters()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='numwordify-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> 'LanguageDataWatcher':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
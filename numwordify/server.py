@@ -0,0 +1,350 @@
+"""
+Reference ASGI conversion service.
+
+A dependency-free ASGI application exposing numwordify over HTTP:
+
+    POST /convert          {"number": 42, "lang": "ar"}
+    POST /convert/batch    {"numbers": [1, 2, 3], "lang": "en", "to": "currency", "currency": "USD"}
+    POST /convert/stream   NDJSON in, NDJSON out (one number or object per line)
+    GET  /health
+    GET  /metrics          Prometheus text format
+
+Conversions go through a shared ResultCache, and bulk work runs in a thread
+pool behind a concurrency limit so large batches cannot starve the event
+loop or each other.
+
+Run locally (requires uvicorn):
+    python -m numwordify.server --port 8000
+    uvicorn numwordify.server:app --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from . import __version__
+from .cache import ResultCache
+from .config.settings import Settings
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Request fields forwarded to num2words as keyword options
+OPTION_FIELDS = ('currency', 'gender', 'style', 'grouping', 'minor_units')
+# Other fields a request object may hold
+REQUEST_FIELDS = ('number', 'numbers', 'lang', 'to')
+
+
+class HTTPError(Exception):
+    """Error answered with a JSON body and the given status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ConversionServer:
+    """
+    ASGI application serving conversions.
+
+    Args:
+        cache: Result cache shared by all requests (a new one by default)
+        max_concurrency: Maximum number of bulk conversions running at once
+        max_batch_size: Maximum numbers accepted by one batch request
+        max_body_bytes: Maximum request body size for JSON endpoints
+        stream_batch_size: Lines converted together on the NDJSON endpoint
+        snapshot: Cache snapshot file loaded at startup (when present and
+            made by this version and data) and saved at shutdown
+    """
+
+    def __init__(self, cache: Optional[ResultCache] = None, max_concurrency: int = 4,
+                 max_batch_size: int = 10000, max_body_bytes: int = 10 * 1024 * 1024,
+                 stream_batch_size: int = 1000, snapshot: Optional[str] = None):
+        self.cache = cache if cache is not None else ResultCache()
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_body_bytes = max_body_bytes
+        self.stream_batch_size = stream_batch_size
+        self.snapshot = snapshot
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.metrics: Dict[str, float] = {
+            'requests_total': 0,
+            'errors_total': 0,
+            'numbers_converted_total': 0,
+            'conversion_seconds_total': 0.0,
+            'bulk_in_flight': 0,
+        }
+        self.routes: Dict[Tuple[str, str], Callable[..., Awaitable[None]]] = {
+            ('GET', '/health'): self.health,
+            ('GET', '/metrics'): self.metrics_route,
+            ('POST', '/convert'): self.convert,
+            ('POST', '/convert/batch'): self.convert_batch,
+            ('POST', '/convert/stream'): self.convert_stream,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        self.metrics['requests_total'] += 1
+        path = scope['path'].rstrip('/') or '/'
+        handler = self.routes.get((scope['method'], path))
+        try:
+            if handler is None:
+                if any(route_path == path for _, route_path in self.routes):
+                    raise HTTPError(405, f"Method {scope['method']} not allowed")
+                raise HTTPError(404, f"Not found: {path}")
+            await handler(scope, receive, send)
+        except HTTPError as e:
+            self.metrics['errors_total'] += 1
+            await self._send_json(send, {'error': e.message}, status=e.status)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                # Build the converters before the first request arrives
+                self.cache.convert(0)
+                if self.snapshot is not None and os.path.exists(self.snapshot):
+                    try:
+                        self.cache.load(self.snapshot)
+                    except ValueError:
+                        pass  # A damaged snapshot only means a cold start
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.snapshot is not None:
+                    self.cache.save(self.snapshot)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    # Helpers
+
+    async def _send_response(self, send: Send, body: bytes, status: int = 200,
+                             content_type: bytes = b'application/json') -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', content_type),
+                        (b'content-length', str(len(body)).encode())],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _send_json(self, send: Send, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        await self._send_response(send, body, status, b'application/json; charset=utf-8')
+
+    async def _read_json(self, receive: Receive) -> Any:
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body.extend(message.get('body', b''))
+            if len(body) > self.max_body_bytes:
+                raise HTTPError(413, f"Request body exceeds {self.max_body_bytes} bytes")
+            more_body = message.get('more_body', False)
+        try:
+            return json.loads(body or b'{}')
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON: {e}")
+
+    @staticmethod
+    def _options(payload: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Extract (lang, to, kwargs) from a request object.
+
+        Raises:
+            ValueError: If a field is unknown or not a scalar of the right type
+        """
+        unknown = sorted(set(payload) - set(REQUEST_FIELDS) - set(OPTION_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        merged = dict(defaults or {})
+        merged.update(payload)
+        lang, to = merged.get('lang', 'en'), merged.get('to', 'cardinal')
+        for field, value in (('lang', lang), ('to', to)):
+            if not isinstance(value, str):
+                raise ValueError(f"Field '{field}' must be a string")
+        kwargs = {field: merged[field] for field in OPTION_FIELDS if merged.get(field) is not None}
+        for field, value in kwargs.items():
+            if not isinstance(value, (str, int, float)):
+                raise ValueError(f"Field '{field}' must be a string, number or boolean")
+        return lang, to, kwargs
+
+    async def _run_bulk(self, func: Callable[[], Any]) -> Any:
+        """Run conversion work in a thread, behind the concurrency limit."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.metrics['bulk_in_flight'] += 1
+            start = time.perf_counter()
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, func)
+            finally:
+                self.metrics['conversion_seconds_total'] += time.perf_counter() - start
+                self.metrics['bulk_in_flight'] -= 1
+
+    # Routes
+
+    async def health(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self._send_json(send, {'status': 'ok', 'version': __version__})
+
+    async def metrics_route(self, scope: Scope, receive: Receive, send: Send) -> None:
+        lines = []
+        for name, value in self.metrics.items():
+            lines.append(f"numwordify_{name} {value}")
+        for name, value in self.cache.stats().items():
+            lines.append(f"numwordify_cache_{name} {value}")
+        body = ('\n'.join(lines) + '\n').encode('utf-8')
+        await self._send_response(send, body, content_type=b'text/plain; version=0.0.4')
+
+    async def convert(self, scope: Scope, receive: Receive, send: Send) -> None:
+        payload = await self._read_json(receive)
+        if not isinstance(payload, dict) or 'number' not in payload:
+            raise HTTPError(400, "Expected an object with a 'number' field")
+        try:
+            lang, to, kwargs = self._options(payload)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        try:
+            result = self.cache.convert(payload['number'], lang=lang, to=to, **kwargs)
+        except (ValueError, TypeError, OverflowError) as e:
+            raise HTTPError(400, str(e))
+        self.metrics['numbers_converted_total'] += 1
+        await self._send_json(send, {'result': result})
+
+    async def convert_batch(self, scope: Scope, receive: Receive, send: Send) -> None:
+        payload = await self._read_json(receive)
+        if not isinstance(payload, dict) or not isinstance(payload.get('numbers'), list):
+            raise HTTPError(400, "Expected an object with a 'numbers' list")
+        numbers = payload['numbers']
+        if len(numbers) > self.max_batch_size:
+            raise HTTPError(413, f"Batch exceeds {self.max_batch_size} numbers")
+        try:
+            lang, to, kwargs = self._options(payload)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        try:
+            results = await self._run_bulk(
+                lambda: self.cache.convert_batch(numbers, lang=lang, to=to, **kwargs))
+        except (ValueError, TypeError, OverflowError) as e:
+            raise HTTPError(400, str(e))
+        self.metrics['numbers_converted_total'] += len(numbers)
+        await self._send_json(send, {'results': results})
+
+    async def convert_stream(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Convert NDJSON as it arrives.
+
+        Each input line is a bare number or an object with a 'number' field
+        and optional lang/to and option overrides; query parameters set the
+        defaults. Each output line is {"result": ...} or {"error": ...}.
+        """
+        defaults: Dict[str, Any] = dict(parse_qsl(scope.get('query_string', b'').decode('utf-8')))
+        for field in OPTION_FIELDS:
+            if field in defaults:
+                defaults[field] = Settings.parse_option_value(defaults[field])
+        try:
+            self._options(defaults)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', b'application/x-ndjson; charset=utf-8')],
+        })
+
+        buffer = b''
+        pending: List[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            buffer += message.get('body', b'')
+            more_body = message.get('more_body', False)
+            *lines, buffer = buffer.split(b'\n')
+            pending.extend(line for line in lines if line.strip())
+            if not more_body and buffer.strip():
+                pending.append(buffer)
+            while len(pending) >= self.stream_batch_size or (pending and not more_body):
+                chunk = pending[:self.stream_batch_size]
+                del pending[:self.stream_batch_size]
+                body = await self._run_bulk(lambda: self._convert_lines(chunk, defaults))
+                await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    def _convert_lines(self, lines: List[bytes], defaults: Dict[str, Any]) -> bytes:
+        """Convert NDJSON lines, batching runs of lines that share options."""
+        outputs: List[Dict[str, Any]] = [{} for _ in lines]
+        groups: Dict[Tuple[str, str, Tuple[Any, ...]], List[Tuple[int, Any]]] = {}
+        for i, line in enumerate(lines):
+            try:
+                item = json.loads(line)
+            except ValueError as e:
+                outputs[i] = {'error': f"Invalid JSON: {e}"}
+                continue
+            if not isinstance(item, dict):
+                item = {'number': item}
+            try:
+                lang, to, kwargs = self._options(item, defaults)
+            except ValueError as e:
+                outputs[i] = {'error': str(e)}
+                continue
+            groups.setdefault((lang, to, tuple(sorted(kwargs.items()))), []).append((i, item.get('number')))
+
+        for (lang, to, options), entries in groups.items():
+            kwargs = dict(options)
+            try:
+                results = self.cache.convert_batch([n for _, n in entries], lang=lang, to=to, **kwargs)
+                for (i, _), result in zip(entries, results):
+                    outputs[i] = {'result': result}
+            except (ValueError, TypeError, OverflowError):
+                # Fall back to per-line conversion to report the bad lines only
+                for i, number in entries:
+                    try:
+                        outputs[i] = {'result': self.cache.convert(number, lang=lang, to=to, **kwargs)}
+                    except (ValueError, TypeError, OverflowError) as e:
+                        outputs[i] = {'error': str(e)}
+
+        self.metrics['numbers_converted_total'] += len(lines)
+        return ''.join(json.dumps(output, ensure_ascii=False) + '\n' for output in outputs).encode('utf-8')
+
+
+def create_app(**options: Any) -> ConversionServer:
+    """Create a conversion server; see ConversionServer for the options."""
+    return ConversionServer(**options)
+
+
+app = create_app()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the service with uvicorn."""
+    parser = argparse.ArgumentParser(prog='python -m numwordify.server',
+                                     description='Run the numwordify conversion service.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args(argv)
+    try:
+        import uvicorn
+    except ImportError:
+        print("uvicorn is required to run the server: pip install uvicorn", file=sys.stderr)
+        return 1
+    uvicorn.run('numwordify.server:app', host=args.host, port=args.port, workers=args.workers)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Eager initialization for pre-fork servers.
+
+Converters and language data are normally built on the first conversion,
+so every forked worker (gunicorn, uWSGI, multiprocessing) pays that cost
+again and holds its own copy. Calling warmup() in the master process
+before fork builds everything once; with ``freeze=True`` the objects are
+also moved out of the garbage collector's reach, so collections in the
+workers do not touch them and their memory pages stay shared.
+
+gunicorn example (with ``preload_app = True``):
+
+    def on_starting(server):
+        numwordify.warmup(freeze=True)
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, Optional
+
+from .config.settings import Settings
+from .converter import NumberConverter
+
+
+def warmup(languages: Optional[Iterable[str]] = None, forms: Optional[Iterable[str]] = None,
+           currencies: Optional[Iterable[str]] = None, freeze: bool = False) -> Dict[str, Any]:
+    """
+    Build converters and language tables ahead of the first conversion.
+
+    Every requested form is converted once per language (and per currency
+    for 'currency'), which loads the language data and initializes every
+    code path those conversions use.
+
+    Args:
+        languages: Language codes to prepare (default: all supported)
+        forms: Conversion types to prepare (default: all)
+        currencies: Currency codes to prepare (default: every currency the
+            language defines)
+        freeze: Collect garbage and call gc.freeze() afterwards so the
+            warmed state is shared copy-on-write with forked children
+
+    Returns:
+        Report with the wall time in seconds, the memory allocated and
+        still held, the peak traced memory, the number of conversions run
+        and, when frozen, the number of frozen objects
+
+    Raises:
+        ValueError: If a language, form or currency is not supported
+
+    Examples:
+        >>> warmup(languages=['en'], forms=['cardinal'])['conversions']
+        1
+    """
+    languages = list(languages) if languages is not None else sorted(set(Settings.SUPPORTED_LANGUAGES.values()))
+    forms = [Settings.validate_conversion_type(to) for to in (forms or Settings.CONVERSION_TYPES)]
+    currencies = list(currencies) if currencies is not None else None
+
+    # Measure with the caller's tracemalloc session if one is running
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    conversions = 0
+    try:
+        NumberConverter._initialize_converters()
+        for lang in languages:
+            converter = NumberConverter._converters[Settings.validate_language(lang)]
+            for to in forms:
+                if to != 'currency':
+                    NumberConverter.convert(1, lang=lang, to=to)
+                    conversions += 1
+                    continue
+                for currency in (currencies if currencies is not None else converter.currencies):
+                    NumberConverter.convert(1.5, lang=lang, to=to, currency=currency)
+                    conversions += 1
+        seconds = time.perf_counter() - start
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    report: Dict[str, Any] = {
+        'seconds': seconds,
+        'memory_bytes': after - before,
+        'peak_bytes': max(peak - before, 0),
+        'conversions': conversions,
+        'languages': languages,
+        'forms': forms,
+        'frozen_objects': 0,
+    }
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        report['frozen_objects'] = gc.get_freeze_count()
+    return report
@@ -0,0 +1,284 @@
+"""
+Streaming conversion of one enormous integer.
+
+An integer with millions of digits costs quadratic time to parse into an
+int and holds its words in memory all at once. stream_words reads the
+digits instead, from a string, a file or an iterator of digit chunks, and
+yields the words a block at a time, most significant group first. The
+group layout follows from the digit count alone, so a first pass counts
+the digits (a seekable file is read twice, other sources are spooled to a
+temporary file) and a second pass renders them. Memory use is bounded by
+the block size whatever the length of the number.
+
+    with open('huge.txt') as digits, open('huge-words.txt', 'w') as out:
+        out.writelines(stream_words(digits))
+"""
+
+import codecs
+import tempfile
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .config.settings import Settings
+from .converter import NumberConverter
+from .exceptions import InputLimitError
+from .languages.base import DIGIT_SETS
+from .languages.english import EnglishConverter
+
+BLOCK_SIZE = 1 << 16  # Characters read from the source at a time
+
+# Arabic-Indic and Persian digits read as ASCII; whitespace, underscores
+# and thousands separators are dropped
+_TRANSLATION = {ord(char): str(value) for digits in DIGIT_SETS[1:] for value, char in enumerate(digits)}
+_TRANSLATION.update((ord(char), None) for char in ' \t\r\n\v\f_,٬')
+
+DigitSource = Union[str, bytes, Any, Iterable[Union[str, bytes]]]
+
+
+class GroupRenderer:
+    """
+    Words for runs of digit groups of one number, most significant first.
+
+    Renders any slice of the decimal digits that ends on a group boundary,
+    given the scale index of its first group, so slices can be rendered
+    separately and their words joined with ``separator``.
+    """
+
+    __slots__ = ('converter', 'plan', 'separator', 'negative', 'zero', '_english',
+                 '_cardinal_words', '_final_words', '_gender', '_sizes')
+
+    def __init__(self, converter: Any, options: dict):
+        self.converter = converter
+        self._english = isinstance(converter, EnglishConverter)
+        if self._english:
+            self.plan = converter._grouping_plan(options.get('grouping'))
+            self._cardinal_words = converter._cardinal_words
+            self._final_words = converter._final_cardinal_words
+            self.separator = ' '
+        else:
+            self._gender = Settings.validate_gender(options.get('gender', 'm'))
+            self.plan = converter._plan
+            self._cardinal_words = self._final_words = converter._cardinal_words[self._gender]
+            self.separator = converter._chunk_separator
+        if self.plan.nested:
+            raise ValueError(f"Grouping '{self.plan.name}' cannot be streamed: its top chunk is unbounded")
+        self._sizes = self.plan._sizes
+        self.negative = f"{converter.negative_prefix} "
+        self.zero = self._cardinal_words[0]
+
+    def group_size(self, scale_index: int) -> int:
+        """Digits in the group at a scale index."""
+        sizes = self._sizes
+        return sizes[scale_index] if scale_index < len(sizes) - 1 else sizes[-1]
+
+    def layout(self, length: int) -> Tuple[int, int]:
+        """
+        Place the most significant group of a number with ``length`` digits.
+
+        Returns:
+            Tuple of (scale_index, digits) of the first group
+        """
+        scale_index = 0
+        for size in self._sizes[:-1]:
+            if length <= size:
+                return scale_index, length
+            length -= size
+            scale_index += 1
+        size = self._sizes[-1]
+        groups = -(-length // size)
+        return scale_index + groups - 1, length - (groups - 1) * size
+
+    def render(self, digits: str, scale_index: int, size: int,
+               higher: bool = False) -> Tuple[List[str], int, int, int]:
+        """
+        Render the whole groups at the start of a digit string.
+
+        Args:
+            digits: ASCII digits, starting on a group boundary
+            scale_index: Scale index of the first group
+            size: Digits in the first group
+            higher: Whether a non-zero group precedes the digits
+
+        Returns:
+            Tuple of (words of the non-zero groups, digits consumed, and the
+            scale index and size of the next group)
+        """
+        words: List[str] = []
+        append = words.append
+        converter = self.converter
+        cardinal_words = self._cardinal_words
+        length = len(digits)
+        position = 0
+        while scale_index >= 0 and position + size <= length:
+            chunk = int(digits[position:position + size])
+            position += size
+            if chunk:
+                if scale_index == 0:
+                    table = self._final_words if (higher or words) else cardinal_words
+                    append(table[chunk] if chunk < 1000 else self._large_chunk(chunk))
+                elif self._english:
+                    chunk_words = cardinal_words[chunk] if chunk < 1000 else self._large_chunk(chunk)
+                    append(chunk_words + converter._scale_suffix(scale_index, plan=self.plan))
+                elif chunk == 1 or chunk == 2:
+                    append(converter._get_scale_word(chunk, scale_index))
+                else:
+                    append(f"{cardinal_words[chunk]} {converter._get_scale_word(chunk, scale_index)}")
+            scale_index -= 1
+            size = self.group_size(scale_index)
+        return words, position, scale_index, size
+
+    def _large_chunk(self, chunk: int) -> str:
+        # Groups wider than three digits, in custom grouping systems
+        if self._english:
+            return self.converter._to_cardinal(chunk, self.plan)
+        return self.converter._to_cardinal(chunk, self._gender)
+
+
+def stream_words(source: DigitSource, lang: str = 'en', block_size: int = BLOCK_SIZE,
+                 **kwargs) -> Iterator[str]:
+    """
+    Yield the cardinal words for an integer read from a digit source.
+
+    The pieces joined together equal num2words(int(digits), lang, **kwargs).
+    Each piece holds the words for one block of the source, so the first
+    words arrive before the last digits are read.
+
+    Args:
+        source: Digit string, text or binary file, or iterable of digit
+            strings; ASCII, Arabic-Indic or Persian digits with an optional
+            leading '-', ignoring whitespace, '_' and ','
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        block_size: Characters read from the source at a time
+        **kwargs: gender (Arabic), grouping (English), style or overlay
+
+    Returns:
+        Iterator of strings
+
+    Raises:
+        ValueError: If the options are invalid, the grouping is nested, or
+            (while iterating) the source holds no digits or other characters
+        InputLimitError: If the digits exceed Settings.MAX_DIGITS (while iterating)
+
+    Examples:
+        >>> ''.join(stream_words('1_000_021'))
+        'one million twenty-one'
+    """
+    if block_size < 1:
+        raise ValueError(f"block_size must be positive, got {block_size}")
+    NumberConverter._initialize_converters()
+    converter, _, options = NumberConverter._resolve(lang, 'cardinal', dict(kwargs))
+    renderer = GroupRenderer(converter, options)
+    return _stream(renderer, source, block_size)
+
+
+def _stream(renderer: GroupRenderer, source: DigitSource, block_size: int) -> Iterator[str]:
+    reader = _DigitReader(source, block_size)
+    try:
+        length = reader.count()
+        if Settings.MAX_DIGITS is not None and length > Settings.MAX_DIGITS:
+            raise InputLimitError('MAX_DIGITS', length, Settings.MAX_DIGITS)
+        scale_index, size = renderer.layout(length)
+        separator = renderer.separator
+        emitted = False
+        pending = ''
+        for digits in reader.blocks():
+            pending = pending + digits if pending else digits
+            words, consumed, scale_index, size = renderer.render(pending, scale_index, size, emitted)
+            pending = pending[consumed:]
+            if words:
+                text = separator.join(words)
+                if emitted:
+                    yield separator + text
+                else:
+                    emitted = True
+                    yield renderer.negative + text if reader.negative else text
+        if not emitted:
+            yield renderer.zero
+    finally:
+        reader.close()
+
+
+class _DigitReader:
+    """Two passes over the digits of a source: a count, then the digits."""
+
+    def __init__(self, source: DigitSource, block_size: int):
+        self._source = source
+        self._block_size = block_size
+        self._spool: Optional[Any] = None
+        self._start: Optional[int] = None
+        self.negative = False
+        self._signed = False
+
+    def count(self) -> int:
+        """Count the digits, validating them and spooling the source if it cannot be re-read."""
+        source = self._source
+        length = 0
+        if hasattr(source, 'read') and _seekable(source):
+            self._start = source.tell()
+        elif not isinstance(source, (str, bytes)):
+            self._spool = tempfile.TemporaryFile(mode='w+', encoding='ascii')
+        for digits in self._clean(self._raw()):
+            length += len(digits)
+            if self._spool is not None:
+                self._spool.write(digits)
+        if not length:
+            raise ValueError("No digits in the source")
+        if self._spool is not None:
+            self._spool.seek(0)
+        elif self._start is not None:
+            source.seek(self._start)
+        return length
+
+    def blocks(self) -> Iterator[str]:
+        """The digits as ASCII strings, after count()."""
+        if self._spool is not None:
+            read = self._spool.read
+            return iter(lambda: read(self._block_size), '')
+        self._signed = False
+        return self._clean(self._raw())
+
+    def close(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+
+    def _raw(self) -> Iterator[str]:
+        source, block_size = self._source, self._block_size
+        if isinstance(source, (str, bytes)):
+            blocks: Iterable[Union[str, bytes]] = (
+                source[start:start + block_size] for start in range(0, len(source), block_size))
+        elif hasattr(source, 'read'):
+            read = source.read
+            blocks = iter(lambda: read(block_size), source.read(0))
+        else:
+            blocks = source
+        decoder = None
+        for block in blocks:
+            if isinstance(block, (bytes, bytearray)):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder('utf-8')()
+                block = decoder.decode(block)
+            elif not isinstance(block, str):
+                raise TypeError(f"Digit chunks must be str or bytes, got {type(block).__name__}")
+            yield block
+        if decoder is not None:
+            yield decoder.decode(b'', final=True)
+
+    def _clean(self, blocks: Iterator[str]) -> Iterator[str]:
+        for block in blocks:
+            digits = block.translate(_TRANSLATION)
+            if digits and not self._signed:
+                self._signed = True
+                if digits[0] in '-−':
+                    self.negative = True
+                    digits = digits[1:]
+            if digits and not (digits.isascii() and digits.isdigit()):
+                invalid = next(char for char in digits if not '0' <= char <= '9')
+                raise ValueError(f"Invalid character in digit source: {invalid!r}")
+            if digits:
+                yield digits
+
+
+def _seekable(stream: Any) -> bool:
+    try:
+        return stream.seekable()
+    except (AttributeError, ValueError):
+        return False
@@ -0,0 +1,235 @@
+"""
+Spell out the numbers embedded in free text.
+
+A single precompiled pattern per language finds integers (with or without
+thousands separators), decimals, negatives, English ordinals such as
+"21st", and amounts tagged with a currency code or symbol ("USD 12.50",
+"12.50 SAR", "$3"), in ASCII, Arabic-Indic or Persian digits. Each match is
+replaced in one pass by its words; repeated tokens are converted once.
+Tokens that cannot be converted (too large, for instance) are left as
+they are.
+
+Usage:
+    python -m numwordify.text report.txt --lang ar > spoken.txt
+    cat notes.txt | python -m numwordify.text - --lang en
+"""
+
+import argparse
+import re
+import sys
+from decimal import Decimal
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from .compiler import compile_renderer
+from .config.settings import Settings
+from .converter import NumberConverter, num2words
+from .languages.base import DIGIT_SETS
+
+# Currency symbols recognized before an amount, for languages defining the code
+CURRENCY_SYMBOLS = {'$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY'}
+
+# Tokens memoized per normalizer before the memo is started afresh
+MEMO_SIZE = 65536
+
+_DIGIT = '[' + ''.join(DIGIT_SETS) + ']'
+_THOUSANDS = ',٬'  # ASCII comma, Arabic thousands separator
+_DECIMAL = '.٫'    # ASCII point, Arabic decimal separator
+_SEPARATORS = str.maketrans({',': None, '٬': None, '٫': '.'})
+
+_patterns: Dict[Tuple[Any, ...], 're.Pattern[str]'] = {}
+
+
+def _pattern(codes: Sequence[str], symbols: Sequence[str], ordinals: bool) -> 're.Pattern[str]':
+    """Compile (once) the token pattern for a set of currency codes."""
+    key = (tuple(codes), tuple(symbols), ordinals)
+    pattern = _patterns.get(key)
+    if pattern is not None:
+        return pattern
+    # Alternatives that are switched off still define their group, as (?!)
+    prefixes = [re.escape(code) + r'\s?' for code in codes] + [re.escape(symbol) for symbol in symbols]
+    prefix = f"(?:(?P<pre>{'|'.join(prefixes) or '(?!)'}))?"
+    suffix = f"\\s?(?P<post>{'|'.join(map(re.escape, codes)) or '(?!)'})"
+    ordinal = f"(?P<ord>{'st|nd|rd|th' if ordinals else '(?!)'})"
+    pattern = re.compile(
+        rf"(?<![\w{_DECIMAL}{_THOUSANDS}])"
+        rf"(?P<sign>[-−])?{prefix}(?P<sign2>[-−])?"
+        rf"(?P<int>{_DIGIT}{{1,3}}(?:[{_THOUSANDS}]{_DIGIT}{{3}})+|{_DIGIT}+)"
+        rf"(?:[{_DECIMAL}](?P<frac>{_DIGIT}+))?"
+        rf"(?:{ordinal}|{suffix})?"
+        # Not part of a longer word, version number or malformed group
+        rf"(?!\w|[{_DECIMAL}{_THOUSANDS}]{_DIGIT})"
+    )
+    _patterns[key] = pattern
+    return pattern
+
+
+class TextNormalizer:
+    """
+    Replace the numbers in text with words, reusing work between calls.
+
+    Args:
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        currencies: Recognize currency codes and symbols around amounts
+        **kwargs: Options for the conversions (gender, grouping, ...)
+
+    Raises:
+        ValueError: If the language or an option is invalid
+
+    Examples:
+        >>> TextNormalizer('en').normalize('Pay USD 12.50 by the 3rd.')
+        'Pay twelve dollars and fifty cents by the third.'
+    """
+
+    def __init__(self, lang: str = 'en', currencies: bool = True, **kwargs):
+        self.lang = lang
+        self.currencies = currencies
+        self.kwargs = kwargs
+        self._version = -1
+        self._prepare()
+
+    def _prepare(self) -> None:
+        """Build the pattern and renderers for the current language data."""
+        NumberConverter._initialize_converters()
+        self._version = NumberConverter.data_version
+        converter, _, _ = NumberConverter._resolve(self.lang, 'cardinal', dict(self.kwargs))
+        self._cardinal = compile_renderer(self.lang, 'cardinal', **self.kwargs)
+        codes: Sequence[str] = ()
+        self._symbols: Dict[str, str] = {}
+        if self.currencies:
+            codes = sorted(converter.currencies, key=lambda code: (-len(code), code))
+            self._symbols = {symbol: code for symbol, code in CURRENCY_SYMBOLS.items()
+                             if code in converter.currencies}
+        english = converter.config.get('language', '') == 'english'
+        self._pattern = _pattern(codes, sorted(self._symbols), english)
+        self._memo: Dict[str, str] = {}
+
+    def _replace(self, match: 're.Match[str]') -> str:
+        token = match.group()
+        words = self._memo.get(token)
+        if words is None:
+            words = self._convert(match)
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo.clear()
+            self._memo[token] = words
+        return words
+
+    def _convert(self, match: 're.Match[str]') -> str:
+        """Words for one token, or the token itself if it cannot be converted."""
+        integer, fraction = match.group('int'), match.group('frac')
+        negative = bool(match.group('sign') or match.group('sign2'))
+        currency = match.group('post') or (match.group('pre') or '').strip()
+        currency = self._symbols.get(currency, currency)
+        ordinal = match.group('ord')
+        try:
+            if ordinal:
+                if fraction or currency:
+                    return match.group()
+                number = int(integer.translate(_SEPARATORS))
+                words = num2words(-number if negative else number, lang=self.lang,
+                                  to='ordinal', **self.kwargs)
+            elif currency:
+                number = Decimal(f"{integer.translate(_SEPARATORS)}.{fraction or 0}")
+                words = num2words(-number if negative else number, lang=self.lang,
+                                  to='currency', currency=currency, **self.kwargs)
+            elif fraction:
+                number = Decimal(f"{integer.translate(_SEPARATORS)}.{fraction}")
+                words = num2words(-number if negative else number, lang=self.lang, **self.kwargs)
+            elif len(integer) > 1 and integer[0] in '0٠۰':
+                # Leading zeros (codes, times, PINs) are read digit by digit
+                words = num2words(f"-{integer}" if negative else integer, lang=self.lang,
+                                  to='digits', **self.kwargs)
+            else:
+                number = int(integer.translate(_SEPARATORS))
+                words = self._cardinal(-number if negative else number)
+        except (ValueError, OverflowError):
+            return match.group()
+        return words
+
+    def normalize(self, text: str) -> str:
+        """Return text with every number spelled out."""
+        if self._version != NumberConverter.data_version:
+            self._prepare()
+        return self._pattern.sub(self._replace, text)
+
+    def normalize_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Normalize text one line (or chunk) at a time; numbers must not span chunks."""
+        normalize = self.normalize
+        for line in lines:
+            yield normalize(line)
+
+
+def normalize_text(text: str, lang: str = 'en', **kwargs) -> str:
+    """
+    Spell out every number in a text.
+
+    Args:
+        text: Free text
+        lang: Language code ('en', 'ar', 'english', 'arabic')
+        **kwargs: currencies=False to ignore currency codes, and options
+            for the conversions (gender, grouping, ...)
+
+    Returns:
+        The text with integers, decimals, negatives, ordinals and currency
+        amounts replaced by words
+
+    Raises:
+        ValueError: If the language or an option is invalid
+
+    Examples:
+        >>> normalize_text('Room 12, floor -1, USD 3.50')
+        'Room twelve, floor negative one, three dollars and fifty cents'
+        >>> normalize_text('الطابق ٣', lang='ar')
+        'الطابق ثلاثة'
+    """
+    return TextNormalizer(lang, **kwargs).normalize(text)
+
+
+def iter_normalize(source: Iterable[str], lang: str = 'en', **kwargs) -> Iterator[str]:
+    """
+    Normalize a text stream line by line in constant memory.
+
+    Args:
+        source: Text file object or any iterable of lines
+        lang: Language code
+        **kwargs: As for normalize_text
+
+    Returns:
+        Iterator of normalized lines; repeated tokens are converted once
+        for the whole stream
+    """
+    return TextNormalizer(lang, **kwargs).normalize_lines(source)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m numwordify.text',
+        description='Spell out the numbers in a text file.',
+    )
+    parser.add_argument('source', help="input file, or '-' for stdin")
+    parser.add_argument('--lang', default='en')
+    parser.add_argument('--gender', choices=sorted(Settings.GENDER_OPTIONS))
+    parser.add_argument('--no-currencies', action='store_true',
+                        help='do not treat currency codes as part of amounts')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None, output: Optional[IO[str]] = None) -> int:
+    """Command-line entry point."""
+    args = _parser().parse_args(argv)
+    output = output or sys.stdout
+    kwargs = {'gender': args.gender} if args.gender else {}
+    try:
+        normalizer = TextNormalizer(args.lang, currencies=not args.no_currencies, **kwargs)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if args.source == '-':
+        output.writelines(normalizer.normalize_lines(sys.stdin))
+    else:
+        with open(args.source, encoding='utf-8') as source:
+            output.writelines(normalizer.normalize_lines(source))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,471 @@
+"""Frozen reference implementation used by the differential tests.
+
+This is a snapshot of the original ``EnglishConverter``,
+``ArabicConverter`` and ``NumberConverter.convert`` logic. It must never be
+optimized or refactored: every fast path in the package is checked against
+it, so its output defines the expected behavior byte for byte.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+DATA_DIR = Path(__file__).parent.parent / "numwordify" / "data"
+
+MAX_DECIMAL_DIGITS = 10
+MAX_DECIMAL_AS_NUMBER = 2
+
+CONVERSION_TYPES = ('cardinal', 'ordinal', 'currency')
+
+GENDER_OPTIONS = ('m', 'masculine', 'f', 'feminine')
+
+INFINITY_WORDS = {
+    'en': {'positive': 'infinity', 'negative': 'negative infinity'},
+    'ar': {'positive': 'اللانهاية', 'negative': 'سالب اللانهاية'},
+}
+
+NaN_WORDS = {
+    'en': 'not a number',
+    'ar': 'ليس رقماً',
+}
+
+
+def _load(name: str) -> Dict[str, Any]:
+    with open(DATA_DIR / f"{name}.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _validate_conversion_type(conversion_type: str) -> str:
+    conv_lower = conversion_type.lower()
+    if conv_lower in CONVERSION_TYPES:
+        return conv_lower
+    raise ValueError(f"Invalid conversion type: {conversion_type}")
+
+
+def _validate_gender(gender: str) -> str:
+    gender_lower = gender.lower()
+    if gender_lower in GENDER_OPTIONS:
+        return gender_lower[0]
+    raise ValueError(f"Invalid gender: {gender}")
+
+
+class _ReferenceBase:
+    """Shared negative/decimal handling of the original ``BaseConverter``."""
+
+    def _handle_negative(self, number: Union[int, float]) -> Tuple[bool, Union[int, float]]:
+        if number < 0:
+            return True, abs(number)
+        return False, number
+
+    def _handle_decimal(self, number: Union[int, float]) -> Tuple[Union[int, float], Optional[int], Optional[str]]:
+        if isinstance(number, float):
+            integer_part = int(number)
+            num_str = f"{number:.{MAX_DECIMAL_DIGITS}f}"
+            if '.' in num_str:
+                decimal_str = num_str.split('.')[1].rstrip('0')
+                if decimal_str:
+                    if len(decimal_str) > MAX_DECIMAL_DIGITS:
+                        decimal_str = decimal_str[:MAX_DECIMAL_DIGITS]
+                    decimal_value = int(decimal_str) if len(decimal_str) <= MAX_DECIMAL_AS_NUMBER else None
+                    return integer_part, decimal_value, decimal_str
+            return integer_part, None, None
+        return number, None, None
+
+
+class ReferenceEnglish(_ReferenceBase):
+    """Snapshot of the original ``EnglishConverter``."""
+
+    def __init__(self):
+        config = _load('english')
+        self.ones = config['ones']
+        self.tens = config['tens']
+        self.ordinal_ones = config['ordinal_ones']
+        self.ordinal_tens = config['ordinal_tens']
+        self.scales = config['scales']
+        self.ordinal_scales = config['ordinal_scales']
+        self.zero = config['zero']
+        self.zeroth = config['zeroth']
+        self.hundred = config['hundred']
+        self.negative_prefix = config['negative_prefix']
+        self.decimal_separator = config['decimal_separator']
+        self.number_separator = config['number_separator']
+        self.scale_separator = config['scale_separator']
+        self.currencies = config['currencies']
+
+    def convert(self, number, to='cardinal', **kwargs):
+        to = _validate_conversion_type(to)
+        if to == 'currency':
+            currency = kwargs.get('currency', 'USD')
+            return self._to_currency(number, currency)
+
+        is_negative, number = self._handle_negative(number)
+        integer_part, decimal_value, decimal_str = self._handle_decimal(number)
+
+        if integer_part == 0:
+            result = self.zeroth if to == 'ordinal' else self.zero
+        else:
+            result = self._to_ordinal(integer_part) if to == 'ordinal' else self._to_cardinal(integer_part)
+
+        if is_negative:
+            result = f"{self.negative_prefix} {result}"
+
+        if decimal_value is not None or decimal_str:
+            if decimal_value is not None and decimal_value > 0:
+                decimal_words = self._to_cardinal(decimal_value)
+            elif decimal_str:
+                decimal_words = ' '.join([self._to_cardinal(int(d)) for d in decimal_str])
+            else:
+                decimal_words = None
+            if decimal_words:
+                result += f' {self.decimal_separator} {decimal_words}'
+        return result
+
+    def _to_cardinal(self, number):
+        if number == 0:
+            return self.zero
+        if number < 20:
+            return self.ones[number]
+        if number < 100:
+            tens_digit = number // 10
+            ones_digit = number % 10
+            if ones_digit == 0:
+                return self.tens[tens_digit]
+            return f"{self.tens[tens_digit]}{self.number_separator}{self.ones[ones_digit]}"
+        if number < 1000:
+            hundreds = number // 100
+            remainder = number % 100
+            result = f"{self.ones[hundreds]} {self.hundred}"
+            if remainder > 0:
+                result += f" {self._to_cardinal(remainder)}"
+            return result
+
+        scale_index = 0
+        result_parts = []
+        while number > 0:
+            chunk = number % 1000
+            number = number // 1000
+            if chunk > 0:
+                chunk_words = self._to_cardinal(chunk)
+                if scale_index > 0:
+                    if scale_index < len(self.scales):
+                        chunk_words += f"{self.scale_separator}{self.scales[scale_index]}"
+                    else:
+                        chunk_words += f" (10^{scale_index * 3})"
+                result_parts.insert(0, chunk_words)
+            scale_index += 1
+        return ' '.join(result_parts)
+
+    def _to_ordinal(self, number):
+        if number == 0:
+            return self.zeroth
+        if number < 20:
+            return self.ordinal_ones[number]
+        if number < 100:
+            tens_digit = number // 10
+            ones_digit = number % 10
+            if ones_digit == 0:
+                return self.ordinal_tens[tens_digit]
+            return f"{self.tens[tens_digit]}{self.number_separator}{self.ordinal_ones[ones_digit]}"
+        if number < 1000:
+            hundreds = number // 100
+            remainder = number % 100
+            result = f"{self.ones[hundreds]} {self.hundred}"
+            if remainder > 0:
+                result += f" {self._to_ordinal(remainder)}"
+            else:
+                result += "th"
+            return result
+
+        scale_index = 0
+        result_parts = []
+        last_chunk = None
+        temp_number = number
+        while temp_number > 0:
+            chunk = temp_number % 1000
+            temp_number = temp_number // 1000
+            if chunk > 0:
+                last_chunk = (chunk, scale_index)
+
+        temp_number = number
+        scale_index = 0
+        while temp_number > 0:
+            chunk = temp_number % 1000
+            temp_number = temp_number // 1000
+            if chunk > 0:
+                is_last = (chunk, scale_index) == last_chunk
+                if is_last:
+                    chunk_words = self._to_ordinal(chunk)
+                else:
+                    chunk_words = self._to_cardinal(chunk)
+                if scale_index > 0:
+                    if is_last:
+                        if scale_index < len(self.ordinal_scales):
+                            chunk_words += f"{self.scale_separator}{self.ordinal_scales[scale_index]}"
+                        else:
+                            chunk_words += f" (10^{scale_index * 3})"
+                    else:
+                        if scale_index < len(self.scales):
+                            chunk_words += f"{self.scale_separator}{self.scales[scale_index]}"
+                        else:
+                            chunk_words += f" (10^{scale_index * 3})"
+                result_parts.insert(0, chunk_words)
+            scale_index += 1
+        return ' '.join(result_parts)
+
+    def _to_currency(self, number, currency):
+        if currency not in self.currencies:
+            raise ValueError(f"Unsupported currency: {currency}")
+        currency_info = self.currencies[currency]
+        subunit_factor = currency_info.get('subunit_factor', 100)
+        is_negative, number = self._handle_negative(number)
+        total_subunits = int(round(number * subunit_factor))
+        main_units = total_subunits // subunit_factor
+        subunits = total_subunits % subunit_factor
+
+        parts = []
+        if main_units > 0 or (main_units == 0 and subunits > 0):
+            if main_units == 0:
+                main_words = self.zero
+            else:
+                main_words = self._to_cardinal(main_units)
+            if main_units == 1:
+                currency_name = currency_info['name']
+            else:
+                currency_name = currency_info.get('plural', currency_info['name'])
+            parts.append(f"{main_words} {currency_name}")
+        if subunits > 0:
+            subunit_words = self._to_cardinal(subunits)
+            if subunits == 1:
+                subunit_name = currency_info['subunit']
+            else:
+                subunit_name = currency_info.get('subunit_plural', currency_info['subunit'])
+            parts.append(f"{subunit_words} {subunit_name}")
+        if not parts:
+            parts.append(f"{self.zero} {currency_info['name']}")
+        result = ' and '.join(parts)
+        if is_negative:
+            result = f"{self.negative_prefix} {result}"
+        return result
+
+
+class ReferenceArabic(_ReferenceBase):
+    """Snapshot of the original ``ArabicConverter``."""
+
+    def __init__(self):
+        config = _load('arabic')
+        self.ones_masculine = config['ones_masculine']
+        self.tens_masculine = config['tens_masculine']
+        self.ones_feminine = config['ones_feminine']
+        self.tens_feminine = config['tens_feminine']
+        self.hundreds = config['hundreds']
+        self.scales = config['scales']
+        self.scales_dual = config['scales_dual']
+        self.scales_plural = config['scales_plural']
+        self.zero = config['zero']
+        self.negative_prefix = config['negative_prefix']
+        self.decimal_separator = config['decimal_separator']
+        self.ordinal_prefix = config['ordinal_prefix']
+        self.conjunction = config['conjunction']
+        self.currencies = config['currencies']
+
+    def convert(self, number, to='cardinal', gender='m', **kwargs):
+        to = _validate_conversion_type(to)
+        gender = _validate_gender(gender)
+        if to == 'currency':
+            currency = kwargs.get('currency', 'SAR')
+            return self._to_currency(number, currency, gender)
+
+        is_negative, number = self._handle_negative(number)
+        integer_part, decimal_value, decimal_str = self._handle_decimal(number)
+
+        if integer_part == 0:
+            result = self.zero
+        else:
+            result = self._to_ordinal(integer_part, gender) if to == 'ordinal' else self._to_cardinal(integer_part, gender)
+
+        if is_negative:
+            result = f"{self.negative_prefix} {result}"
+
+        if decimal_value is not None or decimal_str:
+            if decimal_value is not None and decimal_value > 0:
+                decimal_words = self._to_cardinal(decimal_value, gender)
+            elif decimal_str:
+                decimal_words = ' '.join([self._to_cardinal(int(d), gender) for d in decimal_str])
+            else:
+                decimal_words = None
+            if decimal_words:
+                result += f' {self.decimal_separator} {decimal_words}'
+        return result
+
+    def _to_cardinal(self, number, gender='m'):
+        if number == 0:
+            return self.zero
+        ones = self.ones_masculine if gender == 'm' else self.ones_feminine
+        tens = self.tens_masculine if gender == 'm' else self.tens_feminine
+        if number < 20:
+            return ones[number]
+        if number < 100:
+            tens_digit = number // 10
+            ones_digit = number % 10
+            if ones_digit == 0:
+                return tens[tens_digit]
+            return f"{ones[ones_digit]} {self.conjunction} {tens[tens_digit]}"
+        if number < 1000:
+            hundreds_digit = number // 100
+            remainder = number % 100
+            if remainder == 0:
+                return self.hundreds[hundreds_digit]
+            return f"{self.hundreds[hundreds_digit]} {self.conjunction} {self._to_cardinal(remainder, gender)}"
+
+        scale_index = 0
+        result_parts = []
+        while number > 0:
+            chunk = number % 1000
+            number = number // 1000
+            if chunk > 0:
+                if scale_index > 0:
+                    if chunk == 1:
+                        chunk_words = self._get_scale_word(chunk, scale_index)
+                    elif chunk == 2:
+                        chunk_words = self._get_scale_word(chunk, scale_index)
+                    else:
+                        chunk_words = self._to_cardinal(chunk, gender)
+                        scale_word = self._get_scale_word(chunk, scale_index)
+                        chunk_words += f" {scale_word}"
+                else:
+                    chunk_words = self._to_cardinal(chunk, gender)
+                result_parts.insert(0, chunk_words)
+            scale_index += 1
+        return f' {self.conjunction} '.join(result_parts)
+
+    def _get_scale_word(self, number, scale_index):
+        if scale_index == 0:
+            return ''
+        if scale_index >= len(self.scales):
+            return f"(10^{scale_index * 3})"
+        if number == 1:
+            return self.scales[scale_index]
+        elif number == 2:
+            if scale_index < len(self.scales_dual):
+                return self.scales_dual[scale_index]
+            return self.scales[scale_index]
+        elif 3 <= number <= 10:
+            if scale_index < len(self.scales_plural):
+                return self.scales_plural[scale_index]
+            return self.scales[scale_index]
+        else:
+            last_two_digits = number % 100
+            if 11 <= last_two_digits <= 99:
+                return self.scales[scale_index]
+            if scale_index < len(self.scales_plural):
+                return self.scales_plural[scale_index]
+            return self.scales[scale_index]
+
+    def _to_ordinal(self, number, gender='m'):
+        cardinal = self._to_cardinal(number, gender)
+        return f"{self.ordinal_prefix}{cardinal}"
+
+    def _to_currency(self, number, currency, gender='m'):
+        if currency not in self.currencies:
+            raise ValueError(f"Unsupported currency: {currency}")
+        currency_info = self.currencies[currency]
+        subunit_factor = currency_info.get('subunit_factor', 100)
+        is_negative, number = self._handle_negative(number)
+        total_subunits = int(round(number * subunit_factor))
+        main_units = total_subunits // subunit_factor
+        subunits = total_subunits % subunit_factor
+
+        parts = []
+        if main_units > 0 or (main_units == 0 and subunits > 0):
+            if main_units == 0:
+                main_words = self.zero
+            else:
+                main_words = self._to_cardinal(main_units, gender)
+            use_tanween_main = currency_info.get('use_tanween_for_main', True)
+            if main_units == 1:
+                if use_tanween_main:
+                    currency_name = currency_info.get('name_with_tanween', currency_info['name'])
+                else:
+                    currency_name = currency_info['name']
+            elif main_units == 2:
+                currency_name = currency_info.get('dual', currency_info.get('plural', currency_info['name']))
+            elif main_units >= 3 and main_units <= 10:
+                currency_name = currency_info.get('plural', currency_info['name'])
+            else:
+                if use_tanween_main:
+                    currency_name = currency_info.get('name_with_tanween', currency_info['name'])
+                else:
+                    currency_name = currency_info.get('plural_with_tanween',
+                                                      currency_info.get('plural', currency_info['name']))
+            if main_units == 1:
+                parts.append(f"{currency_name} {main_words}")
+            else:
+                parts.append(f"{main_words} {currency_name}")
+
+        if subunits > 0:
+            subunit_words = self._to_cardinal(subunits, gender)
+            use_tanween = currency_info.get('use_tanween_for_subunit', False)
+            subunit_always_singular = currency_info.get('subunit_always_singular', False)
+            if subunits == 1:
+                if use_tanween:
+                    subunit_name = currency_info.get('subunit_with_tanween', currency_info['subunit'])
+                else:
+                    subunit_name = currency_info['subunit']
+            elif subunit_always_singular:
+                subunit_name = currency_info.get('subunit_with_tanween', currency_info['subunit'])
+            elif use_tanween:
+                subunit_name = currency_info.get('subunit_with_tanween', currency_info['subunit'])
+            else:
+                subunit_name = currency_info.get('subunit_plural', currency_info['subunit'])
+            parts.append(f"{subunit_words} {subunit_name}")
+
+        if not parts:
+            parts.append(f"{self.zero} {currency_info['name']}")
+        result = f' {self.conjunction} '.join(parts)
+        if is_negative:
+            result = f"{self.negative_prefix} {result}"
+        return result
+
+
+_REFERENCE_CONVERTERS: Dict[str, Any] = {}
+
+
+def reference_converter(lang: str):
+    """Return the (lazily built) reference converter for a language code."""
+    lang_key = 'english' if lang.lower() in ('en', 'english') else 'arabic'
+    if lang_key not in _REFERENCE_CONVERTERS:
+        _REFERENCE_CONVERTERS[lang_key] = ReferenceEnglish() if lang_key == 'english' else ReferenceArabic()
+    return _REFERENCE_CONVERTERS[lang_key]
+
+
+def reference_num2words(number, lang='en', to='cardinal', **kwargs):
+    """Snapshot of the original ``NumberConverter.convert`` dispatch."""
+    if not isinstance(number, (int, float)):
+        raise TypeError(f"Number must be int or float, got {type(number).__name__}")
+
+    if math.isinf(number) or math.isnan(number):
+        lang_code = lang.lower()
+        if lang_code in ('english', 'arabic'):
+            lang_code = 'en' if lang_code == 'english' else 'ar'
+        elif lang_code not in ('en', 'ar'):
+            lang_code = 'en'
+        if math.isnan(number):
+            return NaN_WORDS[lang_code]
+        words = INFINITY_WORDS[lang_code]
+        return words['positive'] if number > 0 else words['negative']
+
+    lang_key = lang.lower()
+    if lang_key not in ('en', 'english', 'ar', 'arabic'):
+        raise ValueError(f"Unsupported language: {lang}")
+
+    to = _validate_conversion_type(to)
+    converter = reference_converter(lang_key)
+
+    if to == 'currency':
+        currency = kwargs.get('currency', 'USD' if lang_key == 'english' else 'SAR')
+        if currency not in converter.currencies:
+            raise ValueError(f"Unsupported currency: {currency}")
+        kwargs['currency'] = currency
+
+    return converter.convert(number, to=to, **kwargs)
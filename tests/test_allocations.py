@@ -0,0 +1,54 @@
+"""Allocation budgets for conversions.
+
+Each conversion runs under tracemalloc with its result dropped; the most
+memory a single call holds at once must stay within the budget for its
+language and form, and nothing may stay allocated afterwards. Raise a
+budget only together with the change that needs it.
+"""
+
+import unittest
+from numwordify import num2words
+from numwordify.profile import batch_peak_memory, measure_call_allocations, representative_workload
+
+NUMBERS = [0, 7, 42, 999, 1234, 10 ** 6 + 1, 987654321, 10 ** 15 + 123456789, 2 ** 64,
+           12.5, 0.05, 1234.5678, -99, -1000.25]
+
+# Largest per-call peak in bytes, by (language, form)
+BUDGETS = {
+    ('en', 'cardinal'): 1800,
+    ('en', 'ordinal'): 2000,
+    ('en', 'currency'): 2200,
+    ('en', 'digits'): 3000,
+    ('ar', 'cardinal'): 2500,
+    ('ar', 'ordinal'): 2500,
+    ('ar', 'currency'): 2600,
+    ('ar', 'digits'): 3000,
+}
+
+# Peak bytes per item of one convert_batch call on the representative
+# workload (Arabic strings take two bytes per character)
+BATCH_BUDGETS = {'en': 200, 'ar': 300}
+
+
+class TestAllocationBudgets(unittest.TestCase):
+    """Test conversions stay within their allocation budgets."""
+    
+    def test_per_call_budgets(self):
+        """Test the per-call peak and leaks for every language and form."""
+        for (lang, to), budget in BUDGETS.items():
+            with self.subTest(lang=lang, to=to):
+                result = measure_call_allocations(
+                    lambda number: num2words(number, lang=lang, to=to), NUMBERS * 5)
+                self.assertLessEqual(result['max_peak_bytes'], budget)
+                self.assertEqual(result['leaked_blocks'], 0)
+    
+    def test_batch_budget(self):
+        """Test batch conversion memory grows only with the results."""
+        for lang, budget in BATCH_BUDGETS.items():
+            with self.subTest(lang=lang):
+                result = batch_peak_memory(representative_workload(20000), lang=lang)
+                self.assertLessEqual(result['bytes_per_item'], budget)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 """Tests for Arabic number conversion."""
 
 import unittest
-from numwordify import num2words
+from numwordify import count_noun, num2words
+from numwordify.nouns import _paradigm, count_nouns
 
 
 class TestArabicConversion(unittest.TestCase):
@@ -51,6 +52,62 @@ class TestArabicConversion(unittest.TestCase):
         self.assertEqual(num2words(123.45, lang='ar'), "مائة و ثلاثة و عشرون فاصل خمسة و أربعون")
 
 
+class TestCountNoun(unittest.TestCase):
+    """Test counted-noun agreement."""
+    
+    BOOK = ('كتاب', 'كتابان', 'كتب', 'كتاباً')
+    HOUR = ('ساعة', 'ساعتان', 'ساعات', 'ساعةً', 'f')
+    
+    def test_count_classes(self):
+        """Test the noun form for each count class."""
+        self.assertEqual(count_noun(0, self.BOOK), "صفر كتاب")
+        self.assertEqual(count_noun(1, self.BOOK), "كتاب واحد")
+        self.assertEqual(count_noun(2, self.BOOK), "كتابان")
+        self.assertEqual(count_noun(3, self.BOOK), "ثلاثة كتب")
+        self.assertEqual(count_noun(11, self.BOOK), "أحد عشر كتاباً")
+        self.assertEqual(count_noun(100, self.BOOK), "مائة كتاب")
+        self.assertEqual(count_noun(103, self.BOOK), "مائة و ثلاثة كتب")
+        self.assertEqual(count_noun(111, self.BOOK), "مائة و أحد عشر كتاباً")
+        self.assertEqual(count_noun(2000, self.BOOK), "ألفان كتاب")
+    
+    def test_gender_and_forms(self):
+        """Test feminine number words and the paradigm formats."""
+        self.assertEqual(count_noun(3, self.BOOK + ('m',)), "ثلاثة كتب")
+        self.assertEqual(count_noun(3, self.HOUR), "ثلاث ساعات")
+        self.assertEqual(count_noun(13, self.HOUR[:3] + ('f',)), "ثلاث عشرة ساعة")
+        self.assertEqual(count_noun(1, {'singular': 'ساعة', 'dual': 'ساعتان', 'plural': 'ساعات',
+                                        'gender': 'feminine'}), "ساعة واحدة")
+        forms = {'singular': 'ملف', 'dual': 'ملفان', 'plural': 'ملفات'}
+        self.assertEqual(count_noun(15, forms), "خمسة عشر ملف")
+        self.assertEqual(count_noun(15, list(self.BOOK[:3])), "خمسة عشر كتاب")
+        self.assertIs(_paradigm(dict(forms)), _paradigm(forms))
+    
+    def test_scale_words_share_count_classes(self):
+        """Test nouns agree like scale words for 3-10 and 11-99."""
+        thousand = ('ألف', 'ألفان', 'آلاف', 'ألف')
+        for n in (3, 10, 11, 99, 111, 310, 999):
+            self.assertEqual(count_noun(n, thousand), num2words(n * 1000, lang='ar'))
+    
+    def test_batch(self):
+        """Test batches match single calls."""
+        numbers = [5, 1, 5, 0, 250, 12]
+        self.assertEqual(count_nouns(numbers, self.HOUR),
+                         [count_noun(n, self.HOUR) for n in numbers])
+    
+    def test_invalid(self):
+        """Test invalid counts, forms and genders."""
+        with self.assertRaises(TypeError):
+            count_noun(1.5, self.BOOK)
+        with self.assertRaises(ValueError):
+            count_noun(-1, self.BOOK)
+        with self.assertRaises(ValueError):
+            count_noun(1, ('كتاب', 'كتابان'))
+        with self.assertRaises(ValueError):
+            count_noun(1, {'singular': 'كتاب', 'dual': 'كتابان', 'plurals': 'كتب'})
+        with self.assertRaises(ValueError):
+            count_noun(1, {'singular': 'كتاب', 'dual': 'كتابان', 'plural': 'كتب', 'gender': 'x'})
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,63 @@
+"""Tests for the asyncio conversion coalescer."""
+
+import asyncio
+import unittest
+
+from numwordify import num2words
+from numwordify.coalescer import ConversionCoalescer
+
+
+class TestCoalescer(unittest.TestCase):
+    """Test micro-batching of concurrent conversions."""
+    
+    def test_concurrent_calls_share_batches(self):
+        """Test that concurrent calls are grouped per options."""
+        coalescer = ConversionCoalescer(max_batch_size=1000, max_delay=0.01)
+        
+        async def run():
+            calls = [coalescer.convert(n) for n in range(100)]
+            calls += [coalescer.convert(n, lang='ar', gender='f') for n in range(50)]
+            return await asyncio.gather(*calls)
+        
+        results = asyncio.run(run())
+        expected = [num2words(n) for n in range(100)] + [num2words(n, lang='ar', gender='f') for n in range(50)]
+        self.assertEqual(results, expected)
+        self.assertEqual(coalescer.stats()['batches'], 2)
+    
+    def test_max_batch_size_flushes_early(self):
+        """Test that a full group is converted without waiting for the timer."""
+        coalescer = ConversionCoalescer(max_batch_size=10, max_delay=60)
+        
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(*[coalescer.convert(n, to='ordinal') for n in range(30)]), timeout=5)
+        
+        self.assertEqual(asyncio.run(run()), [num2words(n, to='ordinal') for n in range(30)])
+        self.assertEqual(coalescer.stats()['batches'], 3)
+    
+    def test_errors_are_isolated(self):
+        """Test that a bad input only fails its own caller."""
+        coalescer = ConversionCoalescer()
+        
+        async def run():
+            return await asyncio.gather(coalescer.convert(1), coalescer.convert("x"),
+                                        coalescer.convert(2), return_exceptions=True)
+        
+        first, error, second = asyncio.run(run())
+        self.assertEqual((first, second), ("one", "two"))
+        self.assertIsInstance(error, TypeError)
+    
+    def test_invalid_options(self):
+        """Test that invalid options fail every caller of the group."""
+        coalescer = ConversionCoalescer()
+        
+        async def run():
+            return await asyncio.gather(coalescer.convert(1, lang='fr'), return_exceptions=True)
+        
+        self.assertIsInstance(asyncio.run(run())[0], ValueError)
+        with self.assertRaises(ValueError):
+            ConversionCoalescer(max_batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests for code-generated render functions."""
+
+import linecache
+import random
+import unittest
+from decimal import Decimal
+from unittest import mock
+from numwordify import LanguageOverlay, compiler, num2words
+from numwordify.compiler import compile_renderer, generate_source
+from numwordify.converter import NumberConverter
+
+
+def _numbers():
+    rng = random.Random(40)
+    numbers = [0, 1, 2, 3, 10, 11, 12, 99, 100, 101, 999, 1000, 1001, 2002, 100000,
+               10 ** 7, 10 ** 7 + 10 ** 5 + 1, 10 ** 12, 10 ** 19 + 19, 10 ** 40 + 3]
+    numbers += [rng.randrange(10 ** rng.randint(1, 30)) for _ in range(300)]
+    return numbers + [-n for n in numbers if n]
+
+
+class TestCompileRenderer(unittest.TestCase):
+    """Test compiled renderers against num2words."""
+
+    def assertRendersLike(self, lang, to, numbers=None, **kwargs):
+        render = compile_renderer(lang, to, **kwargs)
+        for number in numbers if numbers is not None else _numbers():
+            self.assertEqual(render(number), num2words(number, lang=lang, to=to, **kwargs),
+                             f"{lang} {to} {kwargs} diverged on {number!r}")
+
+    def test_grouping_systems(self):
+        """Test every English grouping system in every numeric form."""
+        for grouping in ('short', 'long', 'indian'):
+            for to in ('cardinal', 'ordinal'):
+                self.assertRendersLike('en', to, grouping=grouping)
+            self.assertRendersLike('en', 'currency', grouping=grouping, currency='USD')
+
+    def test_minor_units(self):
+        """Test minor-unit amounts in both languages."""
+        for lang in ('en', 'ar'):
+            for currency in ('USD', 'KWD', 'SAR'):
+                self.assertRendersLike(lang, 'currency', currency=currency, minor_units=True)
+        self.assertRendersLike('ar', 'currency', currency='EGP', minor_units=True, gender='f')
+
+    def test_digits(self):
+        """Test digit reading, with and without regrouping."""
+        self.assertRendersLike('en', 'digits')
+        self.assertRendersLike('ar', 'digits', gender='f')
+        self.assertRendersLike('en', 'digits', group_size=3)
+        self.assertEqual(compile_renderer('en', 'digits')('0042'), num2words('0042', to='digits'))
+
+    def test_generic_inputs(self):
+        """Test inputs left to the converter give the same results and errors."""
+        numbers = [1.5, -0.25, Decimal('12.30'), True, float('inf'), float('nan'), 10 ** 307]
+        for lang in ('en', 'ar'):
+            for to in ('cardinal', 'ordinal', 'currency'):
+                self.assertRendersLike(lang, to, numbers)
+        render = compile_renderer()
+        with self.assertRaises(OverflowError):
+            render(10 ** 400)
+        with self.assertRaises(TypeError):
+            render('42')
+
+    def test_invalid_options(self):
+        """Test options are validated when compiling."""
+        for lang, to, kwargs in (('fr', 'cardinal', {}), ('en', 'invalid', {}),
+                                 ('ar', 'cardinal', {'gender': 'x'}),
+                                 ('en', 'currency', {'currency': 'XYZ'}),
+                                 ('en', 'cardinal', {'grouping': 'unknown'})):
+            with self.assertRaises(ValueError):
+                compile_renderer(lang, to, **kwargs)
+
+    def test_cached(self):
+        """Test renderers are compiled once and dropped when the data changes."""
+        render = compile_renderer('ar', 'ordinal', gender='f')
+        self.assertIs(compile_renderer('ar', 'ordinal', gender='f'), render)
+        NumberConverter.reload(['ar'], force=True)
+        self.assertIsNot(compile_renderer('ar', 'ordinal', gender='f'), render)
+
+    def test_cache_bounded(self):
+        """Test least recently used renderers and their source are dropped."""
+        with mock.patch.object(compiler, 'MAX_RENDERERS', 3):
+            kept = compile_renderer('en', 'ordinal')
+            for prefix in ('minus', 'less', 'under', 'below'):
+                compile_renderer('en', overlay=LanguageOverlay('en', negative_prefix=prefix))
+                self.assertIs(compile_renderer('en', 'ordinal'), kept)
+            self.assertEqual(len(compiler._renderers), 3)
+        filenames = {filename for _, filename in compiler._renderers.values()}
+        generated = {name for name in linecache.cache if name.startswith('<numwordify.compiler')}
+        self.assertEqual(generated, filenames)
+
+    def test_constants_folded(self):
+        """Test the source holds literals for the options and nothing else."""
+        source = generate_source('en', 'cardinal', grouping='indian')
+        self.assertIn("' lakh'", source)
+        self.assertNotIn('self', source)
+        source = generate_source('ar', 'currency', currency='SAR')
+        self.assertIn("' و '", source)
+        self.assertNotIn('gender', source)
+        self.assertNotIn('sub', source.split('def render')[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
 """Tests for currency conversion."""
 
 import unittest
-from numwordify import num2words
+from numwordify import convert_batch, num2words, register_currency
+from numwordify.cache import ResultCache
+from numwordify.config.settings import Settings
+from numwordify.converter import NumberConverter
 
 
 class TestCurrencyConversion(unittest.TestCase):
@@ -96,6 +99,118 @@ class TestCurrencyConversion(unittest.TestCase):
         self.assertIn("dollars", result)
 
 
+class TestMinorUnits(unittest.TestCase):
+    """Test integer minor-unit amounts."""
+    
+    def test_three_decimal_currencies(self):
+        """Test fils amounts split exactly."""
+        self.assertEqual(num2words(12345, lang='en', to='currency', currency='KWD', minor_units=True),
+                         "twelve dinars and three hundred forty-five fils")
+        self.assertEqual(num2words(1005, lang='en', to='currency', currency='KWD', minor_units=True),
+                         "one dinar and five fils")
+        self.assertEqual(num2words(12345, lang='ar', to='currency', currency='BHD', minor_units=True),
+                         num2words(12.345, lang='ar', to='currency', currency='BHD'))
+    
+    def test_matches_float_amounts(self):
+        """Test minor units give the same words as the equivalent amount."""
+        for cents in (0, 1, 99, 100, 101, 250, -1999, 123456789):
+            for lang in ('en', 'ar'):
+                self.assertEqual(
+                    num2words(cents, lang=lang, to='currency', currency='USD', minor_units=True),
+                    num2words(cents / 100, lang=lang, to='currency', currency='USD'))
+    
+    def test_exact_beyond_float_precision(self):
+        """Test huge amounts keep every digit."""
+        self.assertEqual(num2words(10 ** 20 + 1, to='currency', currency='USD', minor_units=True),
+                         "one quintillion dollars and one cent")
+    
+    def test_batch(self):
+        """Test minor units in batch conversion."""
+        self.assertEqual(convert_batch([100, 250], to='currency', currency='USD', minor_units=True),
+                         ["one dollar", "two dollars and fifty cents"])
+    
+    def test_requires_integers(self):
+        """Test non-integer amounts are rejected."""
+        with self.assertRaises(TypeError):
+            num2words(12.5, to='currency', currency='USD', minor_units=True)
+        with self.assertRaises(TypeError):
+            convert_batch([1, 2.5], to='currency', currency='USD', minor_units=True)
+
+
+class TestRegisterCurrency(unittest.TestCase):
+    """Test runtime currency registration."""
+    
+    def setUp(self):
+        NumberConverter._initialize_converters()
+        self.registered = {name: dict(currencies)
+                           for name, currencies in NumberConverter._converters['en']._registered_currencies.items()}
+        self.supported = dict(Settings.SUPPORTED_CURRENCIES)
+        self.addCleanup(self.restore)
+    
+    def restore(self):
+        NumberConverter._converters['en']._registered_currencies.clear()
+        NumberConverter._converters['en']._registered_currencies.update(self.registered)
+        Settings.SUPPORTED_CURRENCIES.clear()
+        Settings.SUPPORTED_CURRENCIES.update(self.supported)
+        NumberConverter.reload(force=True)
+    
+    def test_register_english(self):
+        """Test a registered currency converts like a built-in one."""
+        register_currency('btc', 'en', name='bitcoin', plural='bitcoins', subunit='satoshi',
+                          subunit_plural='satoshis', subunit_factor=100000000)
+        self.assertEqual(num2words(2.00000001, to='currency', currency='BTC'),
+                         "two bitcoins and one satoshi")
+        self.assertEqual(num2words(1, to='currency', currency='BTC'), "one bitcoin")
+        self.assertEqual(Settings.validate_currency('btc'), 'BTC')
+        with self.assertRaises(ValueError):
+            num2words(1, lang='ar', to='currency', currency='BTC')
+    
+    def test_register_arabic_forms(self):
+        """Test Arabic agreement forms are compiled for registered currencies."""
+        register_currency('PTS', 'ar', name='نقطة', plural='نقاط', dual='نقطتان',
+                          subunit_factor=1, use_tanween_for_main=False)
+        self.assertEqual(num2words(2, lang='ar', to='currency', currency='PTS'), "إثنان نقطتان")
+        self.assertEqual(num2words(5, lang='ar', to='currency', currency='PTS'), "خمسة نقاط")
+        self.assertEqual(num2words(1, lang='ar', to='currency', currency='PTS'), "نقطة واحد")
+    
+    def test_survives_reload(self):
+        """Test registrations are kept when the language data is reloaded."""
+        register_currency('CRD', 'en', name='credit', plural='credits', subunit_factor=1)
+        NumberConverter.reload(['en'], force=True)
+        self.assertEqual(num2words(3, to='currency', currency='CRD'), "three credits")
+    
+    def test_styled_variants(self):
+        """Test a currency registered after a style variant was built is styled too."""
+        self.assertEqual(num2words(1, style='upper'), "ONE")
+        register_currency('CRD', 'en', name='credit', plural='credits', subunit_factor=1)
+        self.assertEqual(num2words(3, to='currency', currency='CRD', style='upper'), "THREE CREDITS")
+    
+    def test_replace(self):
+        """Test replacing a currency needs replace=True and invalidates caches."""
+        cache = ResultCache()
+        self.assertEqual(cache.convert(1, to='currency', currency='USD'), "one dollar")
+        with self.assertRaises(ValueError):
+            register_currency('USD', 'en', name='buck', subunit='cent')
+        register_currency('USD', 'en', name='buck', plural='bucks', subunit='cent',
+                          subunit_plural='cents', replace=True)
+        self.assertEqual(cache.convert(1, to='currency', currency='USD'), "one buck")
+    
+    def test_invalid_registrations(self):
+        """Test invalid codes and forms are rejected."""
+        with self.assertRaises(ValueError):
+            register_currency('not a code', 'en', name='x', subunit_factor=1)
+        with self.assertRaises(ValueError):
+            register_currency('XX', 'fr', name='x', subunit_factor=1)
+        with self.assertRaises(ValueError):
+            register_currency('XX', 'en', name='x')
+        with self.assertRaises(ValueError):
+            register_currency('XX', 'en', name='x', subunit_factor=1, dual='y')
+        with self.assertRaises(ValueError):
+            register_currency('XX', 'en', name='', subunit_factor=1)
+        with self.assertRaises(ValueError):
+            register_currency('XX', 'en', name='x', subunit_factor=0)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,284 @@
+"""Differential tests comparing every conversion path against the reference.
+
+Each engine in ``ENGINES`` is a callable ``(number, lang, to, kwargs) -> str``
+that must produce exactly what ``tests.reference.reference_num2words``
+produces, or raise the same exception type. Engines in ``CARDINAL_ENGINES``
+only render cardinals of ints and are checked on those cases alone.
+Boundary values are always
+checked; randomized inputs are generated until ``NUMWORDIFY_FUZZ_BUDGET``
+seconds (default 2) have been spent.
+"""
+
+import asyncio
+import os
+import random
+import time
+import unittest
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Tuple
+
+from numwordify import convert_batch, iter_range, num2words, stream_words
+from numwordify.cache import ResultCache
+from numwordify.coalescer import ConversionCoalescer
+from numwordify.compiler import compile_renderer
+from numwordify.encoded import convert_batch_encoded
+from numwordify.parallel import parallel_words
+from tests.reference import reference_converter, reference_num2words
+
+FUZZ_BUDGET = float(os.environ.get('NUMWORDIFY_FUZZ_BUDGET', '2'))
+FUZZ_SEED = int(os.environ.get('NUMWORDIFY_FUZZ_SEED', '20240101'))
+
+LANGUAGES = ('en', 'ar')
+FORMS = ('cardinal', 'ordinal', 'currency')
+GENDERS = ('m', 'f')
+
+Case = Tuple[Any, str, str, Dict[str, Any]]
+
+
+def _engine_num2words(number, lang, to, kwargs):
+    return num2words(number, lang=lang, to=to, **kwargs)
+
+
+def _engine_batch(number, lang, to, kwargs):
+    # Surround the number with repeats so the per-batch memo is exercised
+    return convert_batch([number, number], lang=lang, to=to, **kwargs)[1]
+
+
+_CACHE = ResultCache(maxsize=4096)
+
+
+def _engine_cached(number, lang, to, kwargs):
+    # The second call is answered from the cache
+    _CACHE.convert(number, lang=lang, to=to, **kwargs)
+    return _CACHE.convert(number, lang=lang, to=to, **kwargs)
+
+
+def _engine_compiled(number, lang, to, kwargs):
+    return compile_renderer(lang, to, **kwargs)(number)
+
+
+def _engine_encoded(number, lang, to, kwargs):
+    return convert_batch_encoded([number, number], lang=lang, to=to, **kwargs)[1]
+
+
+def _engine_stream(number, lang, to, kwargs):
+    # Small blocks split the digits mid-group
+    return ''.join(stream_words(str(number), lang, block_size=4, **kwargs))
+
+
+class _InlineExecutor(Executor):
+    """Runs each submitted call at once, in the calling thread."""
+
+    def submit(self, fn, *args, **kwargs):
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:  # noqa: BLE001 - re-raised by the future
+            future.set_exception(exc)
+        return future
+
+
+def _engine_parallel(number, lang, to, kwargs):
+    # An executor makes even small numbers render as separate segments
+    return parallel_words(number, lang, executor=_InlineExecutor(), **kwargs)
+
+
+ENGINES: Dict[str, Callable[[Any, str, str, Dict[str, Any]], str]] = {
+    'num2words': _engine_num2words,
+    'batch': _engine_batch,
+    'cached': _engine_cached,
+    'compiled': _engine_compiled,
+    'encoded': _engine_encoded,
+}
+
+CARDINAL_ENGINES: Dict[str, Callable[[Any, str, str, Dict[str, Any]], str]] = {
+    'stream': _engine_stream,
+    'parallel': _engine_parallel,
+}
+
+
+def _option_sets(lang: str, to: str) -> List[Dict[str, Any]]:
+    """All keyword combinations worth exercising for a language/form."""
+    genders = GENDERS if lang == 'ar' else (None,)
+    if to == 'currency':
+        currencies = list(reference_converter(lang).currencies)
+    else:
+        currencies = [None]
+    options = []
+    for gender in genders:
+        for currency in currencies:
+            kwargs = {}
+            if gender is not None:
+                kwargs['gender'] = gender
+            if currency is not None:
+                kwargs['currency'] = currency
+            options.append(kwargs)
+    return options
+
+
+def boundary_numbers() -> List[Any]:
+    """Numbers sitting on every chunk, scale and table boundary."""
+    numbers: List[Any] = [0, 1, 2, 3, 9, 10, 11, 12, 19, 20, 21, 99, 100, 101, 102,
+                          110, 111, 199, 200, 201, 999]
+    for exponent in range(3, 40, 3):
+        base = 10 ** exponent
+        for multiplier in (1, 2, 3, 10, 11, 100, 101):
+            numbers.extend((multiplier * base - 1, multiplier * base, multiplier * base + 1))
+    numbers.extend((10 ** 100, 10 ** 100 + 7, 2 ** 200, 999 * 10 ** 36 + 123))
+    numbers.extend((0.0, 0.5, 0.05, 0.001, 1.01, 1.1, 1.25, 123.45, 999.999,
+                    0.1 + 0.2, 1234567.891, 1.0e15 + 0.5, 2.675, 1.005))
+    numbers.extend([-n for n in list(numbers) if n])
+    numbers.extend((float('inf'), float('-inf'), float('nan')))
+    return numbers
+
+
+def random_number(rng: random.Random) -> Any:
+    """Draw an int or float spread across magnitudes, signs and precisions."""
+    kind = rng.random()
+    sign = -1 if rng.random() < 0.2 else 1
+    if kind < 0.5:
+        return sign * rng.randrange(10 ** rng.randint(1, 12))
+    if kind < 0.65:
+        return sign * rng.randrange(10 ** rng.randint(13, 60))
+    digits = rng.randint(1, 10)
+    return sign * round(rng.uniform(0, 10 ** rng.randint(0, 9)), digits)
+
+
+def _outcome(func: Callable[..., str], *args) -> Tuple[str, Any]:
+    try:
+        return 'ok', func(*args)
+    except Exception as exc:  # noqa: BLE001 - exception type is the result
+        return 'error', type(exc)
+
+
+class DifferentialTestCase(unittest.TestCase):
+    """Base class asserting engines against the reference implementation."""
+
+    engines = ENGINES
+    cardinal_engines = CARDINAL_ENGINES
+
+    def engines_for(self, number, to):
+        """The engines that accept a number and form."""
+        if to == 'cardinal' and type(number) is int:
+            return {**self.engines, **self.cardinal_engines}
+        return self.engines
+
+    def assertMatchesReference(self, number, lang, to, kwargs):
+        expected = _outcome(lambda: reference_num2words(number, lang, to, **dict(kwargs)))
+        for name, engine in self.engines_for(number, to).items():
+            actual = _outcome(engine, number, lang, to, dict(kwargs))
+            if actual != expected:
+                self.fail(
+                    f"engine {name!r} diverged for num2words({number!r}, lang={lang!r}, "
+                    f"to={to!r}, **{kwargs!r}): expected {expected!r}, got {actual!r}"
+                )
+
+
+class TestDifferential(DifferentialTestCase):
+    """Compare all registered engines against the frozen reference."""
+
+    def test_boundary_values(self):
+        """Every boundary number in every language, form and option set."""
+        numbers = boundary_numbers()
+        for lang in LANGUAGES:
+            for to in FORMS:
+                for kwargs in _option_sets(lang, to):
+                    for number in numbers:
+                        self.assertMatchesReference(number, lang, to, kwargs)
+
+    def test_randomized(self):
+        """Random inputs until the fuzz budget is spent."""
+        rng = random.Random(FUZZ_SEED)
+        deadline = time.perf_counter() + FUZZ_BUDGET
+        combos = [(lang, to, kwargs) for lang in LANGUAGES for to in FORMS
+                  for kwargs in _option_sets(lang, to)]
+        iterations = 0
+        while time.perf_counter() < deadline or iterations < len(combos):
+            lang, to, kwargs = combos[iterations % len(combos)]
+            self.assertMatchesReference(random_number(rng), lang, to, kwargs)
+            iterations += 1
+
+    def test_batch_preserves_order(self):
+        """A mixed batch equals the reference applied element-wise."""
+        numbers = boundary_numbers()
+        for lang in LANGUAGES:
+            for to in FORMS:
+                for kwargs in _option_sets(lang, to)[:2]:
+                    expected = [reference_num2words(n, lang, to, **dict(kwargs)) for n in numbers]
+                    self.assertEqual(convert_batch(numbers, lang=lang, to=to, **kwargs), expected)
+
+    def test_coalescer(self):
+        """Concurrent coalesced calls resolve exactly like the reference."""
+        numbers = boundary_numbers()
+
+        async def run(lang, to, kwargs):
+            coalescer = ConversionCoalescer(max_batch_size=64)
+            calls = [coalescer.convert(n, lang=lang, to=to, **kwargs) for n in numbers]
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        for lang in LANGUAGES:
+            for to in FORMS:
+                for kwargs in _option_sets(lang, to)[:2]:
+                    results = asyncio.run(run(lang, to, kwargs))
+                    for number, result in zip(numbers, results):
+                        expected = _outcome(lambda: reference_num2words(number, lang, to, **dict(kwargs)))
+                        actual = ('error', type(result)) if isinstance(result, Exception) else ('ok', result)
+                        self.assertEqual(actual, expected, f"coalescer diverged for {number!r}")
+
+    def test_digits_mode(self):
+        """Digit reading matches the reference read one digit at a time."""
+        rng = random.Random(FUZZ_SEED)
+        numbers = [0, 7, 10, 1000, 10 ** 30 + 5] + [rng.randrange(10 ** 20) for _ in range(200)]
+        for lang in LANGUAGES:
+            for gender in GENDERS:
+                converter = reference_converter(lang)
+                kwargs = {'gender': gender} if lang == 'ar' else {}
+                for number in numbers:
+                    expected = ' '.join(converter._to_cardinal(int(d), **kwargs) for d in str(number))
+                    for engine in self.engines.values():
+                        self.assertEqual(engine(number, lang, 'digits', dict(kwargs)), expected)
+                        self.assertEqual(engine(str(number), lang, 'digits', dict(kwargs)), expected)
+
+    def test_default_grouping(self):
+        """Naming the default grouping system changes nothing."""
+        for lang in LANGUAGES:
+            for to in FORMS:
+                for number in boundary_numbers():
+                    kwargs = {'grouping': 'short'}
+                    expected = _outcome(reference_num2words, number, lang, to)
+                    for name, engine in self.engines_for(number, to).items():
+                        actual = _outcome(engine, number, lang, to, kwargs)
+                        self.assertEqual(actual, expected, f"{name} with grouping='short' on {number!r}")
+
+    def test_iter_range(self):
+        """Odometer ranges match the reference around every chunk boundary."""
+        rng = random.Random(FUZZ_SEED)
+        starts = [0, 995, 999995, 1000995, 10 ** 9 - 3, 10 ** 36 - 3]
+        starts += [rng.randrange(10 ** rng.randint(3, 20)) for _ in range(20)]
+        for lang in LANGUAGES:
+            for to in ('cardinal', 'ordinal'):
+                for kwargs in _option_sets(lang, to):
+                    for start in starts:
+                        for begin, end, step in ((start, start + 20, 1), (-start, -start - 20, -3)):
+                            expected = [reference_num2words(n, lang, to, **dict(kwargs))
+                                        for n in range(begin, end, step)]
+                            actual = list(iter_range(begin, end, step, lang=lang, to=to, **kwargs))
+                            self.assertEqual(actual, expected, f"iter_range diverged from {begin}")
+
+    def test_invalid_inputs(self):
+        """Invalid inputs fail with the same exception type everywhere."""
+        cases: List[Case] = [
+            ('42', 'en', 'cardinal', {}),
+            (None, 'ar', 'cardinal', {}),
+            (42, 'fr', 'cardinal', {}),
+            (42, 'en', 'invalid', {}),
+            (42, 'ar', 'cardinal', {'gender': 'x'}),
+            (42, 'en', 'currency', {'currency': 'XYZ'}),
+            (42, 'ar', 'currency', {'currency': 'XYZ'}),
+        ]
+        for number, lang, to, kwargs in cases:
+            self.assertMatchesReference(number, lang, to, kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for digit-by-digit reading."""
+
+import unittest
+from numwordify import num2words, convert_batch
+
+
+class TestDigitsMode(unittest.TestCase):
+    """Test the 'digits' conversion type."""
+    
+    def test_integers(self):
+        """Test reading integers digit by digit."""
+        self.assertEqual(num2words(2024, to='digits'), "two zero two four")
+        self.assertEqual(num2words(0, to='digits'), "zero")
+        self.assertEqual(num2words(-15, to='digits'), "negative one five")
+        self.assertEqual(num2words(907, lang='ar', to='digits'), "تسعة صفر سبعة")
+        self.assertEqual(num2words(907, lang='ar', to='digits', gender='f'), "تسع صفر سبع")
+    
+    def test_floats(self):
+        """Test reading the decimal part after the decimal separator."""
+        self.assertEqual(num2words(3.14, to='digits'), "three point one four")
+        self.assertEqual(num2words(1.5, lang='ar', to='digits'), "واحد فاصل خمسة")
+    
+    def test_digit_strings(self):
+        """Test card numbers, phone numbers and leading zeros."""
+        self.assertEqual(num2words("007", to='digits'), "zero zero seven")
+        self.assertEqual(num2words("050-123", to='digits'), "zero five zero, one two three")
+        self.assertEqual(
+            num2words("4111111111111111", to='digits', group_size=4),
+            "four one one one, one one one one, one one one one, one one one one"
+        )
+        self.assertEqual(num2words("12 34", to='digits', group_size=3, group_separator=' - '),
+                         "one two three - four")
+    
+    def test_ibans_and_phone_numbers(self):
+        """Test IBAN letters, a leading '+' and parentheses."""
+        self.assertEqual(num2words("SA03 8000 0000 6080 1016 7519", to='digits').split(', ')[:2],
+                         ["S A zero three", "eight zero zero zero"])
+        self.assertEqual(num2words("gb82 west 12", to='digits'),
+                         "G B eight two, W E S T, one two")
+        self.assertEqual(num2words("+1 555-123-4567", to='digits'),
+                         "plus one, five five five, one two three, four five six seven")
+        self.assertEqual(num2words("(555) 123-4567", to='digits'),
+                         "five five five, one two three, four five six seven")
+        self.assertEqual(num2words("+966 50", lang='ar', to='digits'), "زائد تسعة ستة ستة، خمسة صفر")
+    
+    def test_arabic_indic_digits(self):
+        """Test Arabic-Indic and Extended Arabic-Indic digit input."""
+        self.assertEqual(num2words("١٢٣", lang='ar', to='digits'), "واحد إثنان ثلاثة")
+        self.assertEqual(num2words("٠٥ ٦٧", lang='ar', to='digits'), "صفر خمسة، ستة سبعة")
+        self.assertEqual(num2words("۱۲", to='digits'), "one two")
+    
+    def test_long_reference(self):
+        """Test a 30-digit reference."""
+        reference = "123456789012345678901234567890"
+        words = num2words(reference, to='digits')
+        self.assertEqual(len(words.split()), 30)
+        self.assertTrue(words.endswith("eight nine zero"))
+    
+    def test_batch(self):
+        """Test digit strings through the batch path."""
+        self.assertEqual(convert_batch(["12", 3], to='digits'), ["one two", "three"])
+    
+    def test_invalid_digit_strings(self):
+        """Test rejection of non-digit input."""
+        for text in ("12?", "", "ABC", "1.5", "+-1", "12+3"):
+            with self.assertRaises(ValueError):
+                num2words(text, to='digits')
+        for group_size in (-1, 0):
+            with self.assertRaises(ValueError):
+                num2words("1234", to='digits', group_size=group_size)
+        with self.assertRaises(TypeError):
+            num2words("12", to='cardinal')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for the Django integration."""
+
+import unittest
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
+
+from numwordify import num2words
+from numwordify.contrib.django import memo
+from numwordify.contrib.django.queryset import convert_field, words_map
+
+try:
+    import django
+except ImportError:  # pragma: no cover - Django is optional
+    django = None
+
+try:
+    import rest_framework
+except ImportError:  # pragma: no cover - DRF is optional
+    rest_framework = None
+
+
+def setUpModule():
+    # Imported here: an unconfigured LazySettings at module scope breaks
+    # unittest discovery, which inspects module attributes
+    if django is None:
+        return
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure(
+            INSTALLED_APPS=['numwordify.contrib.django'],
+            TEMPLATES=[{'BACKEND': 'django.template.backends.django.DjangoTemplates'}],
+        )
+        django.setup()
+
+
+class TestMemo(unittest.TestCase):
+    """Test the per-request memo."""
+    
+    def test_no_scope_converts_directly(self):
+        """Test that conversions work without an active memo."""
+        self.assertIsNone(memo.active_memo())
+        self.assertEqual(memo.memoized_num2words(42), "forty-two")
+    
+    def test_scope_memoizes(self):
+        """Test that repeated values are converted once per scope."""
+        with memo.memo_scope():
+            with mock.patch.object(memo, 'num2words', wraps=num2words) as spy:
+                for _ in range(5):
+                    self.assertEqual(memo.memoized_num2words(7, lang='ar'), "سبعة")
+                self.assertEqual(spy.call_count, 1)
+        self.assertIsNone(memo.active_memo())
+    
+    def test_batch_fills_only_missing(self):
+        """Test that memoized_batch converts only values not yet memoized."""
+        with memo.memo_scope() as active:
+            memo.memoized_num2words(1)
+            with mock.patch.object(memo, 'convert_batch', wraps=memo.convert_batch) as spy:
+                self.assertEqual(memo.memoized_batch([1, 2, 3]), ["one", "two", "three"])
+                spy.assert_called_once_with([2, 3], lang='en', to='cardinal')
+            self.assertEqual(len(active), 3)
+    
+    def test_middleware_opens_scope(self):
+        """Test that the middleware gives each request its own memo."""
+        from numwordify.contrib.django.middleware import ConversionMemoMiddleware
+        seen = []
+        middleware = ConversionMemoMiddleware(lambda request: seen.append(memo.active_memo()))
+        middleware(object())
+        middleware(object())
+        self.assertEqual(seen, [{}, {}])
+        self.assertIsNot(seen[0], seen[1])
+        self.assertIsNone(memo.active_memo())
+    
+    def test_to_number(self):
+        """Test coercion of model and template values."""
+        self.assertEqual(memo.to_number(Decimal('12.00')), 12)
+        self.assertEqual(memo.to_number(Decimal('12.50')), 12.5)
+        self.assertEqual(memo.to_number(" 42 "), 42)
+        self.assertEqual(memo.to_number("1.5"), 1.5)
+        with self.assertRaises(TypeError):
+            memo.to_number(True)
+        with self.assertRaises(ValueError):
+            memo.to_number("abc")
+
+
+class TestQuerysetHelpers(unittest.TestCase):
+    """Test bulk conversion of model fields."""
+    
+    def test_convert_field(self):
+        """Test attaching words to every object in one batch."""
+        rows = [SimpleNamespace(total=Decimal('10.50')), SimpleNamespace(total=None),
+                SimpleNamespace(total=Decimal('10.50'))]
+        with mock.patch('numwordify.contrib.django.memo.convert_batch',
+                        wraps=memo.convert_batch) as spy:
+            result = convert_field(rows, 'total', to='currency', currency='USD')
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(result[0].total_words, "ten dollars and fifty cents")
+        self.assertIsNone(result[1].total_words)
+        self.assertEqual(result[2].total_words, result[0].total_words)
+    
+    def test_convert_field_related_lookup(self):
+        """Test following a related__field path."""
+        rows = [SimpleNamespace(order=SimpleNamespace(quantity=3))]
+        convert_field(rows, 'order__quantity', lang='ar', attr='qty')
+        self.assertEqual(rows[0].qty, "ثلاثة")
+    
+    def test_words_map(self):
+        """Test building a value-to-words lookup table."""
+        self.assertEqual(words_map([1, 2, 1, None]), {1: "one", 2: "two"})
+
+
+@unittest.skipIf(django is None, "Django is not installed")
+class TestTemplateFilters(unittest.TestCase):
+    """Test the template filters."""
+    
+    def render(self, source, **context):
+        from django.template import Context, Template
+        return Template("{% load numwordify %}" + source).render(Context(context))
+    
+    def test_filters(self):
+        """Test num2words, ordinal_words and currency_words filters."""
+        self.assertEqual(self.render("{{ n|num2words }}", n=42), "forty-two")
+        self.assertEqual(self.render('{{ n|num2words:"en,ordinal" }}', n=2), "second")
+        self.assertEqual(self.render('{{ n|ordinal_words }}', n=3), "third")
+        self.assertEqual(self.render('{{ n|currency_words:"USD" }}', n=Decimal('1.01')),
+                         "one dollar and one cent")
+    
+    def test_invalid_value_passthrough(self):
+        """Test that unconvertible values are rendered unchanged."""
+        self.assertEqual(self.render("{{ n|num2words }}", n="abc"), "abc")
+
+
+@unittest.skipIf(django is None or rest_framework is None, "Django REST framework is not installed")
+class TestSerializerField(unittest.TestCase):
+    """Test the DRF serializer field."""
+    
+    def test_many_batches_once(self):
+        """Test that many=True serialization converts all rows in one batch."""
+        from rest_framework import serializers
+        from numwordify.contrib.django.serializers import NumberWordsField
+        
+        class RowSerializer(serializers.Serializer):
+            words = NumberWordsField(source='amount', to='currency', currency='USD')
+        
+        rows = [SimpleNamespace(amount=n) for n in (1, 2, 1, 3)]
+        with mock.patch('numwordify.contrib.django.memo.convert_batch',
+                        wraps=memo.convert_batch) as spy:
+            data = RowSerializer(rows, many=True).data
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual([row['words'] for row in data],
+                         [num2words(n, to='currency', currency='USD') for n in (1, 2, 1, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Tests for dictionary-encoded batch results."""
+
+import io
+import random
+import sys
+import unittest
+from numwordify import convert_batch
+from numwordify.encoded import EncodedBatch, PhraseDictionary, convert_batch_encoded
+
+
+class TestEncodedBatch(unittest.TestCase):
+    """Test EncodedBatch against convert_batch."""
+
+    def setUp(self):
+        rng = random.Random(43)
+        self.numbers = [rng.randrange(10 ** rng.randint(1, 15)) for _ in range(3000)]
+        self.numbers += [0, -7, 1.25, 10 ** 60 + 1]
+
+    def test_matches_convert_batch(self):
+        """Test every language and form decodes to the plain results."""
+        for lang, to, kwargs in (('en', 'cardinal', {}), ('en', 'ordinal', {}),
+                                 ('en', 'currency', {'currency': 'EUR'}),
+                                 ('ar', 'cardinal', {'gender': 'f'}), ('ar', 'ordinal', {}),
+                                 ('ar', 'currency', {'currency': 'KWD'})):
+            expected = convert_batch(self.numbers, lang=lang, to=to, **kwargs)
+            batch = convert_batch_encoded(iter(self.numbers), lang=lang, to=to, **kwargs)
+            self.assertEqual(len(batch), len(expected))
+            self.assertEqual(list(batch), expected)
+            self.assertEqual(batch[-1], expected[-1])
+            self.assertEqual(batch[10:20:3], expected[10:20:3])
+
+    def test_smaller_than_strings(self):
+        """Test the encoded results take a fraction of the string memory."""
+        batch = convert_batch_encoded(self.numbers)
+        strings = sum(sys.getsizeof(words) + 8 for words in convert_batch(self.numbers))
+        self.assertLess(batch.nbytes * 3, strings)
+
+    def test_write(self):
+        """Test writing straight to a file object."""
+        batch = convert_batch_encoded(range(5), lang='ar')
+        output = io.StringIO()
+        self.assertEqual(batch.write(output), 5)
+        self.assertEqual(output.getvalue(), '\n'.join(convert_batch(range(5), lang='ar')) + '\n')
+
+    def test_vocabulary_growth(self):
+        """Test new words are added and IDs widen past two bytes."""
+        batch = EncodedBatch(PhraseDictionary())
+        words = [f"w{i} x" for i in range(70000)]
+        batch.extend(words)
+        batch.append('')
+        self.assertEqual(batch[69999], 'w69999 x')
+        self.assertEqual(batch[-1], '')
+        self.assertEqual(batch._ids.typecode, 'I')
+        with self.assertRaises(IndexError):
+            batch[len(batch)]
+
+    def test_invalid_input(self):
+        """Test errors match convert_batch."""
+        with self.assertRaises(TypeError):
+            convert_batch_encoded([1, '2'])
+        with self.assertRaises(ValueError):
+            convert_batch_encoded([1], lang='fr')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -66,6 +66,33 @@ class TestEnglishConversion(unittest.TestCase):
             num2words([42])
 
 
+class TestEnglishGrouping(unittest.TestCase):
+    """Test the digit-grouping systems."""
+    
+    def test_indian_grouping(self):
+        """Test lakh/crore grouping."""
+        self.assertEqual(num2words(1234567, grouping='indian'),
+                         "twelve lakh thirty-four thousand five hundred sixty-seven")
+        self.assertEqual(num2words(10 ** 7, grouping='indian'), "one crore")
+        self.assertEqual(num2words(10 ** 12, grouping='indian'), "one lakh crore")
+        self.assertEqual(num2words(250000, to='currency', currency='USD', grouping='indian'),
+                         "two lakh fifty thousand dollars")
+    
+    def test_long_scale(self):
+        """Test long-scale grouping."""
+        self.assertEqual(num2words(2 * 10 ** 9, grouping='long'), "two milliard")
+        self.assertEqual(num2words(10 ** 12 + 1, grouping='long'), "one billion one")
+        self.assertEqual(num2words(2 * 10 ** 9 + 2, grouping='long', to='ordinal'), "two milliard second")
+    
+    def test_default_grouping(self):
+        """Test the short scale is the default and unknown systems are rejected."""
+        self.assertEqual(num2words(10 ** 9, grouping='SHORT'), num2words(10 ** 9))
+        with self.assertRaises(ValueError):
+            num2words(5, grouping='roman')
+        with self.assertRaises(ValueError):
+            num2words(5, lang='ar', grouping='indian')
+
+
 if __name__ == '__main__':
     unittest.main()
 
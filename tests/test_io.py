@@ -0,0 +1,139 @@
+"""Tests for the streaming CSV/JSONL transformer."""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from numwordify import num2words
+from numwordify.cache import ResultCache
+from numwordify.io import Column, main, parse_number, transform_csv, transform_jsonl
+
+
+class TestParseNumber(unittest.TestCase):
+    """Test exact field parsing."""
+    
+    def test_exact_parsing(self):
+        """Test integers stay int and fractions become Decimal."""
+        self.assertEqual(parse_number(' 42 '), 42)
+        self.assertIsInstance(parse_number('42'), int)
+        self.assertEqual(parse_number('12.10'), Decimal('12.10'))
+        self.assertEqual(parse_number('98765432109876543210.5'), Decimal('98765432109876543210.5'))
+        self.assertIsNone(parse_number(''))
+        self.assertIsNone(parse_number(None))
+    
+    def test_invalid_fields(self):
+        """Test non-numeric fields are rejected."""
+        with self.assertRaises(ValueError):
+            parse_number('abc')
+        with self.assertRaises(ValueError):
+            parse_number(True)
+    
+    def test_decimal_conversion(self):
+        """Test Decimals convert like the equivalent float, without rounding."""
+        self.assertEqual(num2words(Decimal('12.5')), num2words(12.5))
+        self.assertEqual(num2words(Decimal('-3.25'), to='currency', currency='USD'),
+                         num2words(-3.25, to='currency', currency='USD'))
+        self.assertEqual(num2words(Decimal('123456789012345678901234.75'), to='currency', currency='USD'),
+                         "one hundred twenty-three sextillion four hundred fifty-six quintillion "
+                         "seven hundred eighty-nine quadrillion twelve trillion three hundred "
+                         "forty-five billion six hundred seventy-eight million nine hundred one "
+                         "thousand two hundred thirty-four dollars and seventy-five cents")
+        self.assertEqual(num2words(Decimal('NaN')), num2words(float('nan')))
+
+
+class TestTransformCSV(unittest.TestCase):
+    """Test CSV column transformation."""
+    
+    SOURCE = "id,amount,qty\n1,12.50,3\n2,,4\n3,1000000,21\n"
+    
+    def transform(self, columns, source=None, **kwargs):
+        output = io.StringIO()
+        count = transform_csv(io.StringIO(source or self.SOURCE), output, columns, **kwargs)
+        return count, output.getvalue().splitlines()
+    
+    def test_per_column_options(self):
+        """Test each column is converted with its own options."""
+        count, lines = self.transform([
+            Column('qty', to='ordinal'),
+            Column('amount', output='amount_ar', lang='ar', to='currency', currency='SAR'),
+        ], batch_size=2)
+        self.assertEqual(count, 3)
+        self.assertEqual(lines[0], "id,amount,qty,qty_words,amount_ar")
+        self.assertEqual(lines[1], "1,12.50,3,third,%s" % num2words(12.5, lang='ar', to='currency', currency='SAR'))
+        self.assertEqual(lines[2], "2,,4,fourth,")
+        self.assertEqual(lines[3].split(',')[3], "twenty-first")
+    
+    def test_specs_and_mappings(self):
+        """Test string specs and mappings are accepted."""
+        _, from_spec = self.transform(['amount:to=currency,currency=USD,output=usd'])
+        _, from_mapping = self.transform({'amount': {'to': 'currency', 'currency': 'USD', 'output': 'usd'}})
+        self.assertEqual(from_spec, from_mapping)
+        self.assertEqual(from_spec[1], "1,12.50,3,twelve dollars and fifty cents")
+    
+    def test_typed_spec_options(self):
+        """Test boolean and integer options in string specs."""
+        column = Column.parse('qty:to=currency,currency=KWD,minor_units=true')
+        self.assertIs(column.kwargs['minor_units'], True)
+        _, lines = self.transform([column])
+        self.assertEqual(lines[1], "1,12.50,3,zero dinars and three fils")
+    
+    def test_errors(self):
+        """Test bad fields raise with their line or are blanked."""
+        source = "amount\n1\nabc\n3\n"
+        with self.assertRaisesRegex(ValueError, "Line 3"):
+            self.transform(['amount'], source)
+        _, lines = self.transform(['amount'], source, on_error='blank')
+        self.assertEqual(lines[1:], ["1,one", "abc,", "3,three"])
+        with self.assertRaises(ValueError):
+            self.transform(['missing'])
+        with self.assertRaises(ValueError):
+            self.transform(['amount:lang=xx'])
+    
+    def test_shared_cache(self):
+        """Test conversions can go through a ResultCache."""
+        cache = ResultCache()
+        self.transform(['qty'], cache=cache)
+        self.assertEqual(cache.stats()['size'], 3)
+
+
+class TestTransformJSONL(unittest.TestCase):
+    """Test JSONL field transformation."""
+    
+    def test_splices_fields(self):
+        """Test new fields are appended and existing text is preserved."""
+        source = '{"id": 1, "amount": 0.10}\n{"id":2,"amount":"7"}\n\n{"amount": null}\n'
+        output = io.StringIO()
+        count = transform_jsonl(io.StringIO(source), output, ['amount:lang=ar'])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(count, 3)
+        self.assertTrue(lines[0].startswith('{"id": 1, "amount": 0.10, '))
+        self.assertEqual(json.loads(lines[0])['amount_words'], num2words(0.1, lang='ar'))
+        self.assertEqual(json.loads(lines[1])['amount_words'], num2words(7, lang='ar'))
+        self.assertIsNone(json.loads(lines[2])['amount_words'])
+    
+    def test_invalid_records(self):
+        """Test lines that are not JSON objects are rejected."""
+        with self.assertRaisesRegex(ValueError, "Record 2"):
+            transform_jsonl(io.StringIO('{"n": 1}\n[1]\n'), io.StringIO(), ['n'])
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test the command-line entry point."""
+    
+    def test_main(self):
+        """Test main converts a file and reports errors."""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'in.jsonl')
+            target = os.path.join(tmp, 'out.jsonl')
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write('{"n": 2}\n')
+            self.assertEqual(main([source, target, '--column', 'n:to=ordinal']), 0)
+            with open(target, encoding='utf-8') as f:
+                self.assertEqual(json.loads(f.read()), {'n': 2, 'n_words': 'second'})
+            self.assertEqual(main([source, target, '--column', 'n:to=bogus']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
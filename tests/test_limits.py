@@ -0,0 +1,124 @@
+"""Tests for input cost limits."""
+
+import time
+import unittest
+from decimal import Decimal
+from unittest import mock
+from numwordify import InputLimitError, convert_batch, iter_range, normalize_text, num2words
+from numwordify.compiler import compile_renderer
+from numwordify.config.settings import Settings
+from numwordify.converter import NumberConverter
+from numwordify.limits import check_limits, digit_counts, estimate_cost
+
+
+class TestInputLimits(unittest.TestCase):
+    """Test the limits configured in Settings."""
+    
+    def limit(self, **limits):
+        for name, value in limits.items():
+            patcher = mock.patch.object(Settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def test_disabled_by_default(self):
+        """Test no limit applies unless configured."""
+        self.assertEqual(num2words(10 ** 200), "one hundred (10^198)")
+    
+    def test_max_digits(self):
+        """Test the digit limit is exact at the boundary."""
+        self.limit(MAX_DIGITS=12)
+        self.assertEqual(num2words(10 ** 12 - 1), num2words(999999999999))
+        self.assertEqual(num2words(-(10 ** 12 - 1), lang='ar'), num2words(-999999999999, lang='ar'))
+        self.assertEqual(num2words(999999999999.0), num2words(999999999999))
+        for number in (10 ** 12, -(10 ** 12), Decimal('1E+12'), 1e12):
+            with self.assertRaises(InputLimitError) as context:
+                num2words(number)
+            self.assertEqual(context.exception.limit, 'MAX_DIGITS')
+        with self.assertRaises(InputLimitError):
+            num2words('1' * 13, to='digits')
+    
+    def test_rejected_before_work(self):
+        """Test a huge integer is rejected without being converted."""
+        self.limit(MAX_DIGITS=100)
+        huge = Decimal(7 ** 30000) * 10 ** 100000
+        start = time.perf_counter()
+        for convert in (num2words, compile_renderer(), compile_renderer('ar', 'currency')):
+            with self.assertRaises(InputLimitError):
+                convert(huge)
+        self.assertLess(time.perf_counter() - start, 0.5)
+    
+    def test_max_output_length(self):
+        """Test the worst-case output length bound."""
+        self.limit(MAX_OUTPUT_LENGTH=500)
+        words = num2words(123456789)
+        self.assertLessEqual(len(words), 500)
+        with self.assertRaises(InputLimitError) as context:
+            num2words(10 ** 30, lang='ar', to='ordinal')
+        self.assertEqual(context.exception.limit, 'MAX_OUTPUT_LENGTH')
+    
+    def test_max_cost(self):
+        """Test the default cost boundary and a custom cost estimate."""
+        self.assertEqual(estimate_cost(123456789), 6)
+        self.assertEqual(estimate_cost(10 ** 9), 10)
+        self.assertEqual(estimate_cost(123.45), 3)
+        self.limit(MAX_COST=10)
+        self.assertEqual(num2words(10 ** 9), "one billion")
+        self.assertEqual(num2words(0.5), num2words(Decimal('0.5')))
+        for number in (10 ** 12, 123456789012.5):
+            with self.assertRaises(InputLimitError):
+                num2words(number)
+        self.limit(COST_ESTIMATOR=lambda number, to: 100 if to == 'currency' else 0)
+        self.assertEqual(num2words(10 ** 20), "one hundred quintillion")
+        with self.assertRaises(InputLimitError):
+            num2words(1, to='currency')
+    
+    def test_every_entry_point(self):
+        """Test batches, ranges and renderers enforce the limits too."""
+        self.limit(MAX_DIGITS=6)
+        with self.assertRaises(InputLimitError):
+            convert_batch([1, 10 ** 6])
+        with self.assertRaises(InputLimitError):
+            iter_range(999990, 1000010)
+        with self.assertRaises(InputLimitError):
+            compile_renderer('ar', 'currency')(10 ** 6)
+        # The text normalizer leaves numbers over a limit as they are
+        self.assertEqual(normalize_text("5 and 1234567"), "five and 1234567")
+    
+    def test_huge_integer_boundary(self):
+        """Test digit estimates for huge integers never undercount."""
+        for digits in (70001, 100000):
+            self.assertGreaterEqual(digit_counts(10 ** digits - 1)[0], digits)
+            self.assertGreaterEqual(digit_counts(10 ** (digits - 1))[0], digits)
+        NumberConverter._initialize_converters()
+        english = NumberConverter._converters['en']
+        self.limit(MAX_DIGITS=99999)
+        with self.assertRaises(InputLimitError):
+            check_limits(10 ** 100000 - 1, english)
+        check_limits(10 ** 99999 - 1, english)
+        with self.assertRaises(InputLimitError):
+            check_limits(10 ** 99999, english)
+    
+    def test_digit_counts(self):
+        """Test digit estimates never undercount."""
+        for number in (0, 9, 10, 99, 2 ** 64, 10 ** 50 - 1, 10 ** 50):
+            integer_digits, _ = digit_counts(number)
+            self.assertIn(integer_digits - len(str(number)), (0, 1))
+        self.assertEqual(digit_counts(Decimal('12.345')), (2, 3))
+        self.assertEqual(digit_counts(0.5), (1, 1))
+        self.assertEqual(digit_counts(-123.45), (3, 2))
+        self.assertEqual(digit_counts(1e-20), (1, Settings.MAX_DECIMAL_DIGITS))
+        self.assertEqual(digit_counts(1.5e20), (21, 0))
+        self.limit(MAX_DIGITS=12)
+        self.assertEqual(num2words(123.45), num2words(Decimal('123.45')))
+        with self.assertRaises(InputLimitError):
+            num2words(1234567890.125)
+    
+    def test_is_value_error(self):
+        """Test existing ValueError handlers catch the limit error."""
+        self.limit(MAX_DIGITS=1)
+        with self.assertRaises(ValueError):
+            num2words(42)
+
+
+if __name__ == '__main__':
+    unittest.main()
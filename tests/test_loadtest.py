@@ -0,0 +1,78 @@
+"""Tests for the example apps' load-test harness."""
+
+import importlib.util
+import os
+import sys
+import unittest
+
+try:
+    import django
+except ImportError:  # pragma: no cover - Django is optional
+    django = None
+
+HARNESS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       'examples', 'loadtest.py')
+
+
+def load_harness():
+    if 'loadtest' not in sys.modules:
+        spec = importlib.util.spec_from_file_location('loadtest', HARNESS)
+        module = importlib.util.module_from_spec(spec)
+        # Registered before running, as the Django URLconf refers to it by name
+        sys.modules['loadtest'] = module
+        spec.loader.exec_module(module)
+    return sys.modules['loadtest']
+
+
+class TestLoadTestHarness(unittest.TestCase):
+    """Test the request mix, statistics and a short run."""
+
+    def setUp(self):
+        self.harness = load_harness()
+
+    def test_mixes(self):
+        """Test weighted mixes and magnitude ranges are parsed and drawn."""
+        harness = self.harness
+        self.assertEqual(harness.parse_mix('en=3, ar'), [('en', 3), ('ar', 1)])
+        self.assertEqual(harness.parse_magnitudes('1-3=2,7'), [((1, 3), 2), ((7, 7), 1)])
+        for spec in ('en=0', 'en=x', ''):
+            with self.assertRaises(ValueError):
+                harness.parse_mix(spec)
+        with self.assertRaises(ValueError):
+            harness.parse_magnitudes('3-1')
+        plan = harness.build_plan([('en', 1)], [('ordinal', 1)], [((4, 6), 1)], size=200)
+        self.assertEqual(plan, harness.build_plan([('en', 1)], [('ordinal', 1)], [((4, 6), 1)], size=200))
+        self.assertTrue(all(1000 <= number < 10 ** 6 for _, _, _, number in plan))
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles and the summary."""
+        harness = self.harness
+        values = [float(n) for n in range(1, 101)]
+        self.assertEqual(harness.percentile(values, 0.5), 50.0)
+        self.assertEqual(harness.percentile(values, 0.99), 99.0)
+        self.assertEqual(harness.percentile([], 0.5), 0.0)
+        plan = [('en', 'cardinal', '1-3 digits', 5)]
+        summary = harness.summarize([(0, 0.001, True), (0, 0.003, False)], 0.5, plan, breakdown=True)
+        self.assertEqual((summary['requests'], summary['errors'], summary['throughput']), (2, 1, 4.0))
+        self.assertEqual(summary['latency_ms']['p99'], 3.0)
+        self.assertIn('en cardinal 1-3 digits', summary['breakdown'])
+
+    @unittest.skipIf(django is None, "Django is not installed")
+    def test_django_run(self):
+        """Test a short run against the Django example served in-process."""
+        harness = self.harness
+        port, stop = harness.start_server('django', in_process=True)
+        try:
+            plan = harness.build_plan([('en', 1), ('ar', 1)], [('cardinal', 1), ('currency', 1)],
+                                      [((1, 9), 1)], size=50)
+            results, elapsed = harness.run_load('127.0.0.1', port, harness.APPS['django'], plan,
+                                                total=100, concurrency=4)
+        finally:
+            stop()
+        summary = harness.summarize(results, elapsed, plan)
+        self.assertEqual(summary['requests'], 100)
+        self.assertEqual(summary['errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Tests for per-tenant language overlays."""
+
+import unittest
+from numwordify import LanguageOverlay, compile_renderer, num2words, register_currency
+from numwordify.config.settings import Settings
+from numwordify.converter import NumberConverter
+
+
+class TestLanguageOverlay(unittest.TestCase):
+    """Test overrides layered over the language data."""
+
+    def test_currency_overrides(self):
+        """Test renamed and added currencies, leaving the base untouched."""
+        acme = LanguageOverlay('en', currencies={
+            'usd': {'name': 'buck', 'plural': 'bucks'},
+            'PTS': {'name': 'point', 'plural': 'points', 'subunit_factor': 1},
+        })
+        self.assertEqual(acme.convert(2.5, to='currency', currency='USD'), "two bucks and fifty cents")
+        self.assertEqual(num2words(3, to='currency', currency='PTS', overlay=acme), "three points")
+        self.assertEqual(num2words(2, lang='english', to='currency'), "two dollars")
+        with self.assertRaises(ValueError):
+            num2words(3, to='currency', currency='PTS')
+
+    def test_separator_overrides(self):
+        """Test words and separators, alone and with a style."""
+        tenant = LanguageOverlay('en', number_separator=' ', negative_prefix='minus')
+        self.assertEqual(tenant.convert(-21), "minus twenty one")
+        self.assertEqual(num2words(-1021, overlay=tenant, style='british+upper'),
+                         "MINUS ONE THOUSAND AND TWENTY ONE")
+        self.assertEqual(tenant.convert_batch([21, 21, 22], to='ordinal'),
+                         ["twenty first", "twenty first", "twenty second"])
+        arabic = LanguageOverlay('ar', negative_prefix='ناقص')
+        self.assertEqual(arabic.convert(-3), "ناقص " + num2words(3, lang='ar'))
+
+    def test_shares_untouched_tables(self):
+        """Test only the tables read from overridden options are rebuilt."""
+        renamed_overlay = LanguageOverlay('en', currencies={'USD': {'name': 'buck'}})
+        base = NumberConverter._converters['en']
+        renamed = renamed_overlay.converter_for(base)
+        self.assertIs(renamed._cardinal_words, base._cardinal_words)
+        self.assertIs(renamed.currencies['EUR'], base.currencies['EUR'])
+        spaced = LanguageOverlay('en', scale_separator='_').converter_for(base)
+        self.assertIs(spaced._cardinal_words, base._cardinal_words)
+        self.assertIsNot(spaced._scale_suffixes, base._scale_suffixes)
+        self.assertEqual(num2words(2000, overlay=LanguageOverlay('en', scale_separator='_')), "two_thousand")
+
+    def test_compiled_renderer(self):
+        """Test compiled renderers read the overlay's tables."""
+        acme = LanguageOverlay('en', currencies={'USD': {'name': 'buck', 'plural': 'bucks'}},
+                               number_separator=' ')
+        render = compile_renderer('en', 'currency', currency='USD', overlay=acme)
+        for number in (1, 21, 1021, 10 ** 9 + 5):
+            self.assertEqual(render(number), acme.convert(number, to='currency', currency='USD'))
+
+    def test_rebuilt_after_changes(self):
+        """Test overlays follow reloads and newly registered currencies."""
+        NumberConverter._initialize_converters()
+        registered = dict(NumberConverter._converters['en']._registered_currencies.get('english', {}))
+        supported = dict(Settings.SUPPORTED_CURRENCIES)
+
+        def restore():
+            NumberConverter._converters['en']._registered_currencies['english'] = registered
+            Settings.SUPPORTED_CURRENCIES.clear()
+            Settings.SUPPORTED_CURRENCIES.update(supported)
+            NumberConverter.reload(force=True)
+        self.addCleanup(restore)
+
+        acme = LanguageOverlay('en', currencies={'USD': {'name': 'buck', 'plural': 'bucks'}})
+        register_currency('CRD', 'en', name='credit', plural='credits', subunit_factor=1)
+        self.assertEqual(acme.convert(2, to='currency', currency='CRD'), "two credits")
+        NumberConverter.reload(['en'], force=True)
+        self.assertEqual(acme.convert(2, to='currency', currency='USD'), "two bucks")
+
+    def test_invalid_overlays(self):
+        """Test invalid overrides and mismatched languages are rejected."""
+        with self.assertRaises(ValueError):
+            LanguageOverlay('en', ones='x')
+        with self.assertRaises(ValueError):
+            LanguageOverlay('en', currencies={'NEW': {'plural': 'news'}})
+        with self.assertRaises(ValueError):
+            num2words(1, lang='ar', overlay=LanguageOverlay('en'))
+
+
+if __name__ == '__main__':
+    unittest.main()
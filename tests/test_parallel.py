@@ -0,0 +1,73 @@
+"""Tests for multi-core conversion of huge integers."""
+
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from numwordify import InputLimitError, LanguageOverlay
+from numwordify.config.settings import Settings
+from numwordify.converter import NumberConverter
+from numwordify.parallel import decimal_digits, parallel_words
+
+
+class TestParallelWords(unittest.TestCase):
+    """Test segmented rendering against _to_cardinal."""
+
+    @classmethod
+    def setUpClass(cls):
+        NumberConverter._initialize_converters()
+        cls.english = NumberConverter._converters['en']
+        cls.arabic = NumberConverter._converters['ar']
+        rng = random.Random(11)
+        cls.numbers = [0, 7, 1000, 10 ** 40, 10 ** 40 + 21]
+        cls.numbers += [rng.randrange(10 ** rng.randrange(1, 2000)) for _ in range(20)]
+
+    def test_matches_to_cardinal(self):
+        """Test runs rendered separately join into the serial words."""
+        with ThreadPoolExecutor(3) as executor:
+            for number in self.numbers:
+                self.assertEqual(parallel_words(number, executor=executor),
+                                 self.english._to_cardinal(number))
+                self.assertEqual(parallel_words(number, 'ar', executor=executor, gender='f'),
+                                 self.arabic._to_cardinal(number, 'f'))
+                self.assertEqual(parallel_words(str(number), executor=executor, style='british'),
+                                 parallel_words(number, workers=1, style='british'))
+        self.assertEqual(parallel_words('-0001_021'), "negative one thousand twenty-one")
+
+    def test_worker_processes(self):
+        """Test runs rendered in worker processes, with an overlay."""
+        overlay = LanguageOverlay('en', number_separator=' ')
+        number = random.Random(5).randrange(10 ** 900)
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(parallel_words(-number, executor=executor, overlay=overlay),
+                             parallel_words(-number, workers=1, overlay=overlay))
+
+    def test_decimal_digits(self):
+        """Test the int to digits conversion beyond the direct range."""
+        number = random.Random(3).getrandbits(12000)
+        self.assertEqual(decimal_digits(number), str(number))
+        self.assertEqual(decimal_digits(10 ** 3000), '1' + '0' * 3000)
+
+    def test_invalid_input(self):
+        """Test invalid numbers and worker counts."""
+        for number in (1.5, True, '12x'):
+            with self.assertRaises((TypeError, ValueError)):
+                parallel_words(number)
+        with self.assertRaises(ValueError):
+            parallel_words(10, workers=0)
+
+    def test_limits(self):
+        """Test ints and digit strings are held to every limit alike."""
+        for name, value in (('MAX_DIGITS', 5), ('MAX_OUTPUT_LENGTH', 300), ('MAX_COST', 3)):
+            self.addCleanup(setattr, Settings, name, getattr(Settings, name))
+            setattr(Settings, name, value)
+            for number in (123456789, '123_456_789', '-123456789'):
+                with self.subTest(limit=name, number=number):
+                    with self.assertRaises(InputLimitError) as caught:
+                        parallel_words(number)
+                    self.assertEqual(caught.exception.limit, name)
+            self.assertEqual(parallel_words('00012'), "twelve")
+            setattr(Settings, name, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
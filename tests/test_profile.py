@@ -0,0 +1,60 @@
+"""Tests for the per-stage profiling command."""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from numwordify import profile
+
+
+class TestProfile(unittest.TestCase):
+    """Test stage attribution and the command-line entry point."""
+    
+    def test_stage_breakdown(self):
+        """Test that conversion time is attributed to the known stages."""
+        numbers = profile.representative_workload(200)
+        result = profile.profile_conversions(numbers, lang='en', to='currency', currency='USD')
+        stages = result['stages']
+        for stage in profile.STAGES:
+            self.assertIn(stage, stages)
+        self.assertGreater(stages['validation'], 0)
+        self.assertGreater(stages['chunk decomposition'], 0)
+        self.assertGreater(stages['currency names'], 0)
+        self.assertGreater(stages['string assembly'], 0)
+        self.assertEqual(result['allocations']['calls'], 200)
+    
+    def test_arabic_scale_words(self):
+        """Test that Arabic scale-word selection is reported."""
+        result = profile.profile_conversions([1234567, 2000, 35000], lang='ar')
+        self.assertGreater(result['stages']['scale words'], 0)
+    
+    def test_main_with_workload_file(self):
+        """Test the CLI with a user-supplied workload and pstats output."""
+        with tempfile.TemporaryDirectory() as tmp:
+            workload = os.path.join(tmp, 'numbers.txt')
+            with open(workload, 'w', encoding='utf-8') as f:
+                f.write("# amounts\n42\n1234.5\n\n-7\n")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                code = profile.main([
+                    '--workload', workload, '--lang', 'en', '--to', 'cardinal',
+                    '--pstats', os.path.join(tmp, 'out.prof'), '--top', '3',
+                ])
+            self.assertEqual(code, 0)
+            self.assertIn('lang=en to=cardinal', output.getvalue())
+            self.assertIn('chunk decomposition', output.getvalue())
+            self.assertTrue(os.path.exists(os.path.join(tmp, 'out.en.cardinal.prof')))
+    
+    def test_main_batch_memory(self):
+        """Test the CLI reports batch peak memory."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = profile.main(['--lang', 'ar', '--to', 'cardinal', '--size', '50', '--batch', '500'])
+        self.assertEqual(code, 0)
+        self.assertIn('batch of 500: peak', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests for incremental range conversion."""
+
+import unittest
+from numwordify import iter_range, num2words
+
+
+class TestIterRange(unittest.TestCase):
+    """Test iter_range against num2words."""
+    
+    def assertRangeMatches(self, *args, **kwargs):
+        numbers = range(*args)
+        self.assertEqual(list(iter_range(*args, **kwargs)),
+                         [num2words(n, **kwargs) for n in numbers])
+    
+    def test_chunk_boundaries(self):
+        """Test ranges crossing thousand and million boundaries."""
+        self.assertRangeMatches(990, 1010)
+        self.assertRangeMatches(999990, 1001010)
+        self.assertRangeMatches(1999990, 2000010, lang='ar')
+        self.assertRangeMatches(10 ** 36 - 5, 10 ** 36 + 5, lang='ar', gender='f')
+    
+    def test_ordinals(self):
+        """Test English and Arabic ordinal ranges."""
+        self.assertRangeMatches(0, 2100, to='ordinal')
+        self.assertRangeMatches(0, 1100, lang='ar', to='ordinal')
+    
+    def test_steps_and_negatives(self):
+        """Test negative steps and ranges crossing zero."""
+        self.assertRangeMatches(-1500, 1500, 7)
+        self.assertRangeMatches(5000, -5000, -333, lang='ar', to='ordinal')
+        self.assertEqual(list(iter_range(3)), ["zero", "one", "two"])
+    
+    def test_grouping_systems(self):
+        """Test ranges in other grouping systems."""
+        self.assertRangeMatches(99990, 100010, grouping='indian')
+        self.assertRangeMatches(10 ** 7 - 5, 10 ** 7 + 5, to='ordinal', grouping='indian')
+        self.assertRangeMatches(10 ** 9 - 5, 10 ** 9 + 5, grouping='long')
+    
+    def test_other_conversion_types(self):
+        """Test conversion types without a prefix cache."""
+        self.assertRangeMatches(0, 30, to='currency', currency='USD')
+        self.assertRangeMatches(95, 105, to='digits')
+    
+    def test_invalid_arguments(self):
+        """Test argument validation happens at call time."""
+        with self.assertRaises(ValueError):
+            iter_range(0, 10, 0)
+        with self.assertRaises(TypeError):
+            iter_range(0, 10.5)
+        with self.assertRaises(ValueError):
+            iter_range(0, 10, lang='fr')
+        with self.assertRaises(ValueError):
+            iter_range(0, 10, lang='ar', gender='x')
+
+
+if __name__ == '__main__':
+    unittest.main()
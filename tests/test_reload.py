@@ -0,0 +1,138 @@
+"""Tests for atomic reloading of language data."""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+from numwordify import num2words
+from numwordify.cache import ResultCache
+from numwordify.config.loader import ConfigLoader
+from numwordify.config.settings import Settings
+from numwordify.converter import NumberConverter
+from numwordify.reloader import LanguageDataWatcher
+
+
+class ReloadTestCase(unittest.TestCase):
+    """Point the English data at a temporary copy for each test."""
+    
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = Path(self.tmp) / 'english.json'
+        shutil.copy(Settings.ENGLISH_CONFIG, self.path)
+        patcher = mock.patch.object(Settings, 'ENGLISH_CONFIG', self.path)
+        patcher.start()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        # Runs after the patch is undone: go back to the packaged data
+        self.addCleanup(NumberConverter.reload, ['en'], True)
+        self.addCleanup(patcher.stop)
+        NumberConverter.reload(['en'])
+    
+    def edit(self, **changes):
+        with open(self.path, encoding='utf-8') as f:
+            config = json.load(f)
+        config.update(changes)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        # Make sure the change is visible even on coarse mtime filesystems
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+class TestReload(ReloadTestCase):
+    """Test NumberConverter.reload."""
+    
+    def test_reload_changed_file(self):
+        """Test a changed file is reloaded and an unchanged one is not."""
+        self.assertEqual(NumberConverter.reload(['en']), [])
+        version = ConfigLoader.version('en')
+        self.edit(zero='nought')
+        self.assertEqual(NumberConverter.reload(), ['english'])
+        self.assertEqual(num2words(0), 'nought')
+        self.assertEqual(num2words(0, lang='english'), 'nought')
+        self.assertEqual(ConfigLoader.version('en'), version + 1)
+        self.assertEqual(ConfigLoader.load_language_config('en')['zero'], 'nought')
+    
+    def test_invalidates_result_caches(self):
+        """Test result caches drop entries computed from old data."""
+        cache = ResultCache()
+        self.assertEqual(cache.convert(0), 'zero')
+        self.assertEqual(cache.convert_batch([0, 1]), ['zero', 'one'])
+        self.edit(zero='nought')
+        NumberConverter.reload(['en'])
+        self.assertEqual(cache.convert(0), 'nought')
+        self.assertEqual(cache.convert_batch([0, 1]), ['nought', 'one'])
+    
+    def test_invalid_data_keeps_current_converters(self):
+        """Test a broken file leaves the current data in place."""
+        converter = NumberConverter._converters['en']
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        with self.assertRaises(ValueError):
+            NumberConverter.reload(['en'], force=True)
+        self.assertIs(NumberConverter._converters['en'], converter)
+        self.assertEqual(num2words(0), 'zero')
+    
+    def test_conversions_during_reload(self):
+        """Test conversions on other threads keep working across reloads."""
+        errors = []
+        stop = threading.Event()
+        
+        def convert():
+            while not stop.is_set():
+                words = num2words(1234)
+                if words not in ('one thousand two hundred thirty-four', 'one thousand two hundred thirty-FOUR'):
+                    errors.append(words)
+        
+        thread = threading.Thread(target=convert)
+        thread.start()
+        try:
+            ones = list(ConfigLoader.load_language_config('en')['ones'])
+            for i in range(20):
+                ones[4] = 'FOUR' if i % 2 == 0 else 'four'
+                self.edit(ones=ones)
+                NumberConverter.reload(['en'])
+        finally:
+            stop.set()
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+class TestLanguageDataWatcher(ReloadTestCase):
+    """Test the polling watcher."""
+    
+    def test_check(self):
+        """Test check reloads changed data and reports errors."""
+        reloaded = []
+        errors = []
+        watcher = LanguageDataWatcher(languages=['en'], on_reload=reloaded.append, on_error=errors.append)
+        self.assertEqual(watcher.check(), [])
+        self.edit(zero='nil')
+        self.assertEqual(watcher.check(), ['english'])
+        self.assertEqual(reloaded, [['english']])
+        self.assertEqual(num2words(0), 'nil')
+        
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('')
+        os.utime(self.path, ns=(mtime, mtime + 10 ** 9))
+        self.assertEqual(watcher.check(), [])
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(num2words(0), 'nil')
+    
+    def test_background_thread(self):
+        """Test the watcher thread picks up a change."""
+        done = threading.Event()
+        with LanguageDataWatcher(interval=0.01, languages=['en'], on_reload=lambda names: done.set()):
+            self.edit(zero='zilch')
+            self.assertTrue(done.wait(5))
+        self.assertEqual(num2words(0), 'zilch')
+        with self.assertRaises(ValueError):
+            LanguageDataWatcher(interval=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+"""Tests for the ASGI conversion service."""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from numwordify import LanguageOverlay, num2words
+from numwordify.cache import ResultCache
+from numwordify.config.settings import Settings
+from numwordify.server import create_app
+
+
+def call(app, method, path, body=b'', query=b'', chunks=None):
+    """Drive an ASGI app in-process and return (status, headers, body)."""
+    messages = [{'type': 'http.request', 'body': chunk, 'more_body': True}
+                for chunk in (chunks or [])]
+    messages.append({'type': 'http.request', 'body': body, 'more_body': False})
+    sent = []
+    
+    async def receive():
+        return messages.pop(0)
+    
+    async def send(message):
+        sent.append(message)
+    
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query}
+    asyncio.run(app(scope, receive, send))
+    start = sent[0]
+    payload = b''.join(message.get('body', b'') for message in sent[1:])
+    return start['status'], dict(start['headers']), payload
+
+
+class TestResultCache(unittest.TestCase):
+    """Test the LRU result cache."""
+    
+    def test_hits_and_eviction(self):
+        """Test that hits are counted and the least recent entry is evicted."""
+        cache = ResultCache(maxsize=2)
+        self.assertEqual(cache.convert(1), "one")
+        self.assertEqual(cache.convert(1), "one")
+        cache.convert(2)
+        cache.convert(3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertNotIn(ResultCache.make_key(1), cache._data)
+    
+    def test_batch_matches_num2words(self):
+        """Test that batch results equal num2words and fill the cache."""
+        cache = ResultCache()
+        numbers = [5, 5.5, 5, float('nan'), -7]
+        expected = [num2words(n, lang='ar', gender='f') for n in numbers]
+        self.assertEqual(cache.convert_batch(numbers, lang='ar', gender='f'), expected)
+        self.assertEqual(cache.convert_batch(numbers, lang='ar', gender='f'), expected)
+        self.assertEqual(len(cache), 3)
+    
+    def test_type_is_part_of_key(self):
+        """Test that 1 and 1.0 are cached separately."""
+        self.assertNotEqual(ResultCache.make_key(1), ResultCache.make_key(1.0))
+    
+    def test_snapshot_round_trip(self):
+        """Test saved results load into a new cache with their keys intact."""
+        cache = ResultCache()
+        cache.convert_batch(range(50))
+        cache.convert_batch([1.5, Decimal('2.25'), True], lang='ar', gender='f')
+        cache.convert(3, to='currency', currency='EUR', minor_units=True)
+        cache.convert(4, overlay=LanguageOverlay('en', negative_prefix='minus'))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.json.gz')
+            self.assertEqual(cache.save(path), 54)
+            loaded = ResultCache(maxsize=20)
+            loaded.convert(7)
+            # One of the 20 newest saved results is evicted for the cached 7
+            self.assertEqual(loaded.load(path), 19)
+            self.assertEqual(loaded.load(path), 0)
+        self.assertEqual(len(loaded), 20)
+        self.assertIn(ResultCache.make_key(7), loaded._data)
+        key = ResultCache.make_key(3, to='currency', currency='EUR', minor_units=True)
+        self.assertEqual(loaded._data[key], cache._data[key])
+        self.assertEqual(loaded.convert(Decimal('2.25'), lang='ar', gender='f'),
+                         num2words(Decimal('2.25'), lang='ar', gender='f'))
+        self.assertEqual(loaded.stats()['hits'], 1)
+    
+    def test_snapshot_validation(self):
+        """Test snapshots from other data are ignored and damaged ones rejected."""
+        cache = ResultCache()
+        cache.convert_batch(range(10))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.json.gz')
+            cache.save(path)
+            self.addCleanup(setattr, Settings, 'MAX_DECIMAL_DIGITS', Settings.MAX_DECIMAL_DIGITS)
+            Settings.MAX_DECIMAL_DIGITS += 1
+            self.assertEqual(ResultCache().load(path), 0)
+            with open(path, 'wb') as file:
+                file.write(b'not a snapshot')
+            with self.assertRaises(ValueError):
+                ResultCache().load(path)
+
+
+class TestServer(unittest.TestCase):
+    """Test the HTTP routes."""
+    
+    def setUp(self):
+        self.app = create_app(max_batch_size=100, stream_batch_size=2)
+    
+    def test_health(self):
+        """Test the health route."""
+        status, _, body = call(self.app, 'GET', '/health')
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['status'], 'ok')
+    
+    def test_lifespan_snapshot(self):
+        """Test the cache is loaded at startup and saved at shutdown."""
+        async def lifespan(app):
+            messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+            
+            async def receive():
+                return messages.pop(0)
+            
+            async def send(message):
+                pass
+            
+            await app({'type': 'lifespan'}, receive, send)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.json.gz')
+            first = create_app(snapshot=path)
+            first.cache.convert(42)
+            asyncio.run(lifespan(first))
+            second = create_app(snapshot=path)
+            asyncio.run(lifespan(second))
+        self.assertIn(ResultCache.make_key(42), second.cache._data)
+    
+    def test_batch(self):
+        """Test the JSON batch endpoint."""
+        request = {'numbers': [1, 2.5, 1000], 'lang': 'en', 'to': 'currency', 'currency': 'USD'}
+        status, _, body = call(self.app, 'POST', '/convert/batch', json.dumps(request).encode())
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['results'],
+                         [num2words(n, to='currency', currency='USD') for n in (1, 2.5, 1000)])
+    
+    def test_batch_errors(self):
+        """Test validation errors and the batch size limit."""
+        status, _, body = call(self.app, 'POST', '/convert/batch', b'{"numbers": [1], "lang": "fr"}')
+        self.assertEqual(status, 400)
+        self.assertIn('Unsupported language', json.loads(body)['error'])
+        status, _, _ = call(self.app, 'POST', '/convert/batch',
+                            json.dumps({'numbers': list(range(101))}).encode())
+        self.assertEqual(status, 413)
+        status, _, _ = call(self.app, 'POST', '/convert/batch', b'not json')
+        self.assertEqual(status, 400)
+    
+    def test_single(self):
+        """Test the single conversion endpoint."""
+        status, _, body = call(self.app, 'POST', '/convert', b'{"number": 42, "lang": "ar", "gender": "f"}')
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['result'], num2words(42, lang='ar', gender='f'))
+    
+    def test_stream(self):
+        """Test NDJSON streaming across body chunks, with per-line errors."""
+        status, headers, body = call(
+            self.app, 'POST', '/convert/stream', query=b'lang=ar',
+            chunks=[b'1\n2', b'1\n{"number": 3, "lang": "en"}\n"x"\n'], body=b'4')
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-type'], b'application/x-ndjson; charset=utf-8')
+        lines = [json.loads(line) for line in body.decode('utf-8').splitlines()]
+        self.assertEqual(lines[:3], [{'result': num2words(n, lang='ar')} for n in (1, 21)] + [{'result': 'three'}])
+        self.assertIn('error', lines[3])
+        self.assertEqual(lines[4], {'result': num2words(4, lang='ar')})
+    
+    def test_invalid_fields(self):
+        """Test mistyped and unknown fields are answered with 400 or a line error."""
+        for request in ({'number': 1, 'lang': 5}, {'number': 1, 'to': None},
+                        {'number': 1, 'currency': ['x']}, {'number': 1, 'gendr': 'f'}):
+            status, _, body = call(self.app, 'POST', '/convert', json.dumps(request).encode())
+            self.assertEqual(status, 400)
+            self.assertIn('error', json.loads(body))
+            batch = dict(request, numbers=[1])
+            del batch['number']
+            self.assertEqual(call(self.app, 'POST', '/convert/batch', json.dumps(batch).encode())[0], 400)
+        status, _, body = call(self.app, 'POST', '/convert/stream',
+                               body=b'{"number": 1, "lang": 5}\n{"number": 1, "currency": ["x"]}\n2\n')
+        self.assertEqual(status, 200)
+        lines = [json.loads(line) for line in body.decode('utf-8').splitlines()]
+        self.assertEqual([sorted(line) for line in lines[:2]], [['error'], ['error']])
+        self.assertEqual(lines[2], {'result': 'two'})
+        self.assertEqual(call(self.app, 'POST', '/convert/stream', query=b'colour=red', body=b'1')[0], 400)
+    
+    def test_library_options(self):
+        """Test style, grouping and minor_units reach the converter."""
+        request = {'number': 1021, 'style': 'british', 'grouping': 'long'}
+        status, _, body = call(self.app, 'POST', '/convert', json.dumps(request).encode())
+        self.assertEqual(json.loads(body)['result'], num2words(1021, style='british', grouping='long'))
+        status, _, body = call(self.app, 'POST', '/convert/stream',
+                               query=b'to=currency&currency=USD&minor_units=true', body=b'150')
+        self.assertEqual(json.loads(body), {'result': num2words(150, to='currency', currency='USD',
+                                                                minor_units=True)})
+    
+    def test_metrics_and_routing(self):
+        """Test metrics output and 404/405 answers."""
+        call(self.app, 'POST', '/convert/batch', b'{"numbers": [1, 1, 2]}')
+        status, _, body = call(self.app, 'GET', '/metrics')
+        self.assertEqual(status, 200)
+        self.assertIn('numwordify_numbers_converted_total 3', body.decode())
+        self.assertIn('numwordify_cache_size 2', body.decode())
+        self.assertEqual(call(self.app, 'GET', '/missing')[0], 404)
+        self.assertEqual(call(self.app, 'GET', '/convert/batch')[0], 405)
+
+
+if __name__ == '__main__':
+    unittest.main()
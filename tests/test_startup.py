@@ -0,0 +1,53 @@
+"""Tests for eager pre-fork initialization."""
+
+import gc
+import unittest
+import numwordify
+from numwordify.converter import NumberConverter
+
+
+class TestWarmup(unittest.TestCase):
+    """Test the warmup API."""
+    
+    def test_report(self):
+        """Test warmup initializes converters and reports its cost."""
+        report = numwordify.warmup(languages=['en', 'ar'], forms=['cardinal', 'currency'],
+                                   currencies=['USD', 'SAR'])
+        self.assertTrue(NumberConverter._initialized)
+        self.assertEqual(report['conversions'], 6)
+        self.assertGreaterEqual(report['seconds'], 0)
+        self.assertGreaterEqual(report['peak_bytes'], 0)
+        self.assertEqual(report['frozen_objects'], 0)
+    
+    def test_defaults_cover_everything(self):
+        """Test the defaults warm every language, form and currency."""
+        report = numwordify.warmup()
+        self.assertEqual(sorted(report['languages']), ['arabic', 'english'])
+        self.assertIn('digits', report['forms'])
+        self.assertGreater(report['conversions'], 20)
+    
+    def test_freeze(self):
+        """Test freeze moves the warmed state to the permanent generation."""
+        try:
+            report = numwordify.warmup(languages=['en'], freeze=True)
+            self.assertGreater(report['frozen_objects'], 0)
+        finally:
+            gc.unfreeze()
+    
+    def test_invalid_options(self):
+        """Test unsupported languages, forms and currencies are rejected."""
+        with self.assertRaises(ValueError):
+            numwordify.warmup(languages=['fr'])
+        with self.assertRaises(ValueError):
+            numwordify.warmup(forms=['roman'])
+        with self.assertRaises(ValueError):
+            numwordify.warmup(forms=['currency'], currencies=['XYZ'])
+    
+    def test_shared_converters(self):
+        """Test language codes and names share one converter."""
+        numwordify.warmup(languages=['en'])
+        self.assertIs(NumberConverter._converters['en'], NumberConverter._converters['english'])
+
+
+if __name__ == '__main__':
+    unittest.main()
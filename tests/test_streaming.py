@@ -0,0 +1,60 @@
+"""Tests for streaming conversion of enormous integers."""
+
+import io
+import random
+import unittest
+from numwordify import InputLimitError, num2words, stream_words
+from numwordify.config.settings import Settings
+
+
+class TestStreamWords(unittest.TestCase):
+    """Test streamed words against num2words."""
+
+    def assertStreams(self, number, lang='en', **kwargs):
+        expected = num2words(number, lang=lang, **kwargs)
+        digits = str(number)
+        for block_size in (1, 2, 4, 1000):
+            self.assertEqual(''.join(stream_words(digits, lang, block_size=block_size, **kwargs)),
+                             expected)
+
+    def test_matches_num2words(self):
+        """Test random numbers and boundaries in both languages, split anywhere."""
+        rng = random.Random(7)
+        numbers = [0, 7, 1000, 1002, 10 ** 6 + 21, 2 * 10 ** 9, 10 ** 45 + 3, -1021]
+        numbers += [rng.randrange(10 ** rng.randrange(1, 60)) for _ in range(40)]
+        for number in numbers:
+            self.assertStreams(number)
+            self.assertStreams(number, 'ar')
+            self.assertStreams(number, 'ar', gender='f')
+            self.assertStreams(number, style='british')
+            self.assertStreams(number, grouping='long')
+
+    def test_sources(self):
+        """Test files, binary chunks and iterators, with separators and leading zeros."""
+        self.assertEqual(''.join(stream_words(io.StringIO("1 000 021\n"))), "one million twenty-one")
+        self.assertEqual(''.join(stream_words(iter([b'-00', b'21', b'_000']))), num2words(-21000))
+        arabic = '١٢٣'.encode('utf-8')
+        self.assertEqual(''.join(stream_words([arabic[:1], arabic[1:]], 'ar')), num2words(123, lang='ar'))
+        self.assertEqual(''.join(stream_words('000', 'ar')), num2words(0, lang='ar'))
+
+    def test_yields_incrementally(self):
+        """Test the words arrive one block at a time."""
+        pieces = list(stream_words('1' * 30, block_size=6))
+        self.assertEqual(len(pieces), 5)
+        self.assertEqual(''.join(pieces), num2words(int('1' * 30)))
+
+    def test_invalid_sources(self):
+        """Test invalid digits, empty sources, nested groupings and limits."""
+        for source in ('12a4', '', '-', '1-2', [3]):
+            with self.assertRaises((ValueError, TypeError)):
+                list(stream_words(source))
+        with self.assertRaises(ValueError):
+            stream_words('1', grouping='indian')
+        self.addCleanup(setattr, Settings, 'MAX_DIGITS', Settings.MAX_DIGITS)
+        Settings.MAX_DIGITS = 5
+        with self.assertRaises(InputLimitError):
+            list(stream_words('123456'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for output style profiles."""
+
+import unittest
+from numwordify import compile_renderer, convert_batch, iter_range, num2words
+from numwordify.converter import NumberConverter
+
+
+class TestStyles(unittest.TestCase):
+    """Test casing, separator and conjunction profiles."""
+
+    def test_casing(self):
+        """Test the casing profiles every language has."""
+        self.assertEqual(num2words(1021, style='upper'), "ONE THOUSAND TWENTY-ONE")
+        self.assertEqual(num2words(21, to='ordinal', style='title'), "Twenty-First")
+        self.assertEqual(num2words(2.5, lang='english', to='currency', style='upper'),
+                         "TWO DOLLARS AND FIFTY CENTS")
+        self.assertEqual(num2words(float('-inf'), style='upper'), "NEGATIVE INFINITY")
+        self.assertEqual(num2words(42, lang='ar', style='upper'), num2words(42, lang='ar'))
+
+    def test_british_conjunction(self):
+        """Test 'and' after hundreds and before a final chunk below 100."""
+        self.assertEqual(num2words(105, style='british'), "one hundred and five")
+        self.assertEqual(num2words(1005, style='british'), "one thousand and five")
+        self.assertEqual(num2words(1200, style='british'), "one thousand two hundred")
+        self.assertEqual(num2words(2000002, to='ordinal', style='british'),
+                         "two million and second")
+        self.assertEqual(num2words(1001, to='ordinal', style='british'), "one thousand and first")
+
+    def test_combined_profiles(self):
+        """Test profiles joined with '+' and language-defined profiles."""
+        self.assertEqual(num2words(121, style='british+title'), "One Hundred And Twenty-One")
+        self.assertEqual(num2words(121, style='spaced'), "one hundred twenty one")
+        self.assertEqual(num2words(1005, style='cheque'), "ONE THOUSAND AND FIVE")
+
+    def test_engines_agree(self):
+        """Test compiled renderers, batches and ranges use the styled tables."""
+        numbers = [0, 7, 105, 999, 1000, 1001, 1005, 21021, 10 ** 12 + 5, -1005]
+        for to in ('cardinal', 'ordinal', 'currency'):
+            expected = [num2words(n, to=to, style='cheque') for n in numbers]
+            render = compile_renderer('en', to, style='cheque')
+            self.assertEqual([render(n) for n in numbers], expected)
+            self.assertEqual(convert_batch(numbers, to=to, style='cheque'), expected)
+        self.assertEqual(list(iter_range(995, 1010, to='ordinal', style='british')),
+                         [num2words(n, to='ordinal', style='british') for n in range(995, 1010)])
+
+    def test_variants_built_once(self):
+        """Test a style variant is built once per converter."""
+        self.assertEqual(num2words(5, style='upper'), "FIVE")
+        converter = NumberConverter._converters['en']
+        self.assertIs(converter.styled('upper'), converter.styled('upper'))
+        self.assertEqual(num2words(5), "five")
+
+    def test_invalid_styles(self):
+        """Test unknown profiles are rejected."""
+        with self.assertRaises(ValueError):
+            num2words(1, style='gothic')
+        with self.assertRaises(ValueError):
+            num2words(1, lang='ar', style='british')
+        with self.assertRaises(ValueError):
+            compile_renderer('en', style='upper+gothic')
+
+
+if __name__ == '__main__':
+    unittest.main()
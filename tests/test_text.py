@@ -0,0 +1,71 @@
+"""Tests for the free-text number normalizer."""
+
+import io
+import unittest
+from decimal import Decimal
+from unittest import mock
+from numwordify import normalize_text, num2words
+from numwordify.text import TextNormalizer, iter_normalize, main
+
+
+class TestNormalizeText(unittest.TestCase):
+    """Test normalize_text in English and Arabic."""
+
+    def test_integers_and_decimals(self):
+        """Test plain, grouped, negative and decimal numbers."""
+        self.assertEqual(normalize_text("Room 12, floor -1."), "Room twelve, floor negative one.")
+        self.assertEqual(normalize_text("1,234,567 items"), f"{num2words(1234567)} items")
+        self.assertEqual(normalize_text("pi is 3.14"), f"pi is {num2words(Decimal('3.14'))}")
+        self.assertEqual(normalize_text("−7 degrees"), "negative seven degrees")
+
+    def test_currency_amounts(self):
+        """Test codes and symbols before or after an amount."""
+        self.assertEqual(normalize_text("USD 12.50"), "twelve dollars and fifty cents")
+        self.assertEqual(normalize_text("12.50 USD"), "twelve dollars and fifty cents")
+        self.assertEqual(normalize_text("-$3"), "negative three dollars")
+        self.assertEqual(normalize_text("USD 12", currencies=False), "USD twelve")
+        self.assertEqual(normalize_text("KWD 1.5", lang='ar'),
+                         num2words(Decimal('1.5'), lang='ar', to='currency', currency='KWD'))
+
+    def test_ordinals_and_leading_zeros(self):
+        """Test English ordinal suffixes and digit-by-digit codes."""
+        self.assertEqual(normalize_text("the 21st and 3rd"), "the twenty-first and third")
+        self.assertEqual(normalize_text("agent 007"), "agent zero zero seven")
+        self.assertEqual(normalize_text("3rd", lang='ar'), "3rd")
+
+    def test_arabic_digits(self):
+        """Test Arabic-Indic digits and separators."""
+        self.assertEqual(normalize_text("الطابق ٣", lang='ar'), "الطابق ثلاثة")
+        self.assertEqual(normalize_text("٣", lang='ar', gender='f'), "ثلاث")
+        self.assertEqual(normalize_text("١٬٠٠٠", lang='ar'), num2words(1000, lang='ar'))
+        self.assertEqual(normalize_text("١٢٫٥", lang='ar'), num2words(Decimal('12.5'), lang='ar'))
+
+    def test_left_unchanged(self):
+        """Test tokens that are not standalone numbers stay as they are."""
+        for text in ("v1.2.3", "abc123", "1,23", "1.5th", "9" * 400):
+            self.assertEqual(normalize_text(text), text)
+
+    def test_memoized(self):
+        """Test a repeated token is converted once."""
+        normalizer = TextNormalizer('en')
+        with mock.patch.object(normalizer, '_convert', wraps=normalizer._convert) as convert:
+            self.assertEqual(normalizer.normalize("5 and 5 and 5"), "five and five and five")
+        self.assertEqual(convert.call_count, 1)
+
+    def test_streaming(self):
+        """Test line-by-line normalization and the command line."""
+        lines = ["1 apple\n", "2 pears\n"]
+        self.assertEqual(list(iter_normalize(lines)), ["one apple\n", "two pears\n"])
+        output = io.StringIO()
+        with mock.patch('sys.stdin', io.StringIO(''.join(lines))):
+            self.assertEqual(main(['-'], output=output), 0)
+        self.assertEqual(output.getvalue(), "one apple\ntwo pears\n")
+
+    def test_invalid_language(self):
+        """Test an unsupported language fails up front."""
+        with self.assertRaises(ValueError):
+            normalize_text("1", lang='fr')
+
+
+if __name__ == '__main__':
+    unittest.main()